@@ -1,26 +1,41 @@
 """Authentication utilities for API endpoints."""
 
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import logging
 import os
 import random
 import secrets
 import threading
-from datetime import UTC, datetime, timedelta
+import time
+from collections import OrderedDict
 from types import MappingProxyType
 
-import jwt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 
-logger = __import__("logging").getLogger(__name__)
+# Optional fast JSON codec for JWT segments
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 # Auth event logging configuration
-# Mapping of log level names to logger methods - defined once at module level
-_LOG_METHODS = {
-    "DEBUG": logger.debug,
-    "INFO": logger.info,
-    "WARNING": logger.warning,
-    "ERROR": logger.error,
-    "CRITICAL": logger.critical,
+# Mapping of log level names to logging levels - defined once at module level
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
 }
 
 
@@ -65,6 +80,102 @@ def _parse_auth_log_level() -> str:
 _AUTH_ACCESS_SAMPLING_RATE = _parse_sampling_rate()
 _AUTH_ACCESS_LOG_LEVEL = _parse_auth_log_level()
 
+# Per-request access events duplicate the server's access log, so they are
+# only emitted when explicitly enabled
+_LOG_ACCESS_EVENTS = os.getenv("MEMORY_API_LOG_ACCESS", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+# Verified JWT payload cache defaults
+_DEFAULT_JWT_CACHE_TTL = 5.0  # seconds
+_DEFAULT_JWT_CACHE_MAX = 10000
+
+
+class _JWTPayloadCache:
+    """Bounded LRU cache of verified JWT payloads with per-entry expiry.
+
+    Entries are keyed by the SHA-256 digest of the token (never the raw
+    token) and expire at ``min(payload["exp"], verified_at + ttl)``, so an
+    expired token is never served from the cache. Only successfully
+    verified tokens are stored.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        """Initialize the payload cache.
+
+        Args:
+            ttl_seconds: Maximum lifetime of a cached payload; 0 disables caching
+            max_entries: Maximum number of cached payloads
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is active."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def make_key(token: str) -> bytes:
+        """Derive the cache key for a token."""
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> dict | None:
+        """Return a copy of the cached payload, or None if absent or expired.
+
+        The stored expiry already folds in the token's ``exp`` claim, so a
+        hit needs a single comparison and no claim re-validation.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return dict(payload)
+
+    def put(self, key: bytes, payload: dict) -> None:
+        """Store a verified payload, bounded by its own ``exp`` claim.
+
+        The payload must have passed ``_decode_hs256``, which guarantees a
+        numeric ``exp``.
+        """
+        now = time.time()
+        expires_at = min(now + self.ttl_seconds, payload["exp"])
+        if expires_at <= now:
+            return
+        with self._lock:
+            self._entries[key] = (dict(payload), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _digest_api_key(api_key: str) -> bytes:
+    """Hash an API key to a fixed-length digest for comparison.
+
+    Comparing fixed-length digests keeps verification time independent of
+    both the mismatch position and the length of the presented key.
+    """
+    return hashlib.blake2b(api_key.encode("utf-8"), digest_size=32).digest()
+
 
 class AuthConfig:
     """Configuration handler for authentication with environment fallback."""
@@ -77,7 +188,10 @@ class AuthConfig:
         """
         self._config = config or {}
         self._jwt_secret: str | None = None
+        self._jwt_secret_bytes: bytes | None = None
         self._api_key: str | None = None
+        self._api_key_digest: bytes | None = None
+        self._jwt_cache: _JWTPayloadCache | None = None
         self._lock = threading.Lock()
 
     def get(self, key: str, default=None):
@@ -109,6 +223,13 @@ class AuthConfig:
                     self._jwt_secret = secret
         return self._jwt_secret
 
+    @property
+    def jwt_secret_bytes(self) -> bytes:
+        """Get the JWT secret pre-encoded for signing and verification."""
+        if self._jwt_secret_bytes is None:
+            self._jwt_secret_bytes = self.jwt_secret.encode("utf-8")
+        return self._jwt_secret_bytes
+
     @property
     def api_key(self) -> str:
         """Get API key from configuration."""
@@ -124,6 +245,46 @@ class AuthConfig:
                     self._api_key = api_key
         return self._api_key
 
+    @property
+    def api_key_digest(self) -> bytes:
+        """Get the digest of the configured API key, computed once."""
+        if self._api_key_digest is None:
+            self._api_key_digest = _digest_api_key(self.api_key)
+        return self._api_key_digest
+
+    @property
+    def jwt_cache(self) -> _JWTPayloadCache:
+        """Get the verified JWT payload cache for this configuration.
+
+        Tuned via MEMORY_API_JWT_CACHE_TTL (seconds, 0 disables) and
+        MEMORY_API_JWT_CACHE_MAX (maximum entries).
+        """
+        if self._jwt_cache is None:
+            with self._lock:
+                if self._jwt_cache is None:
+                    self._jwt_cache = _JWTPayloadCache(
+                        self._get_non_negative(
+                            "MEMORY_API_JWT_CACHE_TTL", _DEFAULT_JWT_CACHE_TTL, float
+                        ),
+                        self._get_non_negative(
+                            "MEMORY_API_JWT_CACHE_MAX", _DEFAULT_JWT_CACHE_MAX, int
+                        ),
+                    )
+        return self._jwt_cache
+
+    def _get_non_negative(self, key: str, default, cast):
+        """Read a non-negative numeric setting, falling back to default."""
+        raw = self.get(key, default)
+        try:
+            value = cast(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid {key} '{raw}', using default {default}")
+            return default
+        if value < 0:
+            logger.warning(f"{key} {value} must be non-negative, using default {default}")
+            return default
+        return value
+
     @property
     def enable_auth(self) -> bool:
         """Get auth enabled flag from configuration."""
@@ -136,6 +297,9 @@ _default_config = AuthConfig()
 # Configuration constants
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
+_JWT_EXPIRATION_SECONDS = JWT_EXPIRATION_HOURS * 3600
+
+_JWT_REQUIRED_CLAIMS = ("exp", "iat", "user_id")
 
 # Security validation using default config
 if _default_config.enable_auth:
@@ -196,6 +360,17 @@ class UserRole:
     ADMIN = "admin"
 
 
+# Roles accepted by endpoints guarded by each required role; both admin and
+# read-only users can access read-only endpoints
+_ROLE_ALLOWS = {
+    UserRole.READ_ONLY: frozenset({UserRole.READ_ONLY, UserRole.ADMIN}),
+    UserRole.ADMIN: frozenset({UserRole.ADMIN}),
+}
+_ROLE_DENIED_DETAIL = {
+    UserRole.READ_ONLY: "Read-only or admin access required",
+    UserRole.ADMIN: "Admin access required",
+}
+
 # Anonymous user returned when authentication is disabled
 # Wrapped in MappingProxyType to prevent accidental mutation
 ANONYMOUS_USER = MappingProxyType(
@@ -208,6 +383,99 @@ ANONYMOUS_USER = MappingProxyType(
 )
 
 
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode without padding (RFC 7515)."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Base64url-decode, restoring stripped padding."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+if ORJSON_AVAILABLE:
+    # orjson emits compact UTF-8 bytes and parses bytes directly; its
+    # JSONDecodeError subclasses ValueError like the stdlib one
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+
+    def _json_dumps(obj: dict) -> bytes:
+        """Serialize a JWT segment as compact JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+# The header never changes for the fixed HS256 algorithm, so its encoded
+# segment is built once and compared byte-for-byte on the common path
+_JWT_HEADER_B64 = _b64url_encode(_json_dumps({"alg": JWT_ALGORITHM, "typ": "JWT"}))
+
+
+def _is_numeric_date(value) -> bool:
+    """Check that a claim is an RFC 7519 NumericDate."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _encode_hs256(payload: dict, secret: bytes) -> str:
+    """Sign a payload as an HS256 JWT."""
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url_encode(_json_dumps(payload))
+    signature = hmac.new(secret, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
+
+
+def _decode_hs256(token: str, secret: bytes) -> dict:
+    """Verify an HS256 JWT and return its payload.
+
+    Performs the checks PyJWT applied for this module: algorithm pinning,
+    constant-time signature comparison, required claims, and exp/iat/nbf
+    validation.
+
+    Raises:
+        AuthError: If the token is malformed, forged, expired, or missing
+            a required claim
+    """
+    try:
+        token_bytes = token.encode("ascii")
+        signing_input, _, signature_b64 = token_bytes.rpartition(b".")
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+        if not header_b64 or not payload_b64 or b"." in payload_b64:
+            raise AuthError("Invalid token")
+
+        if header_b64 != _JWT_HEADER_B64:
+            header = _json_loads(_b64url_decode(header_b64))
+            if not isinstance(header, dict) or header.get("alg") != JWT_ALGORITHM:
+                raise AuthError("Invalid token")
+
+        expected = hmac.new(secret, signing_input, hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+            raise AuthError("Invalid token")
+
+        payload = _json_loads(_b64url_decode(payload_b64))
+    except (AttributeError, UnicodeError, ValueError, binascii.Error) as e:
+        raise AuthError("Invalid token") from e
+
+    if not isinstance(payload, dict):
+        raise AuthError("Invalid token")
+    for claim in _JWT_REQUIRED_CLAIMS:
+        if claim not in payload:
+            raise AuthError("Invalid token")
+
+    now = time.time()
+    exp = payload["exp"]
+    if not _is_numeric_date(exp) or not _is_numeric_date(payload["iat"]):
+        raise AuthError("Invalid token")
+    if exp <= now:
+        raise AuthError("Token has expired")
+    if payload["iat"] > now:
+        raise AuthError("Invalid token")
+    nbf = payload.get("nbf")
+    if nbf is not None and (not _is_numeric_date(nbf) or nbf > now):
+        raise AuthError("Invalid token")
+
+    return payload
+
+
 def create_jwt_token(
     user_id: str, role: str = UserRole.READ_ONLY, config: AuthConfig | None = None
 ) -> str:
@@ -223,21 +491,25 @@ def create_jwt_token(
     """
     auth_config = config or _default_config
 
-    now = datetime.now(UTC)
-    expiration = now + timedelta(hours=JWT_EXPIRATION_HOURS)
+    # RFC 7519 NumericDate claims are plain epoch seconds
+    now = int(time.time())
     payload = {
         "user_id": user_id,
         "role": role,
-        "exp": expiration,
+        "exp": now + _JWT_EXPIRATION_SECONDS,
         "iat": now,
         "type": "access",
     }
-    return jwt.encode(payload, auth_config.jwt_secret, algorithm=JWT_ALGORITHM)
+    return _encode_hs256(payload, auth_config.jwt_secret_bytes)
 
 
 def verify_jwt_token(token: str, config: AuthConfig | None = None) -> dict:
     """Verify and decode a JWT token.
 
+    Successfully verified payloads are cached briefly per configuration
+    (see ``AuthConfig.jwt_cache``) so repeated requests bearing the same
+    token skip signature verification until the entry expires.
+
     Args:
         token: JWT token string
         config: Optional auth configuration (uses default if not provided)
@@ -246,17 +518,22 @@ def verify_jwt_token(token: str, config: AuthConfig | None = None) -> dict:
         Decoded token payload
 
     Raises:
-        AuthError: If token is invalid or expired
+        AuthError: If token is invalid, expired, or missing a required
+            claim (exp, iat, user_id)
     """
     auth_config = config or _default_config
+    cache = auth_config.jwt_cache
 
-    try:
-        payload = jwt.decode(token, auth_config.jwt_secret, algorithms=[JWT_ALGORITHM])
-        return payload
-    except jwt.ExpiredSignatureError as e:
-        raise AuthError("Token has expired") from e
-    except jwt.InvalidTokenError as e:
-        raise AuthError("Invalid token") from e
+    if cache.enabled:
+        cache_key = cache.make_key(token)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    payload = _decode_hs256(token, auth_config.jwt_secret_bytes)
+    if cache.enabled:
+        cache.put(cache_key, payload)
+    return payload
 
 
 def verify_api_key(api_key: str, config: AuthConfig | None = None) -> bool:
@@ -270,11 +547,17 @@ def verify_api_key(api_key: str, config: AuthConfig | None = None) -> bool:
         True if API key is valid, False otherwise
     """
     auth_config = config or _default_config
-    configured_key = auth_config.api_key
+
+    if not isinstance(api_key, str):
+        return False
 
     try:
-        return secrets.compare_digest(api_key, configured_key)
-    except (TypeError, AttributeError):
+        # Compare fixed-length digests of the UTF-8 bytes so the check is
+        # constant-time for any key, including non-ASCII ones
+        return hmac.compare_digest(
+            auth_config.api_key_digest, _digest_api_key(api_key)
+        )
+    except UnicodeEncodeError:
         # Handle encoding errors gracefully
         return False
 
@@ -304,7 +587,26 @@ async def get_current_user(
 
     # Get dynamic security schemes
     bearer_scheme = get_bearer_scheme()
+    token = None
+    if bearer_scheme and hasattr(credentials, "credentials"):
+        token = credentials.credentials
+
+    return authenticate_credentials(api_key, token)
+
+
+def authenticate_credentials(api_key: str | None, token: str | None) -> dict:
+    """Resolve the user for an API key or bearer token.
+
+    Args:
+        api_key: API key from the X-API-Key header
+        token: Bearer token from the Authorization header
+
+    Returns:
+        User information dictionary
 
+    Raises:
+        HTTPException: If neither credential is valid
+    """
     # Check API key first
     if api_key and verify_api_key(api_key):
         return {
@@ -314,12 +616,12 @@ async def get_current_user(
             "method": "api_key",
         }
 
-    # Check JWT token using dynamic scheme
-    if bearer_scheme and hasattr(credentials, "credentials"):
+    # Check JWT token
+    if token:
         try:
-            payload = verify_jwt_token(credentials.credentials)
+            payload = verify_jwt_token(token)
             return {
-                "user_id": payload.get("user_id", "unknown"),
+                "user_id": payload["user_id"],
                 "role": payload.get("role", UserRole.READ_ONLY),
                 "authenticated": True,
                 "method": "jwt",
@@ -339,6 +641,36 @@ async def get_current_user(
     )
 
 
+def authenticate_raw_headers(raw_headers: list[tuple[bytes, bytes]]) -> dict:
+    """Authenticate a request from its raw ASGI headers.
+
+    For middleware that runs before routing and so cannot use the FastAPI
+    security schemes. Header parsing matches APIKeyHeader and HTTPBearer.
+
+    Args:
+        raw_headers: ``scope["headers"]`` as (lowercase name, value) pairs
+
+    Returns:
+        User information dictionary
+
+    Raises:
+        HTTPException: If authentication is enabled and fails
+    """
+    if not _default_config.enable_auth:
+        return ANONYMOUS_USER
+
+    api_key = None
+    token = None
+    for name, value in raw_headers:
+        if name == b"x-api-key":
+            api_key = value.decode("latin-1")
+        elif name == b"authorization":
+            scheme, _, param = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer":
+                token = param.strip() or None
+    return authenticate_credentials(api_key, token)
+
+
 async def get_current_user_optional(
     request: Request,
     api_key: str | None = None,
@@ -373,27 +705,46 @@ def log_auth_event(event_type: str, user_id: str, details: str = "") -> None:
     - AUTH_ACCESS_SAMPLING_RATE: Fraction of access events to log (0.0-1.0, default 0.1)
     - AUTH_ACCESS_LOG_LEVEL: Log level for access events (DEBUG/INFO, default DEBUG)
 
+    The message is only formatted if the logger will emit it.
+
     Args:
         event_type: Type of event (login, logout, access, denied)
         user_id: User identifier
         details: Additional details
     """
-    message = f"Auth event: {event_type} - User: {user_id}"
-    if details:
-        message += f" - Details: {details}"
+    if event_type == "access":
+        level = _LOG_LEVELS.get(_AUTH_ACCESS_LOG_LEVEL, logging.DEBUG)
+    elif event_type == "login":
+        level = logging.INFO
+    else:
+        level = logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
 
     # Apply sampling to access events to prevent log flooding
-    if event_type == "access":
-        if random.random() >= _AUTH_ACCESS_SAMPLING_RATE:
-            return  # Skip logging this access event based on sampling rate
+    if event_type == "access" and random.random() >= _AUTH_ACCESS_SAMPLING_RATE:
+        return  # Skip logging this access event based on sampling rate
 
-        # Log at configured level using module-level mapping
-        log_method = _LOG_METHODS.get(_AUTH_ACCESS_LOG_LEVEL, logger.debug)
-        log_method(message)
-    elif event_type == "login":
-        logger.info(message)
+    if details:
+        logger.log(
+            level, "Auth event: %s - User: %s - Details: %s", event_type, user_id, details
+        )
     else:
-        logger.warning(message)
+        logger.log(level, "Auth event: %s - User: %s", event_type, user_id)
+
+
+def log_access_event(user: dict) -> None:
+    """Log a sampled access event for an authenticated request.
+
+    Disabled unless MEMORY_API_LOG_ACCESS is set to true.
+
+    Args:
+        user: User information dictionary
+    """
+    if _LOG_ACCESS_EVENTS:
+        log_auth_event(
+            "access", user.get("user_id", "unknown"), f"Role: {user.get('role')}"
+        )
 
 
 async def _extract_credentials(
@@ -432,9 +783,7 @@ async def get_current_user_dependency(request: Request) -> dict:
     """FastAPI dependency for getting current user."""
     api_key, credentials = await _extract_credentials(request)
     user = await get_current_user(request, api_key, credentials)
-    log_auth_event(
-        "access", user.get("user_id", "unknown"), f"Role: {user.get('role')}"
-    )
+    log_access_event(user)
     return user
 
 
@@ -443,35 +792,42 @@ async def get_current_user_optional_dependency(request: Request) -> dict | None:
     api_key, credentials = await _extract_credentials(request)
     user = await get_current_user_optional(request, api_key, credentials)
     if user:
-        log_auth_event(
-            "access", user.get("user_id", "unknown"), f"Role: {user.get('role')}"
-        )
+        log_access_event(user)
     return user
 
 
-# Role-based access dependencies
-async def get_read_only_user(
-    current_user: dict = Depends(get_current_user_dependency),
-) -> dict:
-    """Dependency for read-only access."""
-    user_role = current_user.get("role", UserRole.READ_ONLY)
+def require_role(user: dict, required_role: str) -> dict:
+    """Check that a user may access endpoints guarded by a role.
+
+    Args:
+        user: User information dictionary
+        required_role: UserRole.READ_ONLY or UserRole.ADMIN
 
-    # Both admin and read-only users can access read-only endpoints
-    if user_role in (UserRole.ADMIN, UserRole.READ_ONLY):
-        return current_user
+    Returns:
+        The user, unchanged
+
+    Raises:
+        HTTPException: If the user's role is insufficient
+    """
+    if user.get("role", UserRole.READ_ONLY) in _ROLE_ALLOWS[required_role]:
+        return user
 
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
-        detail="Read-only or admin access required",
+        detail=_ROLE_DENIED_DETAIL[required_role],
     )
 
 
+# Role-based access dependencies
+async def get_read_only_user(
+    current_user: dict = Depends(get_current_user_dependency),
+) -> dict:
+    """Dependency for read-only access."""
+    return require_role(current_user, UserRole.READ_ONLY)
+
+
 async def get_admin_user(
     current_user: dict = Depends(get_current_user_dependency),
 ) -> dict:
     """Dependency for admin access."""
-    if current_user.get("role") != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
-        )
-    return current_user
+    return require_role(current_user, UserRole.ADMIN)
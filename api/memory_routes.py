@@ -4,13 +4,16 @@ import logging
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 
 from api.auth import (
-    get_admin_user,
-    get_read_only_user,
+    UserRole,
+    authenticate_raw_headers,
+    log_access_event,
+    require_role,
 )
-from api.rate_limit import add_rate_limit_headers, check_rate_limit, get_client_ip
+from api.rate_limit import RateLimitResult, check_rate_limit
 from utils.memory_monitor import (
     MemoryMonitoringError,
     force_garbage_collection,
@@ -24,13 +27,92 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/memory", tags=["memory"])
 
+# (method, path) -> (rate limit type, required role) for every memory route.
+# Paths are relative to the prefix the router is mounted under.
+ROUTE_POLICIES: dict[tuple[str, str], tuple[str, str]] = {
+    ("GET", "/memory/stats"): ("read", UserRole.READ_ONLY),
+    ("POST", "/memory/gc"): ("admin", UserRole.ADMIN),
+    ("POST", "/memory/monitoring/start"): ("admin", UserRole.ADMIN),
+    ("POST", "/memory/monitoring/stop"): ("admin", UserRole.ADMIN),
+    ("GET", "/memory/monitoring/status"): ("read", UserRole.READ_ONLY),
+}
 
-def fetch_memory_stats_and_handle_errors(request: Request, response: Response) -> dict[str, Any]:
+
+class AuthRateLimitMiddleware:
+    """ASGI middleware that authenticates and rate limits memory routes.
+
+    Runs before routing, so the endpoints do not resolve per-request auth
+    dependencies. Matching requests have their user and RateLimitResult
+    stored in ``request.state``; failures are answered directly with the
+    same JSON error body FastAPI's HTTPException handler produces.
+    """
+
+    def __init__(self, app, prefix: str = ""):
+        """Initialize the middleware.
+
+        Args:
+            app: Downstream ASGI application
+            prefix: Path prefix the memory router is mounted under
+        """
+        self.app = app
+        self._policies = {
+            (method, prefix + path): policy
+            for (method, path), policy in ROUTE_POLICIES.items()
+        }
+
+    async def __call__(self, scope, receive, send):
+        """Handle an ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self._policies.get((scope["method"], scope["path"]))
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        limit_type, required_role = policy
+        try:
+            user = authenticate_raw_headers(scope["headers"])
+            log_access_event(user)
+            require_role(user, required_role)
+            limit_result = check_rate_limit(Request(scope), limit_type)
+        except HTTPException as exc:
+            response = JSONResponse(
+                {"detail": exc.detail},
+                status_code=exc.status_code,
+                headers=exc.headers,
+            )
+            await response(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        state["user"] = user
+        state["rate_limit"] = limit_result
+        await self.app(scope, receive, send)
+
+
+def _get_limit_result(request: Request) -> RateLimitResult:
+    """Return the rate limit state recorded by AuthRateLimitMiddleware."""
+    limit_result = getattr(request.state, "rate_limit", None)
+    if limit_result is None:
+        # Fail closed if the router is mounted without the middleware
+        logger.error("AuthRateLimitMiddleware is not installed for memory routes")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+    return limit_result
+
+
+def fetch_memory_stats_and_handle_errors(
+    response: Response, limit_result: RateLimitResult
+) -> dict[str, Any]:
     """Fetch memory statistics and handle potential errors.
 
     Args:
-        request: The FastAPI request object
         response: The FastAPI response object
+        limit_result: Rate limit state from check_rate_limit
 
     Returns:
         Dictionary containing memory statistics or error details
@@ -39,8 +121,7 @@ def fetch_memory_stats_and_handle_errors(request: Request, response: Response) -
         stats = get_memory_stats()
 
         # Add rate limit headers
-        client_ip = get_client_ip(request)
-        add_rate_limit_headers(response, "read", client_ip)
+        limit_result.apply(response)
 
         return {
             "success": True,
@@ -69,12 +150,14 @@ def fetch_memory_stats_and_handle_errors(request: Request, response: Response) -
         }
 
 
-def get_monitoring_status_and_handle_errors(request: Request, response: Response) -> dict[str, Any]:
+def get_monitoring_status_and_handle_errors(
+    response: Response, limit_result: RateLimitResult
+) -> dict[str, Any]:
     """Fetch memory monitoring status and handle potential errors.
 
     Args:
-        request: The FastAPI request object
         response: The FastAPI response object
+        limit_result: Rate limit state from check_rate_limit
 
     Returns:
         Dictionary containing monitoring status or error details
@@ -83,8 +166,7 @@ def get_monitoring_status_and_handle_errors(request: Request, response: Response
         monitor = get_memory_monitor()
 
         # Add rate limit headers
-        client_ip = get_client_ip(request)
-        add_rate_limit_headers(response, "read", client_ip)
+        limit_result.apply(response)
 
         # Get current stats using public method
         current_stats = monitor.get_current_stats()
@@ -126,30 +208,25 @@ def get_monitoring_status_and_handle_errors(request: Request, response: Response
 async def get_memory_statistics(
     request: Request,
     response: Response,
-    current_user: dict = Depends(get_read_only_user)
 ) -> dict[str, Any]:
     """Get current memory usage statistics."""
-    # Check rate limit
-    check_rate_limit(request, "read")
-    return fetch_memory_stats_and_handle_errors(request, response)
+    limit_result = _get_limit_result(request)
+    return fetch_memory_stats_and_handle_errors(response, limit_result)
 
 
 @router.post("/gc")
 async def force_garbage_collection_endpoint(
     request: Request,
     response: Response,
-    current_user: dict = Depends(get_admin_user)
 ) -> dict[str, Any]:
     """Force garbage collection and return results."""
-    # Check rate limit
-    check_rate_limit(request, "admin")
+    limit_result = _get_limit_result(request)
 
     try:
         result = force_garbage_collection()
 
         # Add rate limit headers
-        client_ip = get_client_ip(request)
-        add_rate_limit_headers(response, "admin", client_ip)
+        limit_result.apply(response)
 
         return {
             "success": True,
@@ -172,20 +249,17 @@ async def force_garbage_collection_endpoint(
 async def start_memory_monitoring_endpoint(
     request: Request,
     response: Response,
-    current_user: dict = Depends(get_admin_user),
     check_interval: float = 60.0,
     alert_threshold_mb: float = 100.0
 ) -> dict[str, Any]:
     """Start memory monitoring with specified parameters."""
-    # Check rate limit
-    check_rate_limit(request, "admin")
+    limit_result = _get_limit_result(request)
 
     try:
         start_memory_monitoring(check_interval, alert_threshold_mb)
 
         # Add rate limit headers
-        client_ip = get_client_ip(request)
-        add_rate_limit_headers(response, "admin", client_ip)
+        limit_result.apply(response)
 
         return {
             "success": True,
@@ -211,18 +285,15 @@ async def start_memory_monitoring_endpoint(
 async def stop_memory_monitoring_endpoint(
     request: Request,
     response: Response,
-    current_user: dict = Depends(get_admin_user)
 ) -> dict[str, Any]:
     """Stop memory monitoring."""
-    # Check rate limit
-    check_rate_limit(request, "admin")
+    limit_result = _get_limit_result(request)
 
     try:
         stop_memory_monitoring()
 
         # Add rate limit headers
-        client_ip = get_client_ip(request)
-        add_rate_limit_headers(response, "admin", client_ip)
+        limit_result.apply(response)
 
         return {
             "success": True,
@@ -244,9 +315,7 @@ async def stop_memory_monitoring_endpoint(
 async def get_monitoring_status(
     request: Request,
     response: Response,
-    current_user: dict = Depends(get_read_only_user)
 ) -> dict[str, Any]:
     """Get current memory monitoring status."""
-    # Check rate limit
-    check_rate_limit(request, "read")
-    return get_monitoring_status_and_handle_errors(request, response)
+    limit_result = _get_limit_result(request)
+    return get_monitoring_status_and_handle_errors(response, limit_result)
@@ -7,9 +7,21 @@ import logging
 import os
 import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 
+import numpy as np
 from fastapi import HTTPException, Request, Response, status
 
+# Optional JIT compilation of the bucket arithmetic
+try:
+    import numba  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None  # type: ignore
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +48,10 @@ TRUSTED_PROXIES = (
 )
 
 
+# Upper bound on tracked (client, limit) buckets before LRU eviction
+MAX_TRACKED_BUCKETS = int(os.getenv("MEMORY_API_RATE_LIMIT_MAX_BUCKETS", "50000"))
+
+
 class TokenBucket:
     """Token bucket rate limiter."""
 
@@ -49,7 +65,8 @@ class TokenBucket:
         self.max_tokens = max_tokens
         self.refill_rate = refill_rate
         self.tokens = max_tokens
-        self.last_refill = time.time()
+        # Monotonic clock so wall-clock adjustments cannot skew refills
+        self.last_refill = time.monotonic()
         self._lock = threading.Lock()
 
     def consume(self, tokens: float = 1.0) -> bool:
@@ -62,7 +79,7 @@ class TokenBucket:
             True if tokens were consumed, False if insufficient tokens
         """
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             # Refill tokens based on time elapsed
             time_passed = now - self.last_refill
             tokens_to_add = time_passed * self.refill_rate
@@ -92,24 +109,214 @@ class TokenBucket:
             return tokens_needed / self.refill_rate
 
 
+def _consume_slot(
+    tokens: np.ndarray,
+    last_refill: np.ndarray,
+    slot: int,
+    now: float,
+    max_tokens: float,
+    refill_rate: float,
+    requested: float,
+) -> tuple[bool, float]:
+    """Refill and consume from one pooled bucket in place.
+
+    Args:
+        tokens: Token counts for all slots
+        last_refill: Last refill times for all slots (time.monotonic())
+        slot: Slot to update
+        now: Current time.monotonic() value
+        max_tokens: Bucket capacity
+        refill_rate: Tokens per second refill rate
+        requested: Number of tokens to consume
+
+    Returns:
+        Tuple of (allowed, retry_after_seconds)
+    """
+    available = tokens[slot] + (now - last_refill[slot]) * refill_rate
+    if available > max_tokens:
+        available = max_tokens
+    last_refill[slot] = now
+    if available >= requested:
+        tokens[slot] = available - requested
+        return True, 0.0
+    tokens[slot] = available
+    return False, (requested - available) / refill_rate
+
+
+if NUMBA_AVAILABLE:
+    # Compile eagerly for the pool's exact types so the first request does
+    # not pay JIT latency; cache=True reuses the machine code across runs
+    _consume_slot = numba.njit(
+        numba.types.Tuple((numba.boolean, numba.float64))(
+            numba.float64[:],
+            numba.float64[:],
+            numba.int64,
+            numba.float64,
+            numba.float64,
+            numba.float64,
+            numba.float64,
+        ),
+        cache=True,
+    )(_consume_slot)
+
+
+class _BucketPool:
+    """One shard of pooled token buckets.
+
+    Bucket state is kept column-wise in NumPy arrays, one slot per
+    (client, limit) pair, rather than as one TokenBucket object per client.
+    Slots are tracked in least-recently-used order and reclaimed lazily when
+    new buckets are inserted, so no background thread has to sweep the pool.
+    Refill times use time.monotonic(); only response headers use wall time.
+    """
+
+    INITIAL_CAPACITY = 64
+    IDLE_EXPIRY_SECONDS = 600  # Remove buckets unused for 10 minutes
+    EVICTIONS_PER_INSERT = 8  # Bound the lazy idle sweep done per insert
+
+    def __init__(self, max_buckets: int):
+        """Initialize an empty pool.
+
+        Args:
+            max_buckets: Maximum number of buckets kept before the least
+                recently used one is evicted
+        """
+        capacity = min(self.INITIAL_CAPACITY, max_buckets)
+        self.max_buckets = max_buckets
+        self.slots: OrderedDict[str, int] = OrderedDict()
+        self._free_slots: list[int] = list(range(capacity - 1, -1, -1))
+        self._tokens = np.zeros(capacity)
+        self._last_refill = np.zeros(capacity)
+        self.lock = threading.Lock()
+
+    def _grow(self) -> None:
+        """Double pool capacity up to max_buckets. Caller must hold self.lock."""
+        old_capacity = len(self._tokens)
+        new_capacity = min(old_capacity * 2, self.max_buckets)
+        pad = new_capacity - old_capacity
+        self._tokens = np.concatenate((self._tokens, np.zeros(pad)))
+        self._last_refill = np.concatenate((self._last_refill, np.zeros(pad)))
+        self._free_slots.extend(range(new_capacity - 1, old_capacity - 1, -1))
+
+    def _evict_oldest(self) -> None:
+        """Release the least recently used slot. Caller must hold self.lock."""
+        _, slot = self.slots.popitem(last=False)
+        self._free_slots.append(slot)
+
+    def _evict_idle(self, now: float) -> None:
+        """Release a few idle slots from the LRU end. Caller must hold self.lock."""
+        for _ in range(self.EVICTIONS_PER_INSERT):
+            if not self.slots:
+                return
+            slot = next(iter(self.slots.values()))
+            if now - self._last_refill.item(slot) <= self.IDLE_EXPIRY_SECONDS:
+                return
+            self._evict_oldest()
+
+    def _get_slot(self, bucket_key: str, max_tokens: float, now: float) -> int:
+        """Get or allocate the slot for a bucket. Caller must hold self.lock."""
+        slot = self.slots.get(bucket_key)
+        if slot is not None:
+            self.slots.move_to_end(bucket_key)
+            return slot
+
+        self._evict_idle(now)
+        if not self._free_slots:
+            if len(self._tokens) < self.max_buckets:
+                self._grow()
+            else:
+                self._evict_oldest()
+        slot = self._free_slots.pop()
+        self.slots[bucket_key] = slot
+        self._tokens[slot] = max_tokens
+        self._last_refill[slot] = now
+        return slot
+
+    def state(
+        self, bucket_key: str, max_tokens: float, refill_rate: float
+    ) -> tuple[float, float]:
+        """Return (available_tokens, seconds_until_one_token) for a bucket."""
+        with self.lock:
+            now = time.monotonic()
+            slot = self._get_slot(bucket_key, max_tokens, now)
+            elapsed = now - self._last_refill.item(slot)
+            available = min(max_tokens, self._tokens.item(slot) + elapsed * refill_rate)
+        if available >= 1.0:
+            return available, 0.0
+        return available, (1.0 - available) / refill_rate
+
+    def consume(
+        self, bucket_key: str, max_tokens: float, refill_rate: float, tokens: float
+    ) -> tuple[bool, float, float]:
+        """Consume tokens from a bucket; return (allowed, retry_after, remaining)."""
+        with self.lock:
+            now = time.monotonic()
+            slot = self._get_slot(bucket_key, max_tokens, now)
+            allowed, retry_after = _consume_slot(
+                self._tokens,
+                self._last_refill,
+                slot,
+                now,
+                float(max_tokens),
+                float(refill_rate),
+                float(tokens),
+            )
+            remaining = self._tokens.item(slot)
+        return bool(allowed), float(retry_after), remaining
+
+
 class RateLimiter:
-    """Rate limiter with IP-based tracking."""
-
-    def __init__(self):
-        """Initialize rate limiter."""
-        self._buckets: dict[str, TokenBucket] = {}
-        self._cleanup_thread: threading.Thread | None = None
-        self._stop_event = threading.Event()  # For shutdown signaling
-        self._stop_requested = (
-            False  # Guard flag to prevent thread creation during shutdown
+    """Rate limiter with IP-based tracking.
+
+    Buckets are spread over a power-of-two number of independently locked
+    pools by key hash, so concurrent requests from different clients rarely
+    contend on the same lock. State is per process; each server worker
+    enforces its own limits.
+    """
+
+    SHARD_COUNT = 16  # Must be a power of two
+
+    def __init__(self, max_buckets: int | None = None):
+        """Initialize rate limiter.
+
+        Args:
+            max_buckets: Maximum number of tracked buckets across all shards;
+                defaults to MEMORY_API_RATE_LIMIT_MAX_BUCKETS. Must be at
+                least SHARD_COUNT so every shard can hold a bucket.
+
+        Raises:
+            ValueError: If max_buckets is below SHARD_COUNT
+        """
+        if max_buckets is None:
+            max_buckets = MAX_TRACKED_BUCKETS
+        if max_buckets < self.SHARD_COUNT:
+            raise ValueError(
+                f"max_buckets must be at least {self.SHARD_COUNT}, got {max_buckets}"
+            )
+        # Spread the remainder over the first shards so the total is exact
+        per_shard, remainder = divmod(max_buckets, self.SHARD_COUNT)
+        self._shards = tuple(
+            _BucketPool(per_shard + (index < remainder))
+            for index in range(self.SHARD_COUNT)
         )
-        self._lock = threading.Lock()
-        self._cleanup_lock = threading.Lock()
+        self._shard_mask = self.SHARD_COUNT - 1
 
-    def get_bucket(
+    def _locate(
         self, client_id: str, max_tokens: float, refill_rate: float
-    ) -> TokenBucket:
-        """Get or create token bucket for client.
+    ) -> tuple[_BucketPool, str]:
+        """Map a client and limit to its shard and bucket key."""
+        # Use composite key to separate buckets per rate limit type
+        bucket_key = f"{client_id}:{max_tokens}:{refill_rate}"
+        return self._shards[hash(bucket_key) & self._shard_mask], bucket_key
+
+    def bucket_count(self) -> int:
+        """Get the number of tracked buckets across all shards."""
+        return sum(len(shard.slots) for shard in self._shards)
+
+    def get_bucket_state(
+        self, client_id: str, max_tokens: float, refill_rate: float
+    ) -> tuple[float, float]:
+        """Get current bucket state for client without consuming tokens.
 
         Args:
             client_id: Client identifier (IP address)
@@ -117,14 +324,10 @@ class RateLimiter:
             refill_rate: Refill rate in tokens per second
 
         Returns:
-            Token bucket for client
+            Tuple of (available_tokens, seconds_until_one_token)
         """
-        # Use composite key to separate buckets per rate limit type
-        bucket_key = f"{client_id}:{max_tokens}:{refill_rate}"
-        with self._lock:
-            if bucket_key not in self._buckets:
-                self._buckets[bucket_key] = TokenBucket(max_tokens, refill_rate)
-            return self._buckets[bucket_key]
+        shard, bucket_key = self._locate(client_id, max_tokens, refill_rate)
+        return shard.state(bucket_key, max_tokens, refill_rate)
 
     def is_allowed(
         self, client_id: str, max_tokens: float, refill_rate: float, tokens: float = 1.0
@@ -140,76 +343,25 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, retry_after_seconds)
         """
-        bucket = self.get_bucket(client_id, max_tokens, refill_rate)
-        if bucket.consume(tokens):
-            return True, 0.0
-        else:
-            retry_after = bucket.time_until_available(tokens)
-            return False, retry_after
-
-    def start_cleanup(self) -> None:
-        """Start the cleanup thread if not already running."""
-        with self._cleanup_lock:
-            # Check guard flag to prevent starting during shutdown
-            if self._stop_requested:
-                return
+        allowed, retry_after, _ = self.acquire(client_id, max_tokens, refill_rate, tokens)
+        return allowed, retry_after
 
-            if self._cleanup_thread is None or not self._cleanup_thread.is_alive():
-                self._stop_event.clear()  # Clear any previous stop signal
-                self._cleanup_thread = threading.Thread(
-                    target=self._cleanup_old_buckets,
-                    daemon=True,
-                    name="RateLimiterCleanup",
-                )
-                self._cleanup_thread.start()
-
-    def _cleanup_old_buckets(self) -> None:
-        """Clean up old inactive buckets."""
-        while not self._stop_event.is_set():  # Check shutdown flag
-            # Use wait() instead of sleep() for early wake capability
-            if self._stop_event.wait(timeout=300):  # 5 minutes
-                break  # Event was set, exit loop
-
-            # Cleanup logic remains the same
-            with self._lock:
-                now = time.time()
-                expired_keys = []
-                for key, bucket in self._buckets.items():
-                    # Remove buckets that haven't been used for 10 minutes
-                    if now - bucket.last_refill > 600:
-                        expired_keys.append(key)
-
-                for key in expired_keys:
-                    del self._buckets[key]
-
-    def stop(self) -> None:
-        """Stop the cleanup thread gracefully."""
-        with self._cleanup_lock:
-            # Set guard flag to prevent new thread creation during shutdown
-            self._stop_requested = True
-            thread = self._cleanup_thread
-            if thread and thread.is_alive():
-                self._stop_event.set()  # Signal shutdown
-
-        # Join outside the lock to avoid blocking start_cleanup() unnecessarily
-        if thread and thread.is_alive():
-            thread.join(timeout=10.0)  # Wait for graceful shutdown
-            if thread.is_alive():
-                # Thread didn't shut down gracefully, but it's daemon
-                # so will exit on process exit
-                thread_name = getattr(thread, "name", "unknown")
-                thread_id = getattr(thread, "ident", "unknown")
-                logger.warning(
-                    "Daemon cleanup thread did not shut down within "
-                    "timeout. Thread name: %s, Thread ID: %s",
-                    thread_name,
-                    thread_id,
-                )
+    def acquire(
+        self, client_id: str, max_tokens: float, refill_rate: float, tokens: float = 1.0
+    ) -> tuple[bool, float, float]:
+        """Consume tokens and report the bucket level in the same lock hold.
 
-        # Clear the thread reference only if it's still the same thread we joined
-        with self._cleanup_lock:
-            if self._cleanup_thread is thread:
-                self._cleanup_thread = None
+        Args:
+            client_id: Client identifier
+            max_tokens: Maximum tokens for bucket
+            refill_rate: Refill rate in tokens per second
+            tokens: Number of tokens required
+
+        Returns:
+            Tuple of (allowed, retry_after_seconds, remaining_tokens)
+        """
+        shard, bucket_key = self._locate(client_id, max_tokens, refill_rate)
+        return shard.consume(bucket_key, max_tokens, refill_rate, tokens)
 
 
 # Global rate limiter instance (lazy initialization)
@@ -220,43 +372,29 @@ _rate_limiter_lock = threading.Lock()
 def get_rate_limiter() -> RateLimiter:
     """Get or create the global rate limiter instance (lazy initialization).
 
-    This function ensures the rate limiter is initialized on first use
-    rather than at module import time, avoiding spawning threads during
-    import.
+    Idle buckets are evicted lazily as new clients arrive, so no cleanup
+    thread is started.
 
     Returns:
         The global RateLimiter instance
-
-    Note:
-        When the application is shutting down, you should call
-        shutdown_rate_limiter() to properly stop the cleanup thread.
     """
     global _rate_limiter
     if _rate_limiter is None:
         with _rate_limiter_lock:
             if _rate_limiter is None:
                 _rate_limiter = RateLimiter()
-                _rate_limiter.start_cleanup()
     return _rate_limiter
 
 
 def shutdown_rate_limiter() -> None:
     """Shutdown the global rate limiter instance.
 
-    This function:
-    - Acquires the rate limiter lock
-    - Checks if the module-global rate limiter exists
-    - Calls its stop() method if present
-    - Clears the _rate_limiter reference
-
-    Should be called during application shutdown to ensure proper
-    cleanup of the rate limiter's resources.
+    Drops the module-global instance so its bucket state can be freed; the
+    next get_rate_limiter() call creates a fresh limiter.
     """
     global _rate_limiter
     with _rate_limiter_lock:
-        if _rate_limiter is not None:
-            _rate_limiter.stop()
-            _rate_limiter = None
+        _rate_limiter = None
 
 
 # Rate limit configurations (requests per minute)
@@ -273,16 +411,97 @@ RATE_LIMITS_PER_SECOND = {
     "admin": RATE_LIMITS["admin"] / 60.0,
 }
 
+# Header values that only depend on configuration. A bucket never holds more
+# than its limit, so every possible X-RateLimit-Remaining value is prebuilt.
+_RATE_LIMIT_STRS = {k: str(v) for k, v in RATE_LIMITS.items()}
+_REMAINING_STRS = {
+    k: tuple(str(i) for i in range(v + 1)) for k, v in RATE_LIMITS.items()
+}
+
+
+def _remaining_str(limit_type: str, available: float) -> str:
+    """Return the X-RateLimit-Remaining value for a bucket level."""
+    strs = _REMAINING_STRS[limit_type]
+    return strs[min(max(0, int(available)), len(strs) - 1)]
+
+
+class RateLimitExceeded(HTTPException):
+    """429 response raised when a client has exhausted its bucket.
+
+    Only Retry-After and X-RateLimit-Reset vary between denials; the limit
+    and remaining values come from precomputed strings.
+    """
+
+    def __init__(self, limit_str: str, retry_after: float):
+        """Build the 429 exception and its rate limit headers.
+
+        Args:
+            limit_str: Precomputed X-RateLimit-Limit header value
+            retry_after: Seconds until the request would be allowed
+        """
+        retry_seconds = int(retry_after)
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers={
+                "Retry-After": str(retry_seconds),
+                "X-RateLimit-Limit": limit_str,
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + retry_seconds),
+            },
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    """Rate limit header values captured when a request consumed its tokens.
+
+    A result with no limit means rate limiting was disabled and apply() does
+    nothing.
+    """
+
+    limit: str | None = None
+    remaining: str = "0"
+    reset: int = 0
+
+    def apply(self, response: Response) -> None:
+        """Write the X-RateLimit-* headers to a response.
+
+        Args:
+            response: FastAPI response
+        """
+        if self.limit is None:
+            return
+        headers = response.headers
+        headers["X-RateLimit-Limit"] = self.limit
+        headers["X-RateLimit-Remaining"] = self.remaining
+        headers["X-RateLimit-Reset"] = str(self.reset)
+
+
+_NO_RATE_LIMIT = RateLimitResult()
+
 
 def get_client_ip(request: Request) -> str:
     """Get client IP address from request with security validation.
 
+    The resolved address is cached on ``request.state`` so the rate limit
+    check and the response headers for one request parse it only once.
+
     Args:
         request: FastAPI request
 
     Returns:
         Client IP address (validated and trusted)
     """
+    client_ip = getattr(request.state, "_client_ip", None)
+    if client_ip is None:
+        client_ip = _resolve_client_ip(request)
+        request.state._client_ip = client_ip
+    return client_ip
+
+
+def _resolve_client_ip(request: Request) -> str:
+    """Resolve the client IP address from forwarded headers or the peer."""
 
     def validate_ip(ip_str: str) -> str | None:
         """Validate IP address format."""
@@ -318,7 +537,7 @@ def get_client_ip(request: Request) -> str:
         forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
             # Take the first IP (original client)
-            first_ip = forwarded_for.split(",")[0].strip()
+            first_ip = forwarded_for.partition(",")[0].strip()
             validated_ip = validate_ip(first_ip)
             if validated_ip:
                 return validated_ip
@@ -336,24 +555,28 @@ def get_client_ip(request: Request) -> str:
 
 def check_rate_limit(
     request: Request, limit_type: str, tokens: float = 1.0
-) -> tuple[bool, float]:
+) -> RateLimitResult:
     """Check if request is within rate limits.
 
+    The header values for the response are captured while the bucket is
+    updated, so callers pass the result to RateLimitResult.apply() instead
+    of looking the bucket up again with add_rate_limit_headers().
+
     Args:
         request: FastAPI request
         limit_type: Type of limit (read, write, admin)
         tokens: Number of tokens required
 
     Returns:
-        Tuple of (allowed, retry_after_seconds)
+        Rate limit header values for the response
 
     Raises:
-        HTTPException: If rate limit exceeded
+        RateLimitExceeded: If rate limit exceeded
     """
     # Read from environment dynamically for testability
     enable_rate_limiting = is_rate_limiting_enabled()
     if not enable_rate_limiting:
-        return True, 0.0
+        return _NO_RATE_LIMIT
 
     if limit_type not in RATE_LIMITS_PER_SECOND:
         raise ValueError(f"Unknown rate limit type: {limit_type}")
@@ -363,28 +586,27 @@ def check_rate_limit(
     refill_rate = RATE_LIMITS_PER_SECOND[limit_type]
 
     rate_limiter = get_rate_limiter()
-    allowed, retry_after = rate_limiter.is_allowed(
+    allowed, retry_after, available = rate_limiter.acquire(
         client_ip, max_tokens, refill_rate, tokens
     )
 
     if not allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Rate limit exceeded",
-            headers={
-                "Retry-After": str(int(retry_after)),
-                "X-RateLimit-Limit": str(max_tokens),
-                "X-RateLimit-Remaining": "0",
-                "X-RateLimit-Reset": str(int(time.time() + retry_after)),
-            },
-        )
+        raise RateLimitExceeded(_RATE_LIMIT_STRS[limit_type], retry_after)
 
-    return allowed, retry_after
+    wait_seconds = 0.0 if available >= 1.0 else (1.0 - available) / refill_rate
+    return RateLimitResult(
+        limit=_RATE_LIMIT_STRS[limit_type],
+        remaining=_remaining_str(limit_type, available),
+        reset=int(time.time() + wait_seconds),
+    )
 
 
 def add_rate_limit_headers(response: Response, limit_type: str, client_ip: str) -> None:
     """Add rate limit headers to response.
 
+    This reads the bucket a second time; handlers that called
+    check_rate_limit() should apply its result instead.
+
     Args:
         response: FastAPI response
         limit_type: Type of limit
@@ -400,12 +622,13 @@ def add_rate_limit_headers(response: Response, limit_type: str, client_ip: str)
 
     # Get current bucket state
     rate_limiter = get_rate_limiter()
-    bucket = rate_limiter.get_bucket(client_ip, max_tokens, refill_rate)
-    remaining = max(0, int(bucket.tokens))
-    reset_time = int(time.time() + bucket.time_until_available(1.0))
+    available, wait_seconds = rate_limiter.get_bucket_state(
+        client_ip, max_tokens, refill_rate
+    )
+    reset_time = int(time.time() + wait_seconds)
 
-    response.headers["X-RateLimit-Limit"] = str(max_tokens)
-    response.headers["X-RateLimit-Remaining"] = str(remaining)
+    response.headers["X-RateLimit-Limit"] = _RATE_LIMIT_STRS[limit_type]
+    response.headers["X-RateLimit-Remaining"] = _remaining_str(limit_type, available)
     response.headers["X-RateLimit-Reset"] = str(reset_time)
 
 
@@ -6,10 +6,12 @@ formatting integrity during document translation.
 
 import asyncio
 import contextlib
+import functools
 import logging
 import os
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 import gradio as gr
 import uvicorn
 from dotenv import load_dotenv
@@ -20,6 +22,7 @@ from fastapi.staticfiles import StaticFiles
 # Load environment variables from .env file
 load_dotenv()
 
+from api.memory_routes import AuthRateLimitMiddleware
 from api.routes import api_router, app_router
 from core.state_manager import state
 from core.translation_handler import translation_service
@@ -43,14 +46,21 @@ def _ensure_required_dirs() -> list[str]:
     """Create required directories if missing and return created list."""
     created: list[str] = []
     for directory in _REQUIRED_DIRECTORIES:
-        if not os.path.isdir(directory):
+        # One mkdir syscall in the common case instead of isdir + makedirs
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            continue
+        except OSError:
             os.makedirs(directory, exist_ok=True)
-            created.append(directory)
+        created.append(directory)
     return created
 
 
-# Create directories early
+# Create directories early; with a preloading server (e.g. gunicorn --preload)
+# this runs once before workers fork, so lifespan startup can skip the check
 _created_early: list[str] = _ensure_required_dirs()
+_DIRS_READY = True
 
 # Configure logging (logs/ exists now)
 logging.basicConfig(
@@ -71,11 +81,24 @@ if _created_early:
 async def lifespan(_app: FastAPI):
     """Manage application startup and shutdown lifecycle."""
     # Startup logic
-    created = _ensure_required_dirs()
-    if created:
-        for d in created:
-            logger.info("Created directory: %s", d)
-    logger.info("All required directories verified on startup")
+    if not _DIRS_READY:
+        created = _ensure_required_dirs()
+        if created:
+            for d in created:
+                logger.info("Created directory: %s", d)
+        logger.info("All required directories verified on startup")
+
+    # Sync endpoints and Gradio callbacks share AnyIO's default thread
+    # limiter (40 tokens); raise it so translation calls don't serialize
+    try:
+        thread_limit = int(os.getenv("PL_THREAD_LIMIT", "100"))
+        if thread_limit <= 0:
+            logger.warning("Invalid PL_THREAD_LIMIT: %s, using default 100", thread_limit)
+            thread_limit = 100
+    except ValueError as e:
+        logger.warning("Invalid PL_THREAD_LIMIT format, using default 100: %s", e)
+        thread_limit = 100
+    anyio.to_thread.current_default_thread_limiter().total_tokens = thread_limit
 
     # Start memory monitoring if enabled
     if os.getenv("ENABLE_MEMORY_MONITORING", "").lower() == "true":
@@ -154,6 +177,25 @@ def get_config_value(app: FastAPI, key: str, default=None):
     return os.getenv(key, default)
 
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that sends a Cache-Control header with every asset.
+
+    Starlette already sends ETag and Last-Modified, so browsers can revalidate
+    cached copies cheaply.
+    """
+
+    def __init__(self, *args, cache_control: str, **kwargs):
+        """Initialize like StaticFiles, with the Cache-Control value to send."""
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    def file_response(self, *args, **kwargs):
+        """Build the file response and add the Cache-Control header."""
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = self.cache_control
+        return response
+
+
 def create_app(config: dict | None = None):
     """Create FastAPI app with optional configuration injection.
     
@@ -181,6 +223,10 @@ def create_app(config: dict | None = None):
     else:
         app.state._config = {}
 
+    # Authenticate and rate limit memory routes before routing; added first
+    # so CORS stays the outermost layer and also wraps its error responses
+    app.add_middleware(AuthRateLimitMiddleware, prefix="/api/v1")
+
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -194,30 +240,73 @@ def create_app(config: dict | None = None):
     app.include_router(app_router)  # Root and philosophy routes without prefix
     app.include_router(api_router, prefix="/api/v1")  # API routes with versioning
 
-    # Static files mount
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+    # Static files mount. Templates load assets by un-versioned URLs, so
+    # browsers keep copies but revalidate them by ETag on every use; a
+    # deployment with fingerprinted URLs can set STATIC_CACHE_CONTROL to a
+    # far-future policy instead
+    cache_control = get_config_value(app, "STATIC_CACHE_CONTROL", "public, no-cache")
+    app.mount(
+        "/static",
+        CachedStaticFiles(directory="static", cache_control=cache_control),
+        name="static",
+    )
 
     return app
 
 
-def main() -> None:
-    """Main application entry point."""
-    logger.info("Starting PhenomenalLayout - Advanced Layout Preservation Engine")
-
-    # Create app using factory for current environment
+def create_app_with_gradio():
+    """Create the FastAPI app with the Gradio UI mounted at /ui."""
     app = create_app()
-
-    # Create Gradio interface
     gradio_app = create_gradio_interface()
+    return gr.mount_gradio_app(app, gradio_app, path="/ui")
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_with_gradio():
+    """Return the app with the Gradio UI mounted, building it on first use.
+
+    Importing this module builds no UI; the first call does, once per process.
+    The UI is not built at import time: uvicorn starts its workers with the
+    "spawn" start method, so a UI built in the parent would not be shared with
+    them and each worker would build its own anyway.
+    """
+    return create_app_with_gradio()
 
-    # Mount Gradio app to FastAPI
-    app_with_gradio = gr.mount_gradio_app(app, gradio_app, path="/ui")
+
+def main() -> None:
+    """Main application entry point."""
+    from api.rate_limit import is_rate_limiting_enabled
+
+    logger.info("Starting PhenomenalLayout - Advanced Layout Preservation Engine")
 
     # Start server with Uvicorn
-    # Note: Default to localhost; override via HOST and PORT env vars
+    # Note: Default to localhost; override via HOST, PORT and WORKERS env vars
     host = os.getenv("HOST", "127.0.0.1")
     port = int(os.getenv("PORT", "8000"))
-    uvicorn.run(app_with_gradio, host=host, port=port, log_level="info")
+    # Each worker is a separate process with its own in-memory state:
+    # core.state_manager.state, the rate limiter buckets and the verified JWT
+    # payload cache. Rate limits would then hold per worker (limit x WORKERS),
+    # so several workers are refused while the in-memory limiter is enabled.
+    workers = int(os.getenv("WORKERS", "1"))
+    if workers > 1 and is_rate_limiting_enabled():
+        raise SystemExit(
+            "WORKERS > 1 requires MEMORY_API_ENABLE_RATE_LIMITING=false: the "
+            "in-memory rate limiter would enforce its limits per worker"
+        )
+
+    if workers > 1:
+        # Multiple workers need an import string; each worker process builds
+        # the app once through the cached factory
+        uvicorn.run(
+            "app:get_app_with_gradio",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            log_level="info",
+        )
+    else:
+        uvicorn.run(get_app_with_gradio(), host=host, port=port, log_level="info")
 
 
 if __name__ == "__main__":
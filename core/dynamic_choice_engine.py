@@ -7,12 +7,18 @@ caching for optimal conflict resolution performance.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import math
+import os
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
+
+import numpy as np
 
 from core.dynamic_programming import (
     DynamicRegistry,
@@ -20,7 +26,6 @@ from core.dynamic_programming import (
     SmartCache,
     StrategyPattern,
     StrategyRegistry,
-    memoize,
     performance_monitor,
 )
 from models.user_choice_models import (
@@ -28,6 +33,44 @@ from models.user_choice_models import (
     ConflictResolution,
 )
 
+logger = logging.getLogger(__name__)
+
+# Below this size the per-conflict path is cheaper than building arrays
+_VECTORIZE_MIN_BATCH = 8
+
+# Strategies are bucketed by (similarity, confidence gap) in 0.1-wide bins,
+# matching the +/-0.1 tolerance of DynamicConflictStrategy.can_handle, so a
+# strategy can only match contexts in the surrounding 3x3 bins
+_STRATEGY_BIN_SCALE = 10
+_NEIGHBOR_BINS = tuple((ds, dg) for ds in (-1, 0, 1) for dg in (-1, 0, 1))
+
+
+# Resolution timing is opt-in via PL_METRICS and sampled 1-in-64 when enabled
+_METRICS_ENABLED = os.getenv("PL_METRICS", "0").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+_METRICS_SAMPLE_MASK = 63
+
+
+# Shared severity_range tuples, so keys with equal ranges hold the same object
+_RANGE_POOL: dict[tuple[float, float], tuple[float, float]] = {}
+
+
+def _intern_range(severity_range: tuple[float, float]) -> tuple[float, float]:
+    """Return the pooled tuple equal to ``severity_range``."""
+    return _RANGE_POOL.setdefault(severity_range, severity_range)
+
+
+def _strategy_bin(similarity: float, confidence_gap: float) -> tuple[int, int]:
+    """Quantize a (similarity, confidence gap) pair to its strategy bin."""
+    return (
+        math.floor(similarity * _STRATEGY_BIN_SCALE),
+        math.floor(confidence_gap * _STRATEGY_BIN_SCALE),
+    )
+
 
 class ConflictType(Enum):
     """Types of choice conflicts."""
@@ -39,29 +82,57 @@ class ConflictType(Enum):
     TEMPORAL_CONFLICT = "temporal_conflict"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConflictKey:
-    """Immutable key for conflict resolution lookup."""
+    """Immutable key for conflict resolution lookup.
+
+    The rounded, canonical tuple used for hashing and equality is built once
+    in ``__post_init__`` rather than on every lookup.
+    """
 
     conflict_type: ConflictType
     severity_range: tuple[float, float]
     context_similarity: float
     confidence_gap: float
     temporal_distance_hours: float
+    _key: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern the severity range and precompute the comparison key."""
+        object.__setattr__(self, "severity_range", _intern_range(self.severity_range))
+        object.__setattr__(
+            self,
+            "_key",
+            (
+                self.conflict_type.value,
+                self.severity_range,
+                round(self.context_similarity, 2),
+                round(self.confidence_gap, 2),
+                round(self.temporal_distance_hours, 1),
+            ),
+        )
+
+    def __hash__(self) -> int:
+        """Hash the precomputed key."""
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the precomputed keys."""
+        if not isinstance(other, ConflictKey):
+            return NotImplemented
+        return self._key == other._key
 
     def to_hash(self) -> int:
         """Convert to hash for dictionary lookup."""
-        data = (
-            self.conflict_type.value,
-            self.severity_range,
-            round(self.context_similarity, 2),
-            round(self.confidence_gap, 2),
-            round(self.temporal_distance_hours, 1),
-        )
-        return hash(data)
+        return hash(self._key)
 
 
-@dataclass
+def _unresolved(_strategy: ResolutionStrategy, _conflict: ChoiceConflict) -> None:
+    """Leave a conflict unresolved by the strategy."""
+    return None
+
+
+@dataclass(frozen=True, slots=True)
 class ResolutionStrategy:
     """Strategy for resolving a specific type of conflict."""
 
@@ -72,14 +143,7 @@ class ResolutionStrategy:
 
     def apply(self, conflict: ChoiceConflict) -> str | None:
         """Apply resolution strategy to conflict."""
-        if self.strategy_type == ConflictResolution.LATEST_WINS:
-            return self._resolve_latest_wins(conflict)
-        elif self.strategy_type == ConflictResolution.HIGHEST_CONFIDENCE:
-            return self._resolve_highest_confidence(conflict)
-        elif self.strategy_type == ConflictResolution.CONTEXT_SPECIFIC:
-            return None  # Keep both choices
-        else:  # USER_PROMPT
-            return None  # Requires manual resolution
+        return self._DISPATCH.get(self.strategy_type, _unresolved)(self, conflict)
 
     def _resolve_latest_wins(self, conflict: ChoiceConflict) -> str:
         """Resolve by selecting the most recent choice."""
@@ -93,41 +157,59 @@ class ResolutionStrategy:
             return conflict.choice_a.choice_id
         return conflict.choice_b.choice_id
 
+    # CONTEXT_SPECIFIC keeps both choices; USER_PROMPT requires manual resolution
+    _DISPATCH: ClassVar[dict[ConflictResolution, Callable[..., str | None]]] = {
+        ConflictResolution.LATEST_WINS: _resolve_latest_wins,
+        ConflictResolution.HIGHEST_CONFIDENCE: _resolve_highest_confidence,
+        ConflictResolution.CONTEXT_SPECIFIC: _unresolved,
+        ConflictResolution.USER_PROMPT: _unresolved,
+    }
+
 
-@dataclass
+@dataclass(slots=True)
 class ConflictContext:
-    """Context for conflict resolution decisions."""
+    """Context for conflict resolution decisions.
+
+    Not frozen: similarity and confidence gap are cached on first use.
+    """
 
     conflict: ChoiceConflict
     user_preferences: dict[str, Any] = field(default_factory=dict)
     session_context: dict[str, Any] = field(default_factory=dict)
 
+    # Computed on first use; every strategy probe reads the same values
+    _similarity: float | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _confidence_gap: float | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def calculate_context_similarity(self) -> float:
         """Calculate similarity between conflicting choice contexts."""
-        return self.conflict.choice_a.context.calculate_similarity(
-            self.conflict.choice_b.context
-        )
+        if self._similarity is None:
+            self._similarity = self.conflict.choice_a.context.calculate_similarity(
+                self.conflict.choice_b.context
+            )
+        return self._similarity
 
     def calculate_confidence_gap(self) -> float:
         """Calculate confidence difference between choices."""
-        return abs(
-            self.conflict.choice_a.confidence_level
-            - self.conflict.choice_b.confidence_level
-        )
+        if self._confidence_gap is None:
+            self._confidence_gap = abs(
+                self.conflict.choice_a.confidence_level
+                - self.conflict.choice_b.confidence_level
+            )
+        return self._confidence_gap
 
 
+@dataclass(frozen=True, slots=True)
 class DynamicConflictStrategy(StrategyPattern[str | None]):
     """Dynamic strategy for conflict resolution."""
 
-    def __init__(
-        self,
-        conflict_key: ConflictKey,
-        resolution_strategy: ResolutionStrategy,
-        priority: int = 0,
-    ):
-        self.conflict_key = conflict_key
-        self.resolution_strategy = resolution_strategy
-        self._priority = priority
+    conflict_key: ConflictKey
+    resolution_strategy: ResolutionStrategy
+    priority: int = 0
 
     def execute(self, context: ConflictContext) -> str | None:
         """Execute resolution strategy."""
@@ -144,10 +226,6 @@ class DynamicConflictStrategy(StrategyPattern[str | None]):
             and abs(self.conflict_key.confidence_gap - confidence_gap) <= 0.1
         )
 
-    @property
-    def priority(self) -> int:
-        return self._priority
-
 
 class DynamicConflictResolutionEngine:
     """Dynamic programming implementation for conflict resolution."""
@@ -158,12 +236,23 @@ class DynamicConflictResolutionEngine:
         self.strategy_registry: StrategyRegistry[str | None] = StrategyRegistry()
 
         # Caching systems
-        self.resolution_cache: SmartCache[str, str | None] = SmartCache(
+        self.resolution_cache: SmartCache[tuple[str, float], str | None] = SmartCache(
             max_size=cache_size, ttl_seconds=1800
         )
 
         # Performance tracking
         self.metrics = PerformanceMetrics("dynamic_conflict_resolution")
+        self._metrics_enabled = _METRICS_ENABLED
+        self._resolve_count = 0
+
+        # (strategies, context bin -> candidate bitmask, unbinned bitmask); bit
+        # i is registry position i. Rebuilt whenever the registry gains
+        # strategies
+        self._strategy_index: tuple[tuple, dict[tuple[int, int], int], int] = (
+            (),
+            {},
+            0,
+        )
 
         # Initialize strategies
         self._build_resolution_table()
@@ -211,29 +300,87 @@ class DynamicConflictResolutionEngine:
 
             self.strategy_registry.register(dynamic_strategy)
 
-    @memoize(cache_size=256, ttl_seconds=600)
+    def _get_strategy_index(
+        self,
+    ) -> tuple[tuple, dict[tuple[int, int], int], int]:
+        """Return the bin index of registered strategies, rebuilding if stale."""
+        index = self._strategy_index
+        if len(index[0]) == len(self.strategy_registry):
+            return index
+
+        strategies = self.strategy_registry.strategies
+        unbinned = 0
+        for position, strategy in enumerate(strategies):
+            if not isinstance(strategy, DynamicConflictStrategy):
+                # Custom strategies may match any context
+                unbinned |= 1 << position
+
+        # Each strategy bit is set in every context bin it can match, so a
+        # lookup is a single dict probe
+        bins: dict[tuple[int, int], int] = {}
+        for position, strategy in enumerate(strategies):
+            if isinstance(strategy, DynamicConflictStrategy):
+                key = strategy.conflict_key
+                sim_bin, gap_bin = _strategy_bin(
+                    key.context_similarity, key.confidence_gap
+                )
+                for ds, dg in _NEIGHBOR_BINS:
+                    context_bin = (sim_bin + ds, gap_bin + dg)
+                    bins[context_bin] = bins.get(context_bin, unbinned) | (
+                        1 << position
+                    )
+
+        index = (strategies, bins, unbinned)
+        self._strategy_index = index
+        return index
+
+    def _select_strategy(
+        self, context: ConflictContext
+    ) -> DynamicConflictStrategy | None:
+        """Select the highest-priority strategy that can handle the context.
+
+        Only strategies whose bins neighbour the context's similarity and
+        confidence gap are checked with can_handle.
+        """
+        strategies, bins, unbinned = self._get_strategy_index()
+        context_bin = _strategy_bin(
+            context.calculate_context_similarity(), context.calculate_confidence_gap()
+        )
+        candidates = bins.get(context_bin, unbinned)
+
+        # Lowest set bit first follows the registry's priority order
+        while candidates:
+            lowest = candidates & -candidates
+            strategy = strategies[lowest.bit_length() - 1]
+            if strategy.can_handle(context):
+                return strategy
+            candidates ^= lowest
+        return None
+
     def resolve_conflict_optimized(
         self, conflict: ChoiceConflict, **context_kwargs
     ) -> str | None:
         """Optimized conflict resolution with caching and pre-computed strategies."""
-        start_time = time.perf_counter()
+        count = self._resolve_count
+        self._resolve_count = count + 1
+        timed = self._metrics_enabled and not (count & _METRICS_SAMPLE_MASK)
+        start_time = time.perf_counter() if timed else 0.0
 
         try:
             # Create resolution context
             context = ConflictContext(conflict=conflict, **context_kwargs)
 
-            # Create cache key
-            cache_key = f"{conflict.conflict_id}:{conflict.context_similarity:.2f}"
+            cache_key = (conflict.conflict_id, round(conflict.context_similarity, 2))
 
             # Check cache
             cached_result = self.resolution_cache.get(cache_key)
             if cached_result is not self.resolution_cache.MISS:
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                self.metrics.record_operation(duration_ms, cache_hit=True)
+                if timed:
+                    self._record_timing(start_time, cache_hit=True)
                 return cached_result
 
             # Try strategy registry
-            strategy = self.strategy_registry.select_strategy(context)
+            strategy = self._select_strategy(context)
             resolution_result = None
 
             if strategy:
@@ -246,17 +393,22 @@ class DynamicConflictResolutionEngine:
             # Cache result
             self.resolution_cache.put(cache_key, resolution_result)
 
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            self.metrics.record_operation(duration_ms, cache_hit=False)
+            if timed:
+                self._record_timing(start_time, cache_hit=False)
 
             return resolution_result
 
         except Exception as e:
-            logging.error(f"Error resolving conflict {conflict.conflict_id}: {e}")
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            self.metrics.record_operation(duration_ms, cache_hit=False)
+            logger.error("Error resolving conflict %s: %s", conflict.conflict_id, e)
+            if timed:
+                self._record_timing(start_time, cache_hit=False)
             return None
 
+    def _record_timing(self, start_time: float, cache_hit: bool) -> None:
+        """Record a sampled resolution duration."""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        self.metrics.record_operation(duration_ms, cache_hit=cache_hit)
+
     def _default_resolution(self, conflict: ChoiceConflict) -> str:
         """Default resolution when no strategy matches."""
         # Simple fallback: latest wins
@@ -269,6 +421,12 @@ class DynamicConflictResolutionEngine:
         self, conflicts: list[ChoiceConflict]
     ) -> dict[str, str | None]:
         """Batch conflict resolution for improved throughput."""
+        if len(conflicts) >= _VECTORIZE_MIN_BATCH:
+            try:
+                return self._resolve_conflicts_vectorized(conflicts)
+            except Exception as e:
+                logger.warning("Vectorized conflict resolution failed: %s", e)
+
         results = {}
 
         for conflict in conflicts:
@@ -277,46 +435,159 @@ class DynamicConflictResolutionEngine:
 
         return results
 
+    async def resolve_conflicts_batch_async(
+        self, conflicts: list[ChoiceConflict]
+    ) -> dict[str, str | None]:
+        """Resolve a batch in a worker thread without blocking the event loop.
+
+        Resolution is CPU-bound and holds the GIL, so the batch is offloaded
+        as a single unit rather than fanned out per conflict.
+        """
+        return await asyncio.to_thread(self.resolve_conflicts_batch, conflicts)
+
+    def _resolve_conflicts_vectorized(
+        self, conflicts: list[ChoiceConflict]
+    ) -> dict[str, str | None]:
+        """Resolve a batch with array operations instead of per-conflict dispatch.
+
+        Produces the same results as calling resolve_conflict_optimized on
+        each conflict: cached results are reused, each remaining conflict is
+        matched against the registered strategies in priority order using
+        the same tolerance as DynamicConflictStrategy.can_handle, and rows
+        whose strategy yields no winner fall back to latest-wins.
+        """
+        results: dict[str, str | None] = {}
+        pending: list[ChoiceConflict] = []
+        pending_keys: list[tuple[str, float]] = []
+
+        for conflict in conflicts:
+            cache_key = (conflict.conflict_id, round(conflict.context_similarity, 2))
+            cached_result = self.resolution_cache.get(cache_key)
+            if cached_result is not self.resolution_cache.MISS:
+                results[conflict.conflict_id] = cached_result
+            else:
+                results[conflict.conflict_id] = None  # Keep input order
+                pending.append(conflict)
+                pending_keys.append(cache_key)
+
+        if not pending:
+            return results
+
+        strategies = self.strategy_registry.strategies
+        if not all(isinstance(s, DynamicConflictStrategy) for s in strategies):
+            # Custom strategies can only be evaluated one conflict at a time
+            for conflict in pending:
+                results[conflict.conflict_id] = self.resolve_conflict_optimized(
+                    conflict
+                )
+            return results
+
+        count = len(pending)
+        similarity = np.fromiter(
+            (
+                c.choice_a.context.calculate_similarity(c.choice_b.context)
+                for c in pending
+            ),
+            dtype=float,
+            count=count,
+        )
+        confidence_a = np.fromiter(
+            (c.choice_a.confidence_level for c in pending), dtype=float, count=count
+        )
+        confidence_b = np.fromiter(
+            (c.choice_b.confidence_level for c in pending), dtype=float, count=count
+        )
+        confidence_gap = np.abs(confidence_a - confidence_b)
+        latest_is_a = np.array([c.choice_a.created_at for c in pending]) > np.array(
+            [c.choice_b.created_at for c in pending]
+        )
+        highest_is_a = confidence_a > confidence_b
+
+        # Default resolution is latest-wins; LATEST_WINS, CONTEXT_SPECIFIC and
+        # USER_PROMPT strategies all end there, so only rows claimed by a
+        # HIGHEST_CONFIDENCE strategy change the winner
+        pick_a = latest_is_a.copy()
+        unmatched = np.ones(count, dtype=bool)
+        for strategy in strategies:
+            key = strategy.conflict_key
+            handles = (
+                unmatched
+                & (np.abs(key.context_similarity - similarity) <= 0.1)
+                & (np.abs(key.confidence_gap - confidence_gap) <= 0.1)
+            )
+            if not handles.any():
+                continue
+            unmatched &= ~handles
+            strategy_type = strategy.resolution_strategy.strategy_type
+            if strategy_type == ConflictResolution.HIGHEST_CONFIDENCE:
+                pick_a[handles] = highest_is_a[handles]
+
+        winners = np.where(
+            pick_a,
+            np.array([c.choice_a.choice_id for c in pending], dtype=object),
+            np.array([c.choice_b.choice_id for c in pending], dtype=object),
+        ).tolist()
+
+        for conflict, cache_key, winner in zip(
+            pending, pending_keys, winners, strict=True
+        ):
+            self.resolution_cache.put(cache_key, winner)
+            results[conflict.conflict_id] = winner
+
+        return results
+
     def get_performance_metrics(self) -> dict[str, Any]:
         """Get comprehensive performance metrics."""
         return {
             "resolution_metrics": self.metrics,
             "cache_stats": self.resolution_cache.stats(),
-            "memoization_stats": getattr(
-                self.resolve_conflict_optimized, "cache_stats", lambda: {}
-            )(),
             "strategy_registry_stats": self.strategy_registry.get_metrics(),
         }
 
     def clear_caches(self) -> None:
         """Clear all internal caches."""
         self.resolution_cache.clear()
-        if hasattr(self.resolve_conflict_optimized, "clear_cache"):
-            self.resolve_conflict_optimized.clear_cache()
 
 
 # Backward compatibility wrapper
+def _make_noop(name: str, warned: set[str]) -> Callable[..., None]:
+    """Build the no-op stand-in for a stub method, logging its first call."""
+
+    def stub_method(*args, **kwargs):
+        if name not in warned:
+            warned.add(name)
+            logger.debug(
+                "UserChoiceManager method '%s' called on stub. "
+                "Returning None/empty result.",
+                name,
+            )
+        return None
+
+    return stub_method
+
+
 class _UserChoiceManagerStub:
     """Lightweight stub for UserChoiceManager when services are unavailable."""
 
     def __init__(self, db_path: str = "database/user_choices.db"):
         self.db_path = db_path
-        logging.warning(
+        self._noop_cache: dict[str, Callable[..., None]] = {}
+        self._warned: set[str] = set()
+        logger.warning(
             "UserChoiceManager service unavailable. "
             "Using stub implementation with limited functionality."
         )
 
     def __getattr__(self, name):
         """Handle arbitrary method calls safely."""
+        noop_cache = self.__dict__.get("_noop_cache")
+        if noop_cache is None:
+            raise AttributeError(name)
 
-        def stub_method(*args, **kwargs):
-            logging.warning(
-                f"UserChoiceManager method '{name}' called on stub. "
-                f"Returning None/empty result."
-            )
-            return None
-
-        return stub_method
+        noop = noop_cache.get(name)
+        if noop is None:
+            noop = noop_cache.setdefault(name, _make_noop(name, self._warned))
+        return noop
 
 
 class OptimizedUserChoiceManager:
@@ -338,9 +609,9 @@ class OptimizedUserChoiceManager:
                 session_expiry_hours=session_expiry_hours,
             )
         except ImportError as e:
-            logging.warning(
-                f"Failed to import UserChoiceManager: {e}. "
-                f"Using stub implementation."
+            logger.warning(
+                "Failed to import UserChoiceManager: %s. Using stub implementation.",
+                e,
             )
             self.original_manager = _UserChoiceManagerStub(db_path)
 
@@ -373,15 +644,29 @@ def register_conflict_resolver(
     CONFLICT_RESOLUTION_REGISTRY.register(name, resolver_factory)
 
 
+@functools.lru_cache(maxsize=16)
+def _get_default_resolver(
+    kwargs_items: tuple[tuple[str, Any], ...],
+) -> DynamicConflictResolutionEngine:
+    return DynamicConflictResolutionEngine(**dict(kwargs_items))
+
+
 def get_conflict_resolver(
     name: str = "default", **kwargs
 ) -> DynamicConflictResolutionEngine:
-    """Get a conflict resolver instance."""
+    """Get a conflict resolver instance.
+
+    Default resolvers are shared per distinct set of keyword arguments, so
+    their strategy tables and caches are built once.
+    """
     if name == "default":
-        return DynamicConflictResolutionEngine(**kwargs)
+        return _get_default_resolver(tuple(sorted(kwargs.items())))
     return CONFLICT_RESOLUTION_REGISTRY.get(name, **kwargs)
 
 
+get_conflict_resolver.clear_cache = _get_default_resolver.cache_clear
+
+
 # Convenience functions for unified API
 def create_session_for_document(
     manager,  # UserChoiceManager or OptimizedUserChoiceManager
@@ -8,20 +8,32 @@ cached lookups achieve amortized O(1) performance.
 
 from __future__ import annotations
 
-import hashlib
+import functools
+import heapq
+import operator
 import re
+import sys
 import threading
 import time
-from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from re import Pattern
-from typing import Any
+from typing import Any, NamedTuple
+
+import numpy as np
+
+# Optional JIT compilation of the character counting loop
+try:
+    import numba  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None  # type: ignore
+    NUMBA_AVAILABLE = False
 
 from core.dynamic_programming import (
     DynamicRegistry,
     PerformanceMetrics,
     SmartCache,
-    memoize,
     performance_monitor,
 )
 from services.language_detector import LANGUAGE_MAP, LANGUAGE_PATTERNS
@@ -36,6 +48,46 @@ from services.language_detector import LANGUAGE_MAP, LANGUAGE_PATTERNS
 DEFAULT_MIN_TEXT_LENGTH = 10  # Default minimum text length
 
 
+def _count_alphabet_matches(
+    code_points: np.ndarray, alphabet: np.ndarray, char_language_matrix: np.ndarray
+) -> np.ndarray:
+    """Count each language's pattern characters among ``code_points``.
+
+    Args:
+        code_points: Code points of the text, one per character
+        alphabet: Sorted code points of all languages' pattern characters
+        char_language_matrix: (alphabet x language) membership matrix
+
+    Returns:
+        Match counts indexed by language_index
+    """
+    alphabet_size = alphabet.shape[0]
+    histogram = np.zeros(alphabet_size, dtype=np.int64)
+    for code_point in code_points:
+        row = np.searchsorted(alphabet, code_point)
+        if row < alphabet_size and alphabet[row] == code_point:
+            histogram[row] += 1
+
+    counts = np.zeros(char_language_matrix.shape[1], dtype=np.int64)
+    for row in range(alphabet_size):
+        if histogram[row]:
+            counts += histogram[row] * char_language_matrix[row]
+    return counts
+
+
+if NUMBA_AVAILABLE:
+    # Compile eagerly for the exact argument types so the first detection
+    # does not pay JIT latency; cache=True reuses the machine code across runs
+    _count_alphabet_matches = numba.njit(
+        numba.int64[:](
+            numba.types.Array(numba.uint32, 1, "C", readonly=True),
+            numba.uint32[::1],
+            numba.int64[:, ::1],
+        ),
+        cache=True,
+    )(_count_alphabet_matches)
+
+
 @dataclass(frozen=True)
 class CompiledPattern:
     """Pre-compiled language patterns for efficient matching."""
@@ -49,9 +101,43 @@ class CompiledPattern:
     char_list: tuple[str, ...]
     word_pattern_weight: float = 0.7
     char_pattern_weight: float = 0.3
+    word_frozenset: frozenset[str] = field(init=False, repr=False, compare=False)
+    char_variants: frozenset[str] = field(init=False, repr=False, compare=False)
+    normalized_word_weight: float = field(init=False, repr=False, compare=False)
+    normalized_char_weight: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate consistency between regex patterns and corresponding lists."""
+        """Validate the pattern and precompute values used when scoring."""
+        # Set form of word_list for C-level intersection when scoring
+        object.__setattr__(self, "word_frozenset", frozenset(self.word_list))
+        # Case variants mirror chars_regex's IGNORECASE matching, so characters
+        # can be counted without running the regex
+        object.__setattr__(
+            self,
+            "char_variants",
+            frozenset(
+                variant
+                for char in self.char_list
+                for variant in (char, char.lower(), char.upper())
+                if len(variant) == 1
+            ),
+        )
+
+        # Validate and normalize pattern weights to sum to 1
+        if self.word_pattern_weight <= 0 or self.char_pattern_weight <= 0:
+            raise ValueError(
+                f"Pattern weights must be positive: "
+                f"word_pattern_weight={self.word_pattern_weight}, "
+                f"char_pattern_weight={self.char_pattern_weight}"
+            )
+        weight_sum = self.word_pattern_weight + self.char_pattern_weight
+        object.__setattr__(
+            self, "normalized_word_weight", self.word_pattern_weight / weight_sum
+        )
+        object.__setattr__(
+            self, "normalized_char_weight", self.char_pattern_weight / weight_sum
+        )
+
         # Validate words_regex and word_list consistency
         if self.words_regex is None and len(self.word_list) > 0:
             raise ValueError(
@@ -68,27 +154,59 @@ class CompiledPattern:
                 f"provided, char_list must be empty."
             )
 
-    def compute_score(self, text: str, word_set: set[str]) -> LanguageScore:
-        """Compute language score for given text."""
-        # Validate and normalize pattern weights
-        if self.word_pattern_weight <= 0 or self.char_pattern_weight <= 0:
-            raise ValueError(
-                f"Pattern weights must be positive: "
-                f"word_pattern_weight={self.word_pattern_weight}, "
-                f"char_pattern_weight={self.char_pattern_weight}"
-            )
-
-        # Normalize weights to sum to 1
-        weight_sum = self.word_pattern_weight + self.char_pattern_weight
-        normalized_word_weight = self.word_pattern_weight / weight_sum
-        normalized_char_weight = self.char_pattern_weight / weight_sum
-
-        word_matches = sum(1 for word in self.word_list if word in word_set)
-        # Guard against None chars_regex before calling findall
-        char_matches = (
-            len(self.chars_regex.findall(text)) if self.chars_regex is not None else 0
+    def compute_score(
+        self,
+        text: str,
+        word_set: set[str],
+        char_matches: int | None = None,
+        word_matches: int | None = None,
+    ) -> LanguageScore:
+        """Compute language score for given text.
+
+        ``char_matches`` and ``word_matches`` may be supplied by a caller that
+        has already counted this language's characters and distinct words in
+        ``text``; otherwise they are counted here.
+        """
+        word_matches, char_matches, word_score, char_score, combined_score = (
+            self._score_parts(text, word_set, char_matches, word_matches)
+        )
+        return LanguageScore(
+            language=self.language,
+            confidence=combined_score,
+            word_matches=word_matches,
+            char_matches=char_matches,
+            word_score=word_score,
+            char_score=char_score,
         )
 
+    def compute_confidence(
+        self,
+        text: str,
+        word_set: set[str],
+        char_matches: int | None = None,
+        word_matches: int | None = None,
+    ) -> float:
+        """Compute only the combined confidence, without a LanguageScore."""
+        return self._score_parts(text, word_set, char_matches, word_matches)[-1]
+
+    def _score_parts(
+        self,
+        text: str,
+        word_set: set[str],
+        char_matches: int | None,
+        word_matches: int | None,
+    ) -> tuple[int, int, float, float, float]:
+        """Return (word_matches, char_matches, word_score, char_score, confidence)."""
+        if word_matches is None:
+            # Distinct pattern words found at word boundaries in the text
+            word_matches = (
+                len({word.lower() for word in self.words_regex.findall(text)})
+                if self.words_regex is not None
+                else 0
+            )
+        if char_matches is None:
+            char_matches = sum(map(text.count, self.char_variants))
+
         # Get counts for score calculation
         word_count = len(word_set)
         char_count = len(text)
@@ -107,20 +225,14 @@ class CompiledPattern:
 
         # Combine scores using precomputed normalized weights
         combined_score = (
-            normalized_word_weight * word_score + normalized_char_weight * char_score
+            self.normalized_word_weight * word_score
+            + self.normalized_char_weight * char_score
         )
 
-        return LanguageScore(
-            language=self.language,
-            confidence=combined_score,
-            word_matches=word_matches,
-            char_matches=char_matches,
-            word_score=word_score,
-            char_score=char_score,
-        )
+        return word_matches, char_matches, word_score, char_score, combined_score
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageScore:
     """Score for a language detection result."""
 
@@ -137,15 +249,22 @@ class LanguageScore:
         return self.confidence
 
 
-@dataclass
+@dataclass(slots=True)
 class TextFingerprint:
-    """Fingerprint of text for pattern matching."""
+    """Fingerprint of text for pattern matching.
 
+    The normalized text is encoded once; its code points are kept for the
+    character counting kernel. The character histogram is kept as two parallel
+    arrays: the sorted unique code points and their occurrence counts.
+    """
+
+    normalized_text: str
     word_set: set[str]
-    char_histogram: dict[str, int]
+    code_points: np.ndarray = field(repr=False)
+    char_codes: np.ndarray
+    char_counts: np.ndarray
     length: int
     word_count: int
-    unique_chars: set[str]
     first_100_chars: str
 
     @classmethod
@@ -155,74 +274,71 @@ class TextFingerprint:
         words = normalized_text.split()
         word_set = set(words)
 
-        char_histogram = defaultdict(int)
-        for char in normalized_text:
-            char_histogram[char] += 1
+        # Count characters in C: UTF-32 gives one code point per array element
+        code_points = np.frombuffer(
+            normalized_text.encode("utf-32-le", "surrogatepass"), dtype="<u4"
+        )
+        char_codes, char_counts = np.unique(code_points, return_counts=True)
 
         return cls(
+            normalized_text=normalized_text,
             word_set=word_set,
-            char_histogram=dict(char_histogram),
+            code_points=code_points,
+            char_codes=char_codes,
+            char_counts=char_counts,
             length=len(normalized_text),
             word_count=len(words),
-            unique_chars=set(normalized_text),
             first_100_chars=normalized_text[:100],
         )
 
-    def to_cache_key(self) -> str:
-        """Create compact deterministic cache key with SHA-256-based signature.
+    @property
+    def char_histogram(self) -> dict[str, int]:
+        """Character occurrence counts, built on demand."""
+        return dict(
+            zip(
+                map(chr, self.char_codes.tolist()),
+                self.char_counts.tolist(),
+                strict=True,
+            )
+        )
 
-        Uses streaming hash construction with aggregated fingerprints to avoid
-        expensive operations while maintaining uniqueness:
-        - Hashed word count aggregates instead of sorting large word sets
-        - Proper suffix derivation from available text data
-        - SHA-256 with 32-char truncation for stronger collision resistance
-        - Streaming hash construction to avoid heavy concatenation
+    @property
+    def unique_chars(self) -> set[str]:
+        """Distinct characters of the normalized text."""
+        return set(map(chr, self.char_codes.tolist()))
+
+    def to_cache_key(self) -> int:
+        """Create a compact 64-bit cache key for the fingerprint.
+
+        The result caches live in this process, so the built-in ``hash`` is
+        enough: it is a fast non-cryptographic 64-bit hash, and str hashes are
+        cached on the string objects. The key covers the length and word
+        count, the character histogram, the word set and the leading text.
         """
-        # Initialize SHA-256 hasher for streaming
-        hasher = hashlib.sha256()
-
-        # Stream basic metrics (stable, no sorting required)
-        hasher.update(str(self.length).encode())
-        hasher.update(b"|")
-        hasher.update(str(self.word_count).encode())
-        hasher.update(b"|")
-
-        # Stream char signature - limited and sorted for determinism
-        char_signature = "".join(sorted(self.unique_chars))[:32]  # Limit to 32 chars
-        hasher.update(char_signature.encode())
-        hasher.update(b"|")
-
-        # Stream aggregated word fingerprint (hash of word set to avoid sorting)
-        word_hasher = hashlib.sha256()
-        # Sort only for determinism, but hash the result to avoid large signatures
-        for word in sorted(self.word_set):
-            word_hasher.update(word.encode())
-            word_hasher.update(b"\x00")  # Separator
-        word_fingerprint = word_hasher.hexdigest()[:16]  # Compact word summary
-        hasher.update(word_fingerprint.encode())
-        hasher.update(b"|")
-
-        # Stream prefix data from stored first_100_chars
-        prefix_data = self.first_100_chars[:50]  # First 50 chars
-        hasher.update(prefix_data.encode())
-        hasher.update(b"|")
-
-        # Stream proper suffix data - derive from end of first_100_chars if available
-        # This is the actual suffix data from the stored snippet
-        if len(self.first_100_chars) >= 20:
-            suffix_data = self.first_100_chars[-20:]  # Last 20 chars of stored snippet
-        else:
-            # For very short text, use placeholder based on length
-            suffix_data = f"short_{len(self.first_100_chars)}"
-        hasher.update(suffix_data.encode())
-        hasher.update(b"|")
+        # XOR is order-independent, so the set needs no sorting; set members
+        # are distinct, so no two word hashes cancel out
+        word_fingerprint = functools.reduce(operator.xor, map(hash, self.word_set), 0)
+
+        return hash(
+            (
+                self.length,
+                self.word_count,
+                self.char_codes.tobytes(),
+                self.char_counts.tobytes(),
+                word_fingerprint,
+                self.first_100_chars,
+            )
+        )
+
 
-        # Stream character diversity metric (stable float representation)
-        char_diversity = len(self.unique_chars) / max(1, self.length)
-        hasher.update(f"{char_diversity:.6f}".encode())
+class _ScoreVectors(NamedTuple):
+    """Per-language scoring arrays, indexed by language_index."""
 
-        # Return SHA-256 hex truncated to 32 chars for collision resistance
-        return hasher.hexdigest()[:32]
+    word_matches: np.ndarray
+    char_matches: np.ndarray
+    word_scores: np.ndarray
+    char_scores: np.ndarray
+    confidence: np.ndarray
 
 
 class DynamicLanguageDetector:
@@ -234,6 +350,8 @@ class DynamicLanguageDetector:
         result_cache_size: int = 512,
         confidence_threshold: float = 0.5,
         min_text_length: int = DEFAULT_MIN_TEXT_LENGTH,
+        metrics_enabled: bool = True,
+        metrics_sample_rate: int = 1,
     ):
         self.confidence_threshold = confidence_threshold
         self.min_text_length = max(1, min_text_length)  # Ensure minimum of 1
@@ -242,17 +360,40 @@ class DynamicLanguageDetector:
         self.pattern_cache: SmartCache[str, CompiledPattern] = SmartCache(
             max_size=pattern_cache_size
         )
-        self.result_cache: SmartCache[str, str] = SmartCache(
+        self.result_cache: SmartCache[int, str] = SmartCache(
             max_size=result_cache_size, ttl_seconds=300  # 5 minute TTL for results
         )
 
-        # Pre-compiled patterns
-        self.compiled_patterns: dict[str, CompiledPattern] = {}
+        # Pre-compiled patterns, indexed by language_index
+        self._patterns: tuple[CompiledPattern, ...] = ()
+        self._language_names: tuple[str, ...] = ()
         self.language_index: dict[str, int] = {}
 
+        # Fused character table: sorted code points of every language's
+        # pattern characters, and a (code point x language) membership matrix
+        self._alphabet_codes = np.empty(0, dtype=np.uint32)
+        self._char_language_matrix = np.empty((0, 0), dtype=np.int64)
+
+        # Fused word table: one regex over every language's pattern words, and
+        # each word mapped to a row of a (word x language) membership matrix
+        self._words_regex: Pattern[str] | None = None
+        self._word_rows: dict[str, int] = {}
+        self._word_language_matrix = np.empty((0, 0), dtype=np.int64)
+
+        # Per-language scoring weights, indexed by language_index
+        self._word_weights = np.empty(0)
+        self._char_weights = np.empty(0)
+        self._normalized_word_weights = np.empty(0)
+        self._normalized_char_weights = np.empty(0)
+
         # Performance tracking
         self.metrics = PerformanceMetrics("dynamic_language_detection")
         self.pattern_metrics = PerformanceMetrics("pattern_compilation")
+        # Detection timing can be turned off, or sampled 1-in-N; sampling
+        # trades metric precision for throughput on cache-hit-heavy loads
+        self._metrics_enabled = metrics_enabled
+        self._metrics_sample_rate = max(1, metrics_sample_rate)
+        self._detect_count = 0
 
         # Thread safety
         self._lock = threading.RLock()
@@ -261,6 +402,11 @@ class DynamicLanguageDetector:
         # Initialize patterns
         self._initialize_patterns()
 
+    @property
+    def compiled_patterns(self) -> dict[str, CompiledPattern]:
+        """Compiled patterns keyed by language name."""
+        return dict(zip(self._language_names, self._patterns, strict=True))
+
     def _is_text_valid_for_detection(self, text: str) -> bool:
         """Check if text is valid for language detection.
 
@@ -285,11 +431,21 @@ class DynamicLanguageDetector:
             start_time = time.perf_counter()
 
             try:
-                # Compile patterns for each language
-                for language, pattern_data in LANGUAGE_PATTERNS.items():
-                    compiled = self._compile_pattern(language, pattern_data)
-                    self.compiled_patterns[language] = compiled
-                    self.language_index[language] = len(self.language_index)
+                # Compile patterns for each language; a language's position
+                # in these tuples is its language_index
+                names = tuple(map(sys.intern, LANGUAGE_PATTERNS))
+                self._patterns = tuple(
+                    self._compile_pattern(language, LANGUAGE_PATTERNS[language])
+                    for language in names
+                )
+                self._language_names = names
+                self.language_index = {
+                    language: index for index, language in enumerate(names)
+                }
+
+                self._build_char_table()
+                self._build_word_table()
+                self._build_weight_vectors()
 
                 duration_ms = (time.perf_counter() - start_time) * 1000
                 self.pattern_metrics.record_operation(duration_ms)
@@ -300,6 +456,174 @@ class DynamicLanguageDetector:
                 self.pattern_metrics.record_operation(duration_ms)
                 raise e
 
+    def _build_char_table(self) -> None:
+        """Build the table used to count every language's characters at once."""
+        char_languages: dict[int, set[int]] = {}
+        for index, pattern in enumerate(self._patterns):
+            for char in pattern.char_variants:
+                char_languages.setdefault(ord(char), set()).add(index)
+
+        codes = sorted(char_languages)
+        matrix = np.zeros((len(codes), len(self._patterns)), dtype=np.int64)
+        for row, code in enumerate(codes):
+            matrix[row, list(char_languages[code])] = 1
+
+        self._alphabet_codes = np.array(codes, dtype=np.uint32)
+        self._char_language_matrix = matrix
+
+    def _build_word_table(self) -> None:
+        """Build the table used to count every language's words at once."""
+        word_languages: dict[str, set[int]] = {}
+        for index, pattern in enumerate(self._patterns):
+            for word in pattern.word_frozenset:
+                word_languages.setdefault(word.lower(), set()).add(index)
+
+        matrix = np.zeros(
+            (len(word_languages), len(self._patterns)), dtype=np.int64
+        )
+        for row, languages in enumerate(word_languages.values()):
+            matrix[row, list(languages)] = 1
+
+        # Words are shared between languages, so the regex only finds words;
+        # the matrix attributes each one to all of its languages
+        self._words_regex = (
+            re.compile(
+                r"\b(?:" + "|".join(map(re.escape, word_languages)) + r")\b",
+                re.IGNORECASE,
+            )
+            if word_languages
+            else None
+        )
+        self._word_rows = {word: row for row, word in enumerate(word_languages)}
+        self._word_language_matrix = matrix
+
+    def _build_weight_vectors(self) -> None:
+        """Collect per-language scoring weights into arrays."""
+        patterns = self._patterns
+        self._word_weights = np.array([p.word_weight for p in patterns], dtype=float)
+        self._char_weights = np.array([p.char_weight for p in patterns], dtype=float)
+        self._normalized_word_weights = np.array(
+            [p.normalized_word_weight for p in patterns], dtype=float
+        )
+        self._normalized_char_weights = np.array(
+            [p.normalized_char_weight for p in patterns], dtype=float
+        )
+
+    def _match_word_rows(self, text: str) -> list[int]:
+        """Find the word-table rows of the distinct pattern words in ``text``."""
+        if self._words_regex is None:
+            return []
+        word_rows = self._word_rows
+        matched = {word.lower() for word in self._words_regex.findall(text)}
+        return [word_rows[word] for word in matched]
+
+    def _count_word_matches(self, text: str) -> np.ndarray:
+        """Count each language's distinct pattern words in ``text`` in one scan.
+
+        Returns an array indexed by ``language_index``.
+        """
+        rows = np.asarray(self._match_word_rows(text), dtype=np.intp)
+        return self._word_language_matrix[rows].sum(axis=0)
+
+    def _count_char_matches(self, text: str) -> np.ndarray:
+        """Count each language's pattern characters in ``text`` in one pass.
+
+        Returns an array indexed by ``language_index``.
+        """
+        code_points = np.frombuffer(
+            text.encode("utf-32-le", "surrogatepass"), dtype="<u4"
+        )
+        if NUMBA_AVAILABLE:
+            return _count_alphabet_matches(
+                code_points, self._alphabet_codes, self._char_language_matrix
+            )
+
+        codes, counts = np.unique(code_points, return_counts=True)
+        return self._count_histogram_matches(codes, counts)
+
+    def _count_fingerprint_char_matches(
+        self, fingerprint: TextFingerprint
+    ) -> np.ndarray:
+        """Count each language's pattern characters using the fingerprint's arrays.
+
+        Reuses the code points and histogram computed when the fingerprint was
+        created, so the text is not encoded again.
+        """
+        if NUMBA_AVAILABLE:
+            return _count_alphabet_matches(
+                fingerprint.code_points,
+                self._alphabet_codes,
+                self._char_language_matrix,
+            )
+        return self._count_histogram_matches(
+            fingerprint.char_codes, fingerprint.char_counts
+        )
+
+    def _count_histogram_matches(
+        self, codes: np.ndarray, counts: np.ndarray
+    ) -> np.ndarray:
+        """Map a (code point, count) histogram to per-language match counts."""
+        alphabet = self._alphabet_codes
+        rows = np.searchsorted(alphabet, codes)
+        in_alphabet = rows < len(alphabet)
+        in_alphabet[in_alphabet] = alphabet[rows[in_alphabet]] == codes[in_alphabet]
+        return counts[in_alphabet] @ self._char_language_matrix[rows[in_alphabet]]
+
+    def _count_word_matches_batch(self, texts: list[str]) -> np.ndarray:
+        """Count each language's distinct pattern words for many texts at once.
+
+        Returns a (text x language) array, columns indexed by ``language_index``.
+        """
+        owners: list[int] = []
+        rows: list[int] = []
+        for owner, text in enumerate(texts):
+            matched = self._match_word_rows(text)
+            owners.extend([owner] * len(matched))
+            rows.extend(matched)
+
+        counts = np.zeros((len(texts), len(self._language_names)), dtype=np.int64)
+        np.add.at(
+            counts,
+            np.asarray(owners, dtype=np.intp),
+            self._word_language_matrix[np.asarray(rows, dtype=np.intp)],
+        )
+        return counts
+
+    def _count_char_matches_batch(
+        self, code_point_arrays: list[np.ndarray]
+    ) -> np.ndarray:
+        """Count each language's pattern characters for many texts in one scan.
+
+        The texts' code points are concatenated and scanned together; each code
+        point is attributed back to its text by position. Returns a
+        (text x language) array, columns indexed by ``language_index``.
+        """
+        text_count = len(code_point_arrays)
+        code_points = (
+            np.concatenate(code_point_arrays)
+            if code_point_arrays
+            else np.empty(0, dtype=np.uint32)
+        )
+        lengths = np.fromiter(
+            map(len, code_point_arrays), dtype=np.intp, count=text_count
+        )
+        owners = np.repeat(np.arange(text_count), lengths)
+
+        alphabet = self._alphabet_codes
+        rows = np.searchsorted(alphabet, code_points)
+        in_alphabet = rows < len(alphabet)
+        in_alphabet[in_alphabet] = (
+            alphabet[rows[in_alphabet]] == code_points[in_alphabet]
+        )
+
+        # Per-text histogram over the fused alphabet, then map to languages
+        alphabet_size = len(alphabet)
+        histogram = np.bincount(
+            owners[in_alphabet] * alphabet_size + rows[in_alphabet],
+            minlength=text_count * alphabet_size,
+        ).reshape(text_count, alphabet_size)
+        return histogram @ self._char_language_matrix
+
     def _compile_pattern(
         self, language: str, pattern_data: dict[str, Any]
     ) -> CompiledPattern:
@@ -340,7 +664,6 @@ class DynamicLanguageDetector:
             char_pattern_weight=char_pattern_weight,
         )
 
-    @memoize(cache_size=256, ttl_seconds=300)
     def detect_language_optimized(
         self, text: str, min_length: int | None = None
     ) -> str:
@@ -353,7 +676,10 @@ class DynamicLanguageDetector:
         Returns:
             Detected language name or "Unknown"
         """
-        start_time = time.perf_counter()
+        count = self._detect_count
+        self._detect_count = count + 1
+        timed = self._metrics_enabled and count % self._metrics_sample_rate == 0
+        start_time = time.perf_counter() if timed else 0.0
 
         try:
             # Early validation with configurable minimum length
@@ -363,37 +689,24 @@ class DynamicLanguageDetector:
             if not text or len(text.strip()) < effective_min_length:
                 return "Unknown"
 
-            # Create text fingerprint
-            fingerprint = TextFingerprint.create(text)
-            cache_key = fingerprint.to_cache_key()
-
-            # Check result cache
+            # Check result cache before doing any per-text work
+            cache_key = hash(text)
             cached_result = self.result_cache.get(cache_key)
             if cached_result is not self.result_cache.MISS:
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                self.metrics.record_operation(duration_ms, cache_hit=True)
+                if timed:
+                    self._record_timing(start_time, cache_hit=True)
                 return cached_result
 
-            # Compute scores for all languages
-            language_scores = self._compute_all_scores(fingerprint)
-
-            # Find best language
-            best_language = "Unknown"
-            best_score = 0.0
-
-            for score in language_scores.values():
-                if (
-                    score.confidence > best_score
-                    and score.confidence >= self.confidence_threshold
-                ):
-                    best_score = score.confidence
-                    best_language = score.language
+            # Score all languages and pick the best one
+            fingerprint = TextFingerprint.create(text)
+            confidence = self._compute_score_vectors(fingerprint).confidence
+            best_language, _ = self._best_language_from_scores(confidence)
 
             # Cache result
             self.result_cache.put(cache_key, best_language)
 
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            self.metrics.record_operation(duration_ms, cache_hit=False)
+            if timed:
+                self._record_timing(start_time, cache_hit=False)
 
             return best_language
 
@@ -401,52 +714,137 @@ class DynamicLanguageDetector:
             import logging
             logger = logging.getLogger(__name__)
             logger.error("Language detection failed: %s", str(e), exc_info=True)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            self.metrics.record_operation(duration_ms, cache_hit=False)
+            if timed:
+                self._record_timing(start_time, cache_hit=False)
             return "Unknown"
 
+    def _record_timing(self, start_time: float, cache_hit: bool) -> None:
+        """Record a sampled detection duration."""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        self.metrics.record_operation(duration_ms, cache_hit=cache_hit)
+
     def _compute_all_scores(
         self, fingerprint: TextFingerprint
     ) -> dict[str, LanguageScore]:
         """Compute scores for all languages using optimized patterns."""
-        return self._compute_scores_sequential(fingerprint)
+        vectors = self._compute_score_vectors(fingerprint)
+        rows = zip(
+            self._language_names,
+            vectors.confidence.tolist(),
+            vectors.word_matches.tolist(),
+            vectors.char_matches.tolist(),
+            vectors.word_scores.tolist(),
+            vectors.char_scores.tolist(),
+            strict=True,
+        )
+        return {row[0]: LanguageScore(*row) for row in rows}
 
-    def _compute_scores_sequential(
-        self, fingerprint: TextFingerprint
-    ) -> dict[str, LanguageScore]:
-        """Compute scores using sequential pattern matching."""
-        scores = {}
+    def _compute_score_vectors(self, fingerprint: TextFingerprint) -> _ScoreVectors:
+        """Score every language at once; arrays are indexed by language_index.
 
-        # Create full text for character matching
-        full_text = " ".join(fingerprint.word_set)
+        Same arithmetic as CompiledPattern.compute_score, applied elementwise.
+        """
+        return self._score_counts(
+            self._count_word_matches(fingerprint.normalized_text),
+            self._count_fingerprint_char_matches(fingerprint),
+            len(fingerprint.word_set),
+            fingerprint.length,
+        )
 
-        for language, pattern in self.compiled_patterns.items():
-            score = pattern.compute_score(full_text, fingerprint.word_set)
-            scores[language] = score
+    def _score_counts(
+        self,
+        word_matches: np.ndarray,
+        char_matches: np.ndarray,
+        word_count: int | np.ndarray,
+        char_count: int | np.ndarray,
+    ) -> _ScoreVectors:
+        """Turn match counts into scores for one text or a batch of texts.
+
+        Match counts have languages on the last axis; ``word_count`` and
+        ``char_count`` hold one value per text. Texts with a zero count score
+        zero for that component, as in CompiledPattern.compute_score.
+        """
+        word_count = np.asarray(word_count, dtype=float)[..., np.newaxis]
+        char_count = np.asarray(char_count, dtype=float)[..., np.newaxis]
+
+        word_weighted = word_matches * self._word_weights
+        word_scores = (
+            np.divide(
+                word_weighted,
+                word_count,
+                out=np.zeros_like(word_weighted),
+                where=word_count > 0,
+            )
+            * 100
+        )
+        char_weighted = char_matches * self._char_weights
+        char_scores = (
+            np.divide(
+                char_weighted,
+                char_count,
+                out=np.zeros_like(char_weighted),
+                where=char_count > 0,
+            )
+            * 100
+        )
+        confidence = (
+            self._normalized_word_weights * word_scores
+            + self._normalized_char_weights * char_scores
+        )
 
-        return scores
+        return _ScoreVectors(
+            word_matches, char_matches, word_scores, char_scores, confidence
+        )
+
+    def _best_language_from_scores(self, combined: np.ndarray) -> tuple[str, float]:
+        """Return the top-scoring language and its confidence.
+
+        Ties go to the lowest language_index. The language is "Unknown" when
+        the best confidence is zero or below the threshold.
+        """
+        if combined.size == 0:
+            return "Unknown", 0.0
+
+        best_index = int(combined.argmax())
+        best_confidence = float(combined[best_index])
+        if best_confidence > 0 and best_confidence >= self.confidence_threshold:
+            return self._language_names[best_index], best_confidence
+        return "Unknown", best_confidence
+
+    def _best_languages_from_matrix(self, combined: np.ndarray) -> list[str]:
+        """Row-wise _best_language_from_scores over a (text x language) array."""
+        if combined.size == 0:
+            return ["Unknown"] * len(combined)
+
+        best_indices = combined.argmax(axis=1)
+        best_confidence = combined[np.arange(len(combined)), best_indices]
+        accepted = (best_confidence > 0) & (
+            best_confidence >= self.confidence_threshold
+        )
+        names = self._language_names
+        return [
+            names[index] if ok else "Unknown"
+            for index, ok in zip(best_indices.tolist(), accepted.tolist(), strict=True)
+        ]
 
     @performance_monitor("batch_language_detection")
     def detect_languages_batch(self, texts: list[str]) -> list[str]:
         """Batch language detection for improved throughput."""
         results = []
 
-        # Pre-process all texts
-        fingerprints = [TextFingerprint.create(text) for text in texts]
-
-        # Check cache for all fingerprints first
+        # Check cache for all texts first; only misses are fingerprinted
         cache_hits = 0
         cache_misses = []
 
-        for i, fingerprint in enumerate(fingerprints):
-            cache_key = fingerprint.to_cache_key()
+        for i, text in enumerate(texts):
+            cache_key = hash(text)
             cached_result = self.result_cache.get(cache_key)
 
             if cached_result is not self.result_cache.MISS:
                 results.append(cached_result)
                 cache_hits += 1
             else:
-                cache_misses.append((i, fingerprint))
+                cache_misses.append((i, cache_key, TextFingerprint.create(text)))
                 results.append(None)  # Placeholder
 
         # Process cache misses in batch
@@ -456,27 +854,35 @@ class DynamicLanguageDetector:
         return results
 
     def _process_batch_sequential(
-        self, cache_misses: list[tuple[int, TextFingerprint]], results: list[str]
+        self,
+        cache_misses: list[tuple[int, int, TextFingerprint]],
+        results: list[str],
     ) -> None:
-        """Process batch misses sequentially."""
-        for index, fingerprint in cache_misses:
-            language_scores = self._compute_all_scores(fingerprint)
-
-            best_language = "Unknown"
-            best_score = 0.0
-
-            for score in language_scores.values():
-                if (
-                    score.confidence > best_score
-                    and score.confidence >= self.confidence_threshold
-                ):
-                    best_score = score.confidence
-                    best_language = score.language
+        """Score all batch misses together and fill in their results.
 
+        Word and character counts for every miss are gathered into
+        (text x language) arrays, so all texts are scored in one pass.
+        """
+        fingerprints = [fingerprint for _, _, fingerprint in cache_misses]
+        word_sets = [fingerprint.word_set for fingerprint in fingerprints]
+        code_points = [fingerprint.code_points for fingerprint in fingerprints]
+
+        confidence = self._score_counts(
+            self._count_word_matches_batch(
+                [fingerprint.normalized_text for fingerprint in fingerprints]
+            ),
+            self._count_char_matches_batch(code_points),
+            np.fromiter(map(len, word_sets), dtype=float, count=len(word_sets)),
+            np.fromiter(map(len, code_points), dtype=float, count=len(code_points)),
+        ).confidence
+        best_languages = self._best_languages_from_matrix(confidence)
+
+        for (index, cache_key, _), best_language in zip(
+            cache_misses, best_languages, strict=True
+        ):
             results[index] = best_language
 
             # Cache the result
-            cache_key = fingerprint.to_cache_key()
             self.result_cache.put(cache_key, best_language)
 
     def detect_language_with_confidence(
@@ -500,21 +906,8 @@ class DynamicLanguageDetector:
             return "Unknown", 0.0
 
         fingerprint = TextFingerprint.create(text)
-        language_scores = self._compute_all_scores(fingerprint)
-
-        best_language = "Unknown"
-        best_confidence = 0.0
-
-        for score in language_scores.values():
-            if score.confidence > best_confidence:
-                best_confidence = score.confidence
-                best_language = (
-                    score.language
-                    if score.confidence >= self.confidence_threshold
-                    else "Unknown"
-                )
-
-        return best_language, best_confidence
+        confidence = self._compute_score_vectors(fingerprint).confidence
+        return self._best_language_from_scores(confidence)
 
     def get_language_scores(
         self, text: str, min_length: int | None = None
@@ -544,13 +937,13 @@ class DynamicLanguageDetector:
         fingerprint = TextFingerprint.create(text)
         language_scores = self._compute_all_scores(fingerprint)
 
-        # Sort by confidence
-        sorted_scores = sorted(
-            language_scores.values(), key=lambda s: s.confidence, reverse=True
+        # Only the top two are ranked; nlargest keeps sorted()'s tie order
+        top_scores = heapq.nlargest(
+            2, language_scores.values(), key=operator.attrgetter("confidence")
         )
 
-        best_score = sorted_scores[0] if sorted_scores else None
-        second_best = sorted_scores[1] if len(sorted_scores) > 1 else None
+        best_score = top_scores[0] if top_scores else None
+        second_best = top_scores[1] if len(top_scores) > 1 else None
 
         confidence_gap = 0.0
         if best_score and second_best:
@@ -562,17 +955,22 @@ class DynamicLanguageDetector:
             else "Unknown",
             "confidence": best_score.confidence if best_score else 0.0,
             "confidence_gap": confidence_gap,
-            "all_scores": {score.language: score.confidence for score in sorted_scores},
+            "all_scores": {
+                language: score.confidence
+                for language, score in language_scores.items()
+            },
             "word_matches": {
-                score.language: score.word_matches for score in sorted_scores
+                language: score.word_matches
+                for language, score in language_scores.items()
             },
             "char_matches": {
-                score.language: score.char_matches for score in sorted_scores
+                language: score.char_matches
+                for language, score in language_scores.items()
             },
             "text_stats": {
                 "length": fingerprint.length,
                 "word_count": fingerprint.word_count,
-                "unique_chars": len(fingerprint.unique_chars),
+                "unique_chars": len(fingerprint.char_codes),
             },
             "detection_quality": "high"
             if confidence_gap > 1.0
@@ -591,11 +989,8 @@ class DynamicLanguageDetector:
                 "result_cache": self.result_cache.stats(),
             },
             "optimization_status": {
-                "patterns_compiled": len(self.compiled_patterns),
+                "patterns_compiled": len(self._patterns),
             },
-            "memoization_stats": getattr(
-                self.detect_language_optimized, "cache_stats", lambda: {}
-            )(),
         }
 
     def benchmark_vs_original(
@@ -615,9 +1010,12 @@ class DynamicLanguageDetector:
         start = time.perf_counter()
         for _ in range(iterations):
             for text in test_texts:
-                # Simulate original approach by bypassing cache
+                # Simulate original approach by bypassing cache; detection
+                # needs only the confidences, not per-language LanguageScores
                 fingerprint = TextFingerprint.create(text)
-                self._compute_all_scores(fingerprint)
+                self._best_language_from_scores(
+                    self._compute_score_vectors(fingerprint).confidence
+                )
         uncached_time = time.perf_counter() - start
 
         return {
@@ -636,12 +1034,10 @@ class DynamicLanguageDetector:
         """Clear all internal caches."""
         self.pattern_cache.clear()
         self.result_cache.clear()
-        if hasattr(self.detect_language_optimized, "clear_cache"):
-            self.detect_language_optimized.clear_cache()
 
     def get_supported_languages(self) -> list[str]:
         """Get list of supported languages."""
-        return list(self.compiled_patterns.keys())
+        return list(self._language_names)
 
     def update_confidence_threshold(self, threshold: float) -> None:
         """Update confidence threshold and clear relevant caches."""
@@ -671,6 +1067,29 @@ def _get_language_detector():
     return _language_detector
 
 
+_default_dynamic_detector: DynamicLanguageDetector | None = None
+# Thread-safe lock for lazy default DynamicLanguageDetector initialization
+_default_dynamic_detector_lock = threading.Lock()
+
+
+def _get_default_dynamic_detector() -> DynamicLanguageDetector:
+    """Thread-safe lazy singleton for the shared DynamicLanguageDetector.
+
+    Pattern compilation and table building happen once per process rather
+    than once per OptimizedLanguageDetector.
+    """
+    global _default_dynamic_detector
+
+    # First check without locking for performance
+    if _default_dynamic_detector is None:
+        # Double-checked locking pattern
+        with _default_dynamic_detector_lock:
+            if _default_dynamic_detector is None:
+                _default_dynamic_detector = DynamicLanguageDetector()
+
+    return _default_dynamic_detector
+
+
 class OptimizedLanguageDetector:
     """Drop-in replacement for LanguageDetector with dynamic programming optimizations."""
 
@@ -683,7 +1102,7 @@ class OptimizedLanguageDetector:
             original_detector: Instance of LanguageDetector for file-based detection.
                               Defaults to new LanguageDetector() instance.
             dynamic_detector: Instance of DynamicLanguageDetector for optimized detection.
-                             Defaults to new DynamicLanguageDetector() instance.
+                             Defaults to a DynamicLanguageDetector shared by the process.
             language_map: Language mapping dictionary. Defaults to LANGUAGE_MAP constant.
         """
         # Use provided instances or create defaults
@@ -693,7 +1112,7 @@ class OptimizedLanguageDetector:
             original_detector = LanguageDetector()
 
         if dynamic_detector is None:
-            dynamic_detector = DynamicLanguageDetector()
+            dynamic_detector = _get_default_dynamic_detector()
 
         if language_map is None:
             language_map = LANGUAGE_MAP
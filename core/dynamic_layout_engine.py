@@ -7,23 +7,44 @@ and performance optimization for layout preservation decisions.
 
 from __future__ import annotations
 
+import functools
 import itertools
 import logging
+import os
 import time
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+import numpy as np
+
+# Optional JIT compilation of the batch strategy kernels
+try:
+    import numba  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None  # type: ignore
+    NUMBA_AVAILABLE = False
 
 from core.dynamic_programming import (
     PerformanceMetrics,
     StrategyPattern,
     StrategyRegistry,
     get_registry,
-    memoize,
     performance_monitor,
 )
 
+# Per-call strategy timing is opt-in via PL_METRICS
+_METRICS_ENABLED = os.getenv("PL_METRICS", "0").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
 
 @contextmanager
 def time_operation(
@@ -101,30 +122,25 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-class StrategyKey:
+class _FitParameters(NamedTuple):
+    """The FitAnalysis fields that strategy builders read."""
+
+    required_scale_for_single_line: float
+    lines_needed: int
+    max_lines: int
+
+
+class StrategyKey(NamedTuple):
     """Immutable key for strategy lookup table."""
 
-    def __init__(
-        self,
-        can_fit_unchanged: bool,
-        can_scale_single_line: bool,
-        can_wrap_within_height: bool,
-        sufficient_lines: bool,
-    ):
-        self.can_fit_unchanged = can_fit_unchanged
-        self.can_scale_single_line = can_scale_single_line
-        self.can_wrap_within_height = can_wrap_within_height
-        self.sufficient_lines = sufficient_lines
-        self._hash = hash(self.to_tuple())
+    can_fit_unchanged: bool
+    can_scale_single_line: bool
+    can_wrap_within_height: bool
+    sufficient_lines: bool
 
     def to_tuple(self) -> tuple[bool, bool, bool, bool]:
-        """Convert to tuple for hashing and comparison."""
-        return (
-            self.can_fit_unchanged,
-            self.can_scale_single_line,
-            self.can_wrap_within_height,
-            self.sufficient_lines,
-        )
+        """Convert to a plain tuple."""
+        return tuple(self)
 
     def to_int(self) -> int:
         """Convert to integer bit mask for ultra-fast lookup."""
@@ -135,69 +151,339 @@ class StrategyKey:
             | (self.sufficient_lines << 0)
         )
 
-    def __hash__(self) -> int:
-        return self._hash
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, StrategyKey):
-            return False
-        return self.to_tuple() == other.to_tuple()
+# LayoutStrategy is a frozen value object, so the "fits unchanged" result is
+# shared rather than rebuilt; callers must not mutate returned strategies
+_NONE_STRATEGY = LayoutStrategy(type=StrategyType.NONE, font_scale=1.0, wrap_lines=1)
 
-    def __repr__(self) -> str:
-        return f"StrategyKey({self.to_tuple()})"
+
+def _build_none(
+    _analysis: FitAnalysis, _font_scale_min: float, _font_scale_max: float
+) -> LayoutStrategy:
+    """Keep the original layout unchanged."""
+    return _NONE_STRATEGY
+
+
+def _build_font_scale(
+    analysis: FitAnalysis, font_scale_min: float, _font_scale_max: float
+) -> LayoutStrategy:
+    """Scale the font down to fit on a single line."""
+    scale = max(font_scale_min, analysis.required_scale_for_single_line)
+    return LayoutStrategy(type=StrategyType.FONT_SCALE, font_scale=scale, wrap_lines=1)
+
+
+def _build_text_wrap(
+    analysis: FitAnalysis, _font_scale_min: float, _font_scale_max: float
+) -> LayoutStrategy:
+    """Wrap the text over the lines it needs at the current size."""
+    lines = analysis.lines_needed
+    return LayoutStrategy(type=StrategyType.TEXT_WRAP, font_scale=1.0, wrap_lines=lines)
+
+
+def _build_hybrid(
+    analysis: FitAnalysis, font_scale_min: float, font_scale_max: float
+) -> LayoutStrategy:
+    """Combine modest scaling with wrapping."""
+    lines_needed = analysis.lines_needed
+    max_lines = analysis.max_lines
+
+    if 1 <= lines_needed <= max_lines and font_scale_min <= 1.0:
+        # The table only picks HYBRID when the lines suffice: the scale needed
+        # is then at least 1, so the lower clamp never applies and the scaled
+        # line count cannot exceed max_lines
+        scale = max_lines / lines_needed
+        if scale > font_scale_max:
+            scale = font_scale_max
+        return LayoutStrategy(
+            type=StrategyType.HYBRID,
+            font_scale=scale,
+            wrap_lines=max(1, int(lines_needed * scale)),
+        )
+
+    # Calculate optimal scale for available lines
+    scale_needed = max_lines / max(1, lines_needed)
+    clamped_scale = max(font_scale_min, min(font_scale_max, scale_needed))
+    # Simulate lines after scaling
+    lines_after_scale = max(1, int(lines_needed * clamped_scale))
+
+    return LayoutStrategy(
+        type=StrategyType.HYBRID,
+        font_scale=clamped_scale,
+        wrap_lines=min(lines_after_scale, max_lines),
+    )
+
+
+def _build_fallback(
+    analysis: FitAnalysis, _font_scale_min: float, _font_scale_max: float
+) -> LayoutStrategy:
+    """Best-effort wrapping over every available line."""
+    return LayoutStrategy(
+        type=StrategyType.TEXT_WRAP, font_scale=1.0, wrap_lines=analysis.max_lines
+    )
+
+
+# Build function per strategy type, resolved once per StrategyBuilder; each
+# takes the analysis and the engine's (font_scale_min, font_scale_max)
+_BuildFunction = Callable[[FitAnalysis, float, float], LayoutStrategy]
+_BUILD_FUNCTIONS: dict[Any, _BuildFunction] = {
+    StrategyType.NONE: _build_none,
+    StrategyType.FONT_SCALE: _build_font_scale,
+    StrategyType.TEXT_WRAP: _build_text_wrap,
+    StrategyType.HYBRID: _build_hybrid,
+}
+
+
+def _strategy_type_for_index(index: int) -> StrategyType:
+    """Decide the strategy type for a StrategyKey.to_int() table index.
+
+    This is the original if-elif chain of determine_layout_strategy.
+    """
+    if index & 8:
+        # Original fits without changes
+        return StrategyType.NONE
+    if index & 4:
+        # Can scale to single line
+        return StrategyType.FONT_SCALE
+    if index & 2:
+        # Can wrap within height
+        return StrategyType.TEXT_WRAP
+    if index & 1:
+        # Enough lines for a hybrid of scaling and wrapping
+        return StrategyType.HYBRID
+    # Fallback to best-effort wrapping
+    return StrategyType.TEXT_WRAP
+
+
+# Strategy type and build function per table index, decided once at import
+_STRATEGY_FOR_IDX: tuple[StrategyType, ...] = tuple(
+    _strategy_type_for_index(index) for index in range(16)
+)
+_BUILDERS_FOR_IDX: tuple[_BuildFunction, ...] = tuple(
+    _BUILD_FUNCTIONS[strategy_type] for strategy_type in _STRATEGY_FOR_IDX
+)
+
+# Batch kernels switch on these codes in place of the build functions
+_BUILD_NONE, _BUILD_FONT_SCALE, _BUILD_TEXT_WRAP, _BUILD_HYBRID, _BUILD_FALLBACK = (
+    range(5)
+)
+_BUILD_CODES: dict[_BuildFunction, int] = {
+    _build_none: _BUILD_NONE,
+    _build_font_scale: _BUILD_FONT_SCALE,
+    _build_text_wrap: _BUILD_TEXT_WRAP,
+    _build_hybrid: _BUILD_HYBRID,
+    _build_fallback: _BUILD_FALLBACK,
+}
+
+# Strategy types in the order of the type codes returned for batches
+BATCH_STRATEGY_TYPES: tuple[StrategyType, ...] = (
+    StrategyType.NONE,
+    StrategyType.FONT_SCALE,
+    StrategyType.TEXT_WRAP,
+    StrategyType.HYBRID,
+)
+
+
+def _compute_strategy_indices(
+    can_fit: np.ndarray,
+    can_scale: np.ndarray,
+    can_wrap: np.ndarray,
+    lines_needed: np.ndarray,
+    max_lines: np.ndarray,
+) -> np.ndarray:
+    """Pack each row's fit conditions into its strategy table index.
+
+    Uses the same bit layout as StrategyKey.to_int().
+    """
+    count = can_fit.shape[0]
+    indices = np.empty(count, dtype=np.int8)
+    for i in range(count):
+        index = 0
+        if can_fit[i]:
+            index |= 8
+        if can_scale[i]:
+            index |= 4
+        if can_wrap[i]:
+            index |= 2
+        if lines_needed[i] <= max_lines[i]:
+            index |= 1
+        indices[i] = index
+    return indices
+
+
+def _build_strategy_rows(
+    indices: np.ndarray,
+    build_codes: np.ndarray,
+    lines_needed: np.ndarray,
+    max_lines: np.ndarray,
+    required_scale: np.ndarray,
+    font_scale_min: float,
+    font_scale_max: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Apply the build function arithmetic to every row of a batch.
+
+    Args:
+        indices: Strategy table index per row
+        build_codes: Build code per table index
+        lines_needed: Lines needed per row
+        max_lines: Available lines per row
+        required_scale: Scale needed for a single line per row
+        font_scale_min: Lower font scale limit
+        font_scale_max: Upper font scale limit
+
+    Returns:
+        Type codes indexing BATCH_STRATEGY_TYPES, font scales and wrap lines
+    """
+    count = indices.shape[0]
+    types = np.empty(count, dtype=np.int8)
+    scales = np.empty(count, dtype=np.float64)
+    wrap_lines = np.empty(count, dtype=np.int64)
+    for i in range(count):
+        code = build_codes[indices[i]]
+        needed = lines_needed[i]
+        available = max_lines[i]
+        if code == _BUILD_NONE:
+            types[i] = 0
+            scales[i] = 1.0
+            wrap_lines[i] = 1
+        elif code == _BUILD_FONT_SCALE:
+            types[i] = 1
+            scales[i] = max(font_scale_min, required_scale[i])
+            wrap_lines[i] = 1
+        elif code == _BUILD_TEXT_WRAP:
+            types[i] = 2
+            scales[i] = 1.0
+            wrap_lines[i] = needed
+        elif code == _BUILD_HYBRID:
+            # Same arithmetic as _build_hybrid, including its shortcut
+            if 1 <= needed <= available and font_scale_min <= 1.0:
+                scale = available / needed
+                if scale > font_scale_max:
+                    scale = font_scale_max
+                lines = max(1, int(needed * scale))
+            else:
+                scale = available / max(1, needed)
+                scale = max(font_scale_min, min(font_scale_max, scale))
+                lines = min(max(1, int(needed * scale)), available)
+            types[i] = 3
+            scales[i] = scale
+            wrap_lines[i] = lines
+        else:
+            types[i] = 2
+            scales[i] = 1.0
+            wrap_lines[i] = available
+    return types, scales, wrap_lines
+
+
+if NUMBA_AVAILABLE:
+    # Compile eagerly for the FitAnalysisBatch column types so the first batch
+    # does not pay JIT latency; cache=True reuses the machine code
+    _compute_strategy_indices = numba.njit(
+        numba.int8[::1](
+            numba.boolean[::1],
+            numba.boolean[::1],
+            numba.boolean[::1],
+            numba.int64[::1],
+            numba.int64[::1],
+        ),
+        cache=True,
+    )(_compute_strategy_indices)
+    _build_strategy_rows = numba.njit(
+        numba.types.Tuple((numba.int8[::1], numba.float64[::1], numba.int64[::1]))(
+            numba.int8[::1],
+            numba.int8[::1],
+            numba.int64[::1],
+            numba.int64[::1],
+            numba.float64[::1],
+            numba.float64,
+            numba.float64,
+        ),
+        cache=True,
+    )(_build_strategy_rows)
 
 
 @dataclass(frozen=True)
-class StrategyBuilder:
-    """Builder for creating layout strategies with parameters."""
+class FitAnalysisBatch:
+    """Fit analyses stored as one NumPy array per field.
 
-    strategy_type: StrategyType
-    scale_calculation: str | None = None
-    lines_calculation: str | None = None
-    fallback_strategy: StrategyType | None = None
+    Batch paths read the fields they need as whole columns instead of
+    loading attributes from every FitAnalysis.
+    """
 
-    def build(
-        self, analysis: FitAnalysis, engine_config: dict[str, Any]
-    ) -> LayoutStrategy:
-        """Build concrete strategy from analysis."""
-        if self.strategy_type == StrategyType.NONE:
-            return LayoutStrategy(type=StrategyType.NONE, font_scale=1.0, wrap_lines=1)
+    can_fit: np.ndarray
+    can_scale: np.ndarray
+    can_wrap: np.ndarray
+    lines_needed: np.ndarray
+    max_lines: np.ndarray
+    required_scale: np.ndarray
+
+    @classmethod
+    def from_analyses(cls, analyses: list[FitAnalysis]) -> FitAnalysisBatch:
+        """Convert a list of analyses into columns."""
+        count = len(analyses)
+
+        def column(values, dtype) -> np.ndarray:
+            return np.fromiter(values, dtype=dtype, count=count)
+
+        return cls(
+            can_fit=column((a.can_fit_without_changes for a in analyses), np.bool_),
+            can_scale=column((a.can_scale_to_single_line for a in analyses), np.bool_),
+            can_wrap=column((a.can_wrap_within_height for a in analyses), np.bool_),
+            lines_needed=column((a.lines_needed for a in analyses), np.int64),
+            max_lines=column((a.max_lines for a in analyses), np.int64),
+            required_scale=column(
+                (a.required_scale_for_single_line for a in analyses), np.float64
+            ),
+        )
 
-        elif self.strategy_type == StrategyType.FONT_SCALE:
-            scale = max(
-                engine_config.get("font_scale_min", 0.6),
-                analysis.required_scale_for_single_line,
-            )
-            return LayoutStrategy(
-                type=StrategyType.FONT_SCALE, font_scale=scale, wrap_lines=1
+    def __len__(self) -> int:
+        return len(self.can_fit)
+
+    def strategy_indices(self) -> np.ndarray:
+        """Strategy table index of every row, as StrategyKey.to_int()."""
+        if NUMBA_AVAILABLE:
+            return _compute_strategy_indices(
+                self.can_fit,
+                self.can_scale,
+                self.can_wrap,
+                self.lines_needed,
+                self.max_lines,
             )
+        return (
+            (self.can_fit.astype(np.int8) << 3)
+            | (self.can_scale.astype(np.int8) << 2)
+            | (self.can_wrap.astype(np.int8) << 1)
+            | (self.lines_needed <= self.max_lines).astype(np.int8)
+        )
 
-        elif self.strategy_type == StrategyType.TEXT_WRAP:
-            lines = analysis.lines_needed
-            return LayoutStrategy(
-                type=StrategyType.TEXT_WRAP, font_scale=1.0, wrap_lines=lines
-            )
 
-        elif self.strategy_type == StrategyType.HYBRID:
-            # Calculate optimal scale for available lines
-            scale_needed = analysis.max_lines / max(1, analysis.lines_needed)
-            clamped_scale = max(
-                engine_config.get("font_scale_min", 0.6),
-                min(engine_config.get("font_scale_max", 1.2), scale_needed),
-            )
-            # Simulate lines after scaling
-            lines_after_scale = max(1, int(analysis.lines_needed * clamped_scale))
+class StrategyBuilder:
+    """Builder for creating layout strategies with parameters."""
 
-            return LayoutStrategy(
-                type=StrategyType.HYBRID,
-                font_scale=clamped_scale,
-                wrap_lines=min(lines_after_scale, analysis.max_lines),
-            )
+    __slots__ = ("_build_fn", "_font_scale_max", "_font_scale_min", "strategy_type")
 
-        # Fallback
-        return LayoutStrategy(
-            type=StrategyType.TEXT_WRAP, font_scale=1.0, wrap_lines=analysis.max_lines
+    def __init__(
+        self,
+        strategy_type: StrategyType,
+        font_scale_min: float = 0.6,
+        font_scale_max: float = 1.2,
+    ) -> None:
+        self.strategy_type = strategy_type
+        # Resolve the build function and bind the scale limits once
+        self._build_fn: _BuildFunction = _BUILD_FUNCTIONS.get(
+            strategy_type, _build_fallback
         )
+        self._font_scale_min = font_scale_min
+        self._font_scale_max = font_scale_max
+
+    def __repr__(self) -> str:
+        return (
+            f"StrategyBuilder({self.strategy_type!r}, "
+            f"{self._font_scale_min!r}, {self._font_scale_max!r})"
+        )
+
+    def build(self, analysis: FitAnalysis) -> LayoutStrategy:
+        """Build concrete strategy from analysis."""
+        return self._build_fn(analysis, self._font_scale_min, self._font_scale_max)
 
 
 class DynamicLayoutStrategy(StrategyPattern[LayoutStrategy]):
@@ -209,21 +495,28 @@ class DynamicLayoutStrategy(StrategyPattern[LayoutStrategy]):
         self.strategy_key = strategy_key
         self.builder = builder
         self._priority = priority
+        self._key_int = strategy_key.to_int()
 
     def execute(self, context: LayoutContext) -> LayoutStrategy:
         """Execute strategy to produce layout decision."""
-        return self.builder.build(context.analysis, context.engine_config)
+        return self.builder.build(context.analysis)
 
     def can_handle(self, context: LayoutContext) -> bool:
         """Check if this strategy can handle the context."""
-        analysis_key = StrategyKey(
-            can_fit_unchanged=context.analysis.can_fit_without_changes,
-            can_scale_single_line=context.analysis.can_scale_to_single_line,
-            can_wrap_within_height=context.analysis.can_wrap_within_height,
-            sufficient_lines=context.analysis.lines_needed
-            <= context.analysis.max_lines,
+        analysis = context.analysis
+        # Same bit layout as StrategyKey.to_int(), without building a key
+        key_int = (
+            (analysis.can_fit_without_changes << 3)
+            | (analysis.can_scale_to_single_line << 2)
+            | (analysis.can_wrap_within_height << 1)
+            | (analysis.lines_needed <= analysis.max_lines)
         )
-        return analysis_key == self.strategy_key
+        return key_int == self._key_int
+
+    @property
+    def key_int(self) -> int:
+        """Integer form of this strategy's key, as used by the lookup table."""
+        return self._key_int
 
     @property
     def priority(self) -> int:
@@ -235,7 +528,7 @@ class LayoutContext:
     """Context for layout strategy decisions."""
 
     analysis: FitAnalysis
-    engine_config: dict[str, Any] = field(default_factory=dict)
+    engine_config: Mapping[str, Any] = field(default_factory=dict)
     original_text: str = ""
     translated_text: str = ""
     bbox: BoundingBox | None = None
@@ -264,56 +557,55 @@ class DynamicLayoutEngine:
 
         # Build strategy lookup table
         self.strategy_table = self._build_strategy_table()
+        self._builders = _BUILDERS_FOR_IDX
+        # The table never changes after construction
+        self._strategy_distribution = self._compute_strategy_distribution()
+        self._build_codes = np.array(
+            [_BUILD_CODES[builder._build_fn] for builder in self.strategy_table],
+            dtype=np.int8,
+        )
         self.strategy_registry = self._build_strategy_registry()
 
         # Performance tracking
         self.metrics = PerformanceMetrics("dynamic_layout_engine")
+        self._metrics_enabled = _METRICS_ENABLED
+
+        # Engine configuration passed to layout contexts; read-only so every
+        # context can share the same mapping
+        self.engine_config: Mapping[str, Any] = MappingProxyType(
+            {
+                "font_scale_min": self.font_scale_min,
+                "font_scale_max": self.font_scale_max,
+                "max_bbox_expansion": self.max_bbox_expansion,
+                "average_char_width_em": self.average_char_width_em,
+                "line_height_factor": self.line_height_factor,
+            }
+        )
 
-        # Engine configuration for strategy builders
-        self.engine_config = {
-            "font_scale_min": self.font_scale_min,
-            "font_scale_max": self.font_scale_max,
-            "max_bbox_expansion": self.max_bbox_expansion,
-            "average_char_width_em": self.average_char_width_em,
-            "line_height_factor": self.line_height_factor,
-        }
-
-    def _build_strategy_table(self) -> dict[int, StrategyBuilder]:
-        """Pre-compute all possible strategy combinations."""
-        table = {}
-
-        # Generate all 16 possible combinations (2^4)
-        for conditions in itertools.product([True, False], repeat=4):
-            can_fit, can_scale, can_wrap, sufficient_lines = conditions
-            key = StrategyKey(can_fit, can_scale, can_wrap, sufficient_lines)
-
-            # Determine strategy based on conditions (replaces original if-elif chain)
-            if can_fit:
-                # Original fits without changes
-                builder = StrategyBuilder(StrategyType.NONE)
-            elif can_scale:
-                # Can scale to single line
-                builder = StrategyBuilder(StrategyType.FONT_SCALE)
-            elif can_wrap:
-                # Can wrap within height
-                builder = StrategyBuilder(StrategyType.TEXT_WRAP)
-            else:
-                # Need hybrid or fallback
-                if sufficient_lines:
-                    builder = StrategyBuilder(StrategyType.HYBRID)
-                else:
-                    # Fallback to best-effort wrapping
-                    builder = StrategyBuilder(
-                        StrategyType.TEXT_WRAP, fallback_strategy=StrategyType.HYBRID
-                    )
+        # Strategies depend only on the table index and the fields in
+        # _FitParameters, so results are cached on exactly those values
+        self._strategy_for_key = functools.lru_cache(maxsize=512)(
+            self._build_strategy_for_key
+        )
 
-            table[key.to_int()] = builder
+    def _build_strategy_table(self) -> tuple[StrategyBuilder, ...]:
+        """Pre-compute all possible strategy combinations.
 
-        return table
+        The table is a 16-entry tuple indexed directly by StrategyKey.to_int().
+        """
+        # Builders bind the scale limits instead of reading engine_config
+        return tuple(
+            StrategyBuilder(strategy_type, self.font_scale_min, self.font_scale_max)
+            for strategy_type in _STRATEGY_FOR_IDX
+        )
 
     def _build_strategy_registry(self) -> StrategyRegistry[LayoutStrategy]:
-        """Build strategy registry for pattern-based selection."""
+        """Build strategy registry for pattern-based selection.
+
+        The built-in strategies are also indexed by key in _strategy_by_key.
+        """
         registry = StrategyRegistry[LayoutStrategy]()
+        self._strategy_by_key: dict[int, DynamicLayoutStrategy] = {}
 
         # Register strategies in priority order
         for conditions in itertools.product([True, False], repeat=4):
@@ -333,47 +625,56 @@ class DynamicLayoutEngine:
 
             strategy = DynamicLayoutStrategy(key, builder, priority_value)
             registry.register(strategy)
+            self._strategy_by_key[strategy.key_int] = strategy
 
         return registry
 
-    @memoize(cache_size=512, ttl_seconds=300)
     def determine_strategy_optimized(self, analysis: FitAnalysis) -> LayoutStrategy:
         """O(1) strategy determination using lookup table.
 
         This replaces the original determine_layout_strategy method's
         nested conditionals with a direct table lookup.
         """
-        with time_operation(self.metrics):
-            # Create strategy key from analysis
-            key = StrategyKey(
-                can_fit_unchanged=analysis.can_fit_without_changes,
-                can_scale_single_line=analysis.can_scale_to_single_line,
-                can_wrap_within_height=analysis.can_wrap_within_height,
-                sufficient_lines=analysis.lines_needed <= analysis.max_lines,
+        start_time = time.perf_counter() if self._metrics_enabled else 0.0
+
+        if analysis.can_fit_without_changes:
+            # Every key with the fit bit set maps to the shared NONE strategy,
+            # which covers most text blocks
+            strategy = _NONE_STRATEGY
+        else:
+            # Same bit layout as StrategyKey.to_int() with the fit bit clear
+            key_int = (
+                (analysis.can_scale_to_single_line << 2)
+                | (analysis.can_wrap_within_height << 1)
+                | (analysis.lines_needed <= analysis.max_lines)
+            )
+            strategy = self._strategy_for_key(
+                key_int,
+                analysis.required_scale_for_single_line,
+                analysis.lines_needed,
+                analysis.max_lines,
             )
 
-            # O(1) lookup
-            builder = self.strategy_table.get(key.to_int())
-            if not builder:
-                # Fallback to registry-based selection
-                context = LayoutContext(
-                    analysis=analysis, engine_config=self.engine_config
-                )
-                strategy = self.strategy_registry.execute(context)
-                if strategy:
-                    return strategy
-
-                # Ultimate fallback
-                return LayoutStrategy(
-                    type=StrategyType.TEXT_WRAP,
-                    font_scale=1.0,
-                    wrap_lines=max(1, analysis.max_lines),
-                )
-
-            # Build strategy with current analysis
-            result = builder.build(analysis, self.engine_config)
-
-            return result
+        if self._metrics_enabled:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            self.metrics.record_operation(duration_ms)
+        return strategy
+
+    def _build_strategy_for_key(
+        self,
+        key_int: int,
+        required_scale_for_single_line: float,
+        lines_needed: int,
+        max_lines: int,
+    ) -> LayoutStrategy:
+        """Build the strategy for a table index; cached by _strategy_for_key."""
+        # O(1) dispatch; the tuple covers every 4-bit key
+        parameters = _FitParameters(
+            required_scale_for_single_line, lines_needed, max_lines
+        )
+        return self._builders[key_int](
+            parameters, self.font_scale_min, self.font_scale_max
+        )
 
     @performance_monitor("advanced_strategy_selection")
     def determine_strategy_with_context(
@@ -384,7 +685,14 @@ class DynamicLayoutEngine:
         bbox: BoundingBox | None = None,
         font: FontInfo | None = None,
     ) -> LayoutStrategy:
-        """Advanced strategy selection with full context analysis."""
+        """Advanced strategy selection with full context analysis.
+
+        Registered strategies only see a context when one is given: with no
+        text, bbox or font this is the same as determine_strategy_optimized.
+        """
+        if not (original_text or translated_text or bbox or font):
+            return self.determine_strategy_optimized(analysis)
+
         context = LayoutContext(
             analysis=analysis,
             engine_config=self.engine_config,
@@ -394,6 +702,17 @@ class DynamicLayoutEngine:
             font=font,
         )
 
+        # Each key has exactly one built-in strategy, so while nothing else
+        # is registered it can be picked by index instead of by a scan
+        if len(self.strategy_registry) == len(self._strategy_by_key):
+            key_int = (
+                (analysis.can_fit_without_changes << 3)
+                | (analysis.can_scale_to_single_line << 2)
+                | (analysis.can_wrap_within_height << 1)
+                | (analysis.lines_needed <= analysis.max_lines)
+            )
+            return self._strategy_by_key[key_int].execute(context)
+
         # Use strategy registry for context-aware selection
         strategy = self.strategy_registry.execute(context)
         if strategy:
@@ -402,25 +721,45 @@ class DynamicLayoutEngine:
         # Fallback to optimized lookup
         return self.determine_strategy_optimized(analysis)
 
-    def get_strategy_distribution(self) -> dict[StrategyType, int]:
-        """Get distribution of strategies in the lookup table."""
+    def batch_determine_strategies(
+        self, batch: FitAnalysisBatch
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Determine strategies for a batch of analyses in columnar form.
+
+        Gives the same results as determine_strategy_optimized row by row,
+        without building a LayoutStrategy per row.
+
+        Returns:
+            Type codes indexing BATCH_STRATEGY_TYPES, font scales and wrap lines
+        """
+        return _build_strategy_rows(
+            batch.strategy_indices(),
+            self._build_codes,
+            batch.lines_needed,
+            batch.max_lines,
+            batch.required_scale,
+            float(self.font_scale_min),
+            float(self.font_scale_max),
+        )
+
+    def _compute_strategy_distribution(self) -> dict[StrategyType, int]:
+        """Count the lookup table entries for each strategy type."""
         distribution = {}
-        for builder in self.strategy_table.values():
+        for builder in self.strategy_table:
             strategy_type = builder.strategy_type
             distribution[strategy_type] = distribution.get(strategy_type, 0) + 1
         return distribution
 
+    def get_strategy_distribution(self) -> dict[StrategyType, int]:
+        """Get distribution of strategies in the lookup table."""
+        return self._strategy_distribution.copy()
+
     def get_performance_metrics(self) -> dict[str, Any]:
         """Get comprehensive performance metrics."""
         return {
             "lookup_table_metrics": self.metrics,
             "strategy_registry_metrics": self.strategy_registry.get_metrics(),
-            "memoization_metrics": getattr(
-                self.determine_strategy_optimized, "metrics", lambda: {}
-            )(),
-            "cache_stats": getattr(
-                self.determine_strategy_optimized, "cache_stats", lambda: {}
-            )(),
+            "cache_stats": self._strategy_for_key.cache_info()._asdict(),
             "strategy_distribution": self.get_strategy_distribution(),
             "table_size": len(self.strategy_table),
             "registry_strategies": len(self.strategy_registry),
@@ -430,11 +769,13 @@ class DynamicLayoutEngine:
         self, test_analyses: list[FitAnalysis], iterations: int = 1000
     ) -> dict[str, Any]:
         """Benchmark dynamic approach vs original conditional logic."""
+        # Convert once so every iteration runs over columns
+        batch = FitAnalysisBatch.from_analyses(test_analyses)
+
         # Time the optimized approach
         with time_operation(self.metrics):
             for _ in range(iterations):
-                for analysis in test_analyses:
-                    self.determine_strategy_optimized(analysis)
+                self.batch_determine_strategies(batch)
 
         # Get timing data from the metrics
         optimized_time = self.metrics.total_duration_ms / 1000  # Convert to seconds
@@ -454,26 +795,21 @@ class DynamicLayoutEngine:
 
     def clear_caches(self) -> None:
         """Clear all internal caches."""
-        if hasattr(self.determine_strategy_optimized, "clear_cache"):
-            self.determine_strategy_optimized.clear_cache()
+        self._strategy_for_key.cache_clear()
         self.strategy_registry._cache.clear()
 
     def analyze_pattern_coverage(
         self, test_analyses: list[FitAnalysis]
     ) -> dict[str, Any]:
         """Analyze how well the lookup table covers real-world patterns."""
-        pattern_counts = {}
         total_tests = len(test_analyses)
 
-        for analysis in test_analyses:
-            key = StrategyKey(
-                can_fit_unchanged=analysis.can_fit_without_changes,
-                can_scale_single_line=analysis.can_scale_to_single_line,
-                can_wrap_within_height=analysis.can_wrap_within_height,
-                sufficient_lines=analysis.lines_needed <= analysis.max_lines,
-            )
-            key_int = key.to_int()
-            pattern_counts[key_int] = pattern_counts.get(key_int, 0) + 1
+        # One slot per table index, counted in a single pass over the batch
+        batch = FitAnalysisBatch.from_analyses(test_analyses)
+        counts = np.bincount(
+            batch.strategy_indices(), minlength=len(self.strategy_table)
+        ).tolist()
+        pattern_counts = {key: count for key, count in enumerate(counts) if count}
 
         # Calculate coverage statistics
         covered_patterns = len(pattern_counts)
@@ -492,9 +828,7 @@ class DynamicLayoutEngine:
             "coverage_percentage": coverage_percentage,
             "most_common_patterns": sorted_patterns[:5],
             "pattern_distribution": pattern_counts,
-            "unused_patterns": [
-                key for key in self.strategy_table.keys() if key not in pattern_counts
-            ],
+            "unused_patterns": [key for key, count in enumerate(counts) if not count],
         }
 
 
@@ -602,10 +936,9 @@ class OptimizedLayoutPreservationEngine:
         return self.dynamic_engine.benchmark_vs_original(test_analyses)
 
 
-# Registry for global layout strategies
-LAYOUT_STRATEGY_REGISTRY = get_registry(
-    "layout_strategies", cache_size=256, ttl_seconds=600
-)
+# Registry for global layout strategies; strategies are pure values of their
+# arguments, so cached entries never expire
+LAYOUT_STRATEGY_REGISTRY = get_registry("layout_strategies", cache_size=256)
 
 
 def register_layout_strategy(
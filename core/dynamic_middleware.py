@@ -8,21 +8,125 @@ in the PhenomenalLayout system.
 from __future__ import annotations
 
 import functools
+import hashlib
+import inspect
+import itertools
 import os
+import pickle
 import threading
 import time
-from collections import defaultdict
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Hashable, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, TypeVar
 
+import numpy as np
+
+# Optional JIT compilation of the improvement estimate
+try:
+    import numba  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None  # type: ignore
+    NUMBA_AVAILABLE = False
+
 from core.dynamic_programming import (
     CachePolicy,
+    ShardedSmartCache,
     SmartCache,
 )
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Caches are only sharded while every shard keeps at least this many entries
+_MIN_SHARD_SIZE = 16
+
+
+def _improvement_kernel(
+    total_requests: np.ndarray,
+    cache_hits: np.ndarray,
+    total_duration_ms: np.ndarray,
+    savings_factor: float,
+) -> np.ndarray:
+    """Single-pass improvement estimate, one operation per element.
+
+    Same arithmetic, in the same order, as the NumPy fallback in
+    _compute_improvements so both paths agree to the last bit.
+    """
+    count = total_requests.shape[0]
+    improvements = np.zeros(count, dtype=np.float64)
+    for i in range(count):
+        total = total_duration_ms[i]
+        if cache_hits[i] > 0 and total > 0:
+            avg_duration_ms = total / total_requests[i]
+            saved = cache_hits[i] * (avg_duration_ms * savings_factor)
+            improvements[i] = (saved / total) * 100
+    return improvements
+
+
+if NUMBA_AVAILABLE:
+    # Compile eagerly for the monitor's column types so the first summary
+    # does not pay JIT latency; cache=True reuses the machine code
+    _improvement_kernel = numba.njit(
+        numba.float64[::1](
+            numba.int64[::1],
+            numba.int64[::1],
+            numba.float64[::1],
+            numba.float64,
+        ),
+        cache=True,
+    )(_improvement_kernel)
+
+
+def _compute_improvements(
+    total_requests: np.ndarray,
+    cache_hits: np.ndarray,
+    total_duration_ms: np.ndarray,
+    savings_factor: float,
+) -> np.ndarray:
+    """Estimate the improvement percentage of every operation at once.
+
+    Operations without cache hits or without recorded time get 0.
+    """
+    if NUMBA_AVAILABLE:
+        return _improvement_kernel(
+            total_requests, cache_hits, total_duration_ms, float(savings_factor)
+        )
+
+    valid = (cache_hits > 0) & (total_duration_ms > 0)
+    avg_duration_ms = np.divide(
+        total_duration_ms,
+        total_requests,
+        out=np.zeros_like(total_duration_ms),
+        where=valid,
+    )
+    # Assume cache hits save savings_factor of the average duration
+    cache_time_saved = cache_hits * (avg_duration_ms * savings_factor)
+    ratio = np.divide(
+        cache_time_saved,
+        total_duration_ms,
+        out=np.zeros_like(total_duration_ms),
+        where=valid,
+    )
+    return ratio * 100
+
+
+def _top_indices(values: np.ndarray, limit: int) -> np.ndarray:
+    """Indices of the ``limit`` largest values, ties in index order.
+
+    Matches a stable descending sort sliced to ``[:limit]``, but only sorts
+    the values that can make the cut.
+    """
+    if limit <= 0 or limit >= len(values):
+        return np.argsort(-values, kind="stable")[:limit]
+
+    threshold = np.partition(values, len(values) - limit)[len(values) - limit]
+    candidates = np.flatnonzero(values >= threshold)
+    order = np.argsort(-values[candidates], kind="stable")
+    return candidates[order[:limit]]
+
 
 @dataclass
 class MiddlewareMetrics:
@@ -32,7 +136,8 @@ class MiddlewareMetrics:
     cache_hits: int = 0
     cache_misses: int = 0
     total_duration_ms: float = 0.0
-    min_duration_ms: float = float("inf")
+    # Both are 0.0 until the first request sets them
+    min_duration_ms: float = 0.0
     max_duration_ms: float = 0.0
     error_count: int = 0
     performance_improvements: dict[str, float] = field(default_factory=dict)
@@ -59,28 +164,73 @@ class MiddlewareMetrics:
         return (self.error_count / self.total_requests) * 100
 
     def record_request(
-        self, duration_ms: float, cache_hit: bool = False, error: bool = False
+        self,
+        duration_ms: float,
+        cache_hit: bool = False,
+        error: bool = False,
+        count: int = 1,
     ) -> None:
-        """Record a single request's metrics."""
-        self.total_requests += 1
-        self.total_duration_ms += duration_ms
+        """Record a request's metrics, standing in for ``count`` requests."""
+        if self.total_requests:
+            if duration_ms < self.min_duration_ms:
+                self.min_duration_ms = duration_ms
+            if duration_ms > self.max_duration_ms:
+                self.max_duration_ms = duration_ms
+        else:
+            self.min_duration_ms = self.max_duration_ms = duration_ms
+
+        self.total_requests += count
+        self.total_duration_ms += duration_ms * count
 
         if cache_hit:
-            self.cache_hits += 1
+            self.cache_hits += count
         else:
-            self.cache_misses += 1
+            self.cache_misses += count
 
         if error:
-            self.error_count += 1
+            self.error_count += count
+
+    def merge(self, other: MiddlewareMetrics) -> None:
+        """Add the metrics recorded for the same operation elsewhere."""
+        if not other.total_requests:
+            return
+        if self.total_requests:
+            if other.min_duration_ms < self.min_duration_ms:
+                self.min_duration_ms = other.min_duration_ms
+            if other.max_duration_ms > self.max_duration_ms:
+                self.max_duration_ms = other.max_duration_ms
+        else:
+            self.min_duration_ms = other.min_duration_ms
+            self.max_duration_ms = other.max_duration_ms
 
-        self.min_duration_ms = min(self.min_duration_ms, duration_ms)
-        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+        self.total_requests += other.total_requests
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.total_duration_ms += other.total_duration_ms
+        self.error_count += other.error_count
+        self.performance_improvements.update(other.performance_improvements)
+
+
+class _ThreadShard:
+    """Metrics and pattern usage recorded by one thread; only it writes them."""
+
+    __slots__ = ("operations", "patterns", "thread")
+
+    def __init__(self, thread: threading.Thread):
+        """Start an empty shard owned by thread."""
+        self.thread = thread
+        self.operations: dict[str, MiddlewareMetrics] = {}
+        self.patterns: Counter[str] = Counter()
 
 
 class DynamicProgrammingMonitor:
     """Monitor performance improvements from dynamic programming patterns."""
 
-    def __init__(self, cache_time_savings_factor: float | None = None):
+    def __init__(
+        self,
+        cache_time_savings_factor: float | None = None,
+        summary_ttl_seconds: float = 1.0,
+    ):
         # Resolve cache time savings factor from argument or environment
         if cache_time_savings_factor is None:
             env_val = os.getenv("CACHE_TIME_SAVINGS_FACTOR", "0.9").strip()
@@ -99,9 +249,21 @@ class DynamicProgrammingMonitor:
                 raise ValueError("cache_time_savings_factor must be greater than 0")
             self.cache_time_savings_factor = cache_time_savings_factor
 
-        self.metrics: dict[str, MiddlewareMetrics] = defaultdict(MiddlewareMetrics)
-        self.pattern_usage: dict[str, int] = defaultdict(int)
-        self._lock = threading.RLock()
+        # Each recording thread owns a shard of per-operation metrics and
+        # pattern counts that only it writes, so recording takes no lock;
+        # readers merge the shards. _lock guards the shard list and the
+        # totals folded in from finished threads.
+        self._local = threading.local()
+        self._shards: list[_ThreadShard] = []
+        self._retired: dict[str, MiddlewareMetrics] = {}
+        self._retired_patterns: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+        # Summaries are rebuilt at most once per TTL; readers share the last
+        # (monotonic timestamp, read-only summary) pair without locking
+        self._summary_ttl = summary_ttl_seconds
+        self._summary_cache: tuple[float, Mapping[str, Any]] | None = None
+        self._summary_lock = threading.Lock()
 
     def record_operation(
         self,
@@ -110,93 +272,217 @@ class DynamicProgrammingMonitor:
         cache_hit: bool = False,
         error: bool = False,
         pattern_type: str | None = None,
+        count: int = 1,
     ) -> None:
-        """Record operation metrics."""
+        """Record operation metrics.
+
+        A sampled measurement passes the number of calls it represents as
+        ``count``.
+        """
+        local = self._local
+        shard = getattr(local, "shard", None)
+        if shard is None:
+            shard = local.shard = self._add_shard()
+
+        metrics = shard.operations.get(operation)
+        if metrics is None:
+            metrics = shard.operations[operation] = MiddlewareMetrics()
+        metrics.record_request(duration_ms, cache_hit, error, count)
+
+        if pattern_type:
+            shard.patterns[pattern_type] += count
+
+    def _add_shard(self) -> _ThreadShard:
+        """Register the calling thread's shard, once per thread.
+
+        Shards of finished threads are folded away here too, so a process
+        that records from many short-lived threads but never reads stays
+        bounded.
+        """
+        shard = _ThreadShard(threading.current_thread())
         with self._lock:
-            self.metrics[operation].record_request(duration_ms, cache_hit, error)
+            self._live_shards().append(shard)
+        return shard
+
+    def _live_shards(self) -> list[_ThreadShard]:
+        """Fold the shards of finished threads into the retired totals.
+
+        Keeps the shard list bounded by the number of live threads; the
+        caller holds _lock.
+        """
+        live = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                live.append(shard)
+            else:
+                self._merge_into(self._retired, shard.operations)
+                self._retired_patterns.update(dict(shard.patterns))
+        self._shards = live
+        return live
 
-            if pattern_type:
-                self.pattern_usage[pattern_type] += 1
+    @property
+    def metrics(self) -> dict[str, MiddlewareMetrics]:
+        """Per-operation metrics merged across all recording threads."""
+        return dict(self._snapshot_metrics())
 
-    def get_performance_summary(self) -> dict[str, Any]:
-        """Generate comprehensive performance summary."""
+    @property
+    def pattern_usage(self) -> Counter[str]:
+        """Pattern usage counts merged across all recording threads."""
         with self._lock:
-            summary = {}
-
-            for operation, metrics in self.metrics.items():
-                summary[operation] = {
-                    "total_requests": metrics.total_requests,
-                    "cache_hit_rate": metrics.cache_hit_rate,
-                    "avg_duration_ms": metrics.avg_duration_ms,
-                    "min_duration_ms": metrics.min_duration_ms
-                    if metrics.min_duration_ms != float("inf")
-                    else 0,
-                    "max_duration_ms": metrics.max_duration_ms,
-                    "error_rate": metrics.error_rate,
-                    "performance_improvement": self._calculate_improvement(
-                        operation, metrics
-                    ),
-                }
+            live = self._live_shards()
+            usage = self._retired_patterns.copy()
+        for shard in live:
+            # dict() copies atomically while the owner may add patterns
+            usage.update(dict(shard.patterns))
+        return usage
+
+    def _snapshot_metrics(self) -> list[tuple[str, MiddlewareMetrics]]:
+        """Merge every thread's metrics into one copy per operation.
+
+        A shard may be written while it is copied, so an operation's fields
+        can be off by the request in flight; all completed ones are counted.
+        """
+        with self._lock:
+            live = self._live_shards()
+            merged: dict[str, MiddlewareMetrics] = {}
+            self._merge_into(merged, self._retired)
 
-            summary["pattern_usage"] = dict(self.pattern_usage)
-            summary["total_operations"] = sum(
-                m.total_requests for m in self.metrics.values()
-            )
-            summary["overall_cache_hit_rate"] = self._calculate_overall_cache_rate()
+        for shard in live:
+            self._merge_into(merged, shard.operations)
+        return list(merged.items())
 
+    @staticmethod
+    def _merge_into(
+        target: dict[str, MiddlewareMetrics], shard: dict[str, MiddlewareMetrics]
+    ) -> None:
+        """Add a shard's metrics into target without sharing any objects."""
+        # dict.copy() is atomic, unlike iterating a dict its owner may grow
+        for operation, metrics in shard.copy().items():
+            existing = target.get(operation)
+            if existing is None:
+                existing = target[operation] = MiddlewareMetrics()
+            existing.merge(metrics)
+
+    def get_performance_summary(self) -> Mapping[str, Any]:
+        """Generate comprehensive performance summary.
+
+        The summary is a read-only snapshot shared by all callers for up to
+        summary_ttl_seconds; its per-operation entries and pattern usage are
+        read-only too.
+        """
+        cached = self._summary_cache
+        if cached is not None and time.monotonic() - cached[0] < self._summary_ttl:
+            return cached[1]
+
+        with self._summary_lock:
+            cached = self._summary_cache
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self._summary_ttl
+            ):
+                return cached[1]
+
+            summary = MappingProxyType(self._build_performance_summary())
+            self._summary_cache = (time.monotonic(), summary)
             return summary
 
-    def _calculate_improvement(
-        self, operation: str, metrics: MiddlewareMetrics
-    ) -> float:
-        """Calculate estimated performance improvement."""
-        if metrics.cache_hits == 0:
-            return 0.0
-
-        # Estimate improvement based on cache hits (assume 90% time savings on cache hits)
-        cache_time_saved = metrics.cache_hits * (
-            metrics.avg_duration_ms * self.cache_time_savings_factor
+    def _build_performance_summary(self) -> dict[str, Any]:
+        """Build a fresh performance summary from the current metrics."""
+        snapshot = self._snapshot_metrics()
+        total_requests, cache_hits, total_duration_ms = self._metric_columns(snapshot)
+        improvements = _compute_improvements(
+            total_requests,
+            cache_hits,
+            total_duration_ms,
+            self.cache_time_savings_factor,
+        ).tolist()
+        summary = {}
+
+        for (operation, metrics), improvement in zip(
+            snapshot, improvements, strict=True
+        ):
+            entry = {
+                "total_requests": metrics.total_requests,
+                "cache_hit_rate": metrics.cache_hit_rate,
+                "avg_duration_ms": metrics.avg_duration_ms,
+                "min_duration_ms": metrics.min_duration_ms,
+                "max_duration_ms": metrics.max_duration_ms,
+                "error_rate": metrics.error_rate,
+                "performance_improvement": improvement,
+            }
+            summary[operation] = MappingProxyType(entry)
+
+        summary["pattern_usage"] = MappingProxyType(dict(self.pattern_usage))
+        summary["total_operations"] = int(total_requests.sum())
+        summary["overall_cache_hit_rate"] = self._calculate_overall_cache_rate(
+            int(cache_hits.sum()), int(total_requests.sum())
         )
-        total_time = metrics.total_duration_ms
 
-        if total_time > 0:
-            return (cache_time_saved / total_time) * 100
-        return 0.0
+        return summary
+
+    @staticmethod
+    def _metric_columns(
+        snapshot: list[tuple[str, MiddlewareMetrics]],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Total requests, cache hits and total duration, one row per operation."""
+        count = len(snapshot)
+        return (
+            np.fromiter(
+                (m.total_requests for _, m in snapshot), dtype=np.int64, count=count
+            ),
+            np.fromiter(
+                (m.cache_hits for _, m in snapshot), dtype=np.int64, count=count
+            ),
+            np.fromiter(
+                (m.total_duration_ms for _, m in snapshot),
+                dtype=np.float64,
+                count=count,
+            ),
+        )
 
-    def _calculate_overall_cache_rate(self) -> float:
+    def _calculate_overall_cache_rate(
+        self, total_hits: int, total_requests: int
+    ) -> float:
         """Calculate overall cache hit rate across all operations."""
-        total_hits = sum(m.cache_hits for m in self.metrics.values())
-        total_requests = sum(m.total_requests for m in self.metrics.values())
-
         if total_requests == 0:
             return 0.0
         return (total_hits / total_requests) * 100
 
     def get_top_performers(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get top performing operations by improvement."""
-        performers = []
-
-        with self._lock:
-            for operation, metrics in self.metrics.items():
-                improvement = self._calculate_improvement(operation, metrics)
-                performers.append(
-                    {
-                        "operation": operation,
-                        "improvement_percentage": improvement,
-                        "cache_hit_rate": metrics.cache_hit_rate,
-                        "total_requests": metrics.total_requests,
-                        "avg_duration_ms": metrics.avg_duration_ms,
-                    }
-                )
+        snapshot = self._snapshot_metrics()
+        total_requests, cache_hits, total_duration_ms = self._metric_columns(snapshot)
+        improvements = _compute_improvements(
+            total_requests,
+            cache_hits,
+            total_duration_ms,
+            self.cache_time_savings_factor,
+        )
 
-        performers.sort(key=lambda x: x["improvement_percentage"], reverse=True)
-        return performers[:limit]
+        performers = []
+        for index in _top_indices(improvements, limit).tolist():
+            operation, metrics = snapshot[index]
+            performers.append(
+                {
+                    "operation": operation,
+                    "improvement_percentage": float(improvements[index]),
+                    "cache_hit_rate": metrics.cache_hit_rate,
+                    "total_requests": metrics.total_requests,
+                    "avg_duration_ms": metrics.avg_duration_ms,
+                }
+            )
+        return performers
 
     def reset_metrics(self) -> None:
         """Reset all collected metrics."""
-        with self._lock:
-            self.metrics.clear()
-            self.pattern_usage.clear()
+        with self._summary_lock:
+            with self._lock:
+                # Threads find no shard in the fresh local and register anew
+                self._local = threading.local()
+                self._shards = []
+                self._retired.clear()
+                self._retired_patterns.clear()
+            self._summary_cache = None
 
 
 class SmartCachingMiddleware:
@@ -207,20 +493,46 @@ class SmartCachingMiddleware:
         default_cache_size: int = 256,
         default_ttl_seconds: float | None = None,
         adaptive_sizing: bool = True,
+        adaptive_ttl: bool = True,
+        memoize_threshold_ms: float = 0.0,
+        cheap_call_limit: int = 16,
+        cache_shards: int = 16,
     ):
         self.default_cache_size = default_cache_size
         self.default_ttl_seconds = default_ttl_seconds
         self.adaptive_sizing = adaptive_sizing
+        self.adaptive_ttl = adaptive_ttl
+
+        # Results computed faster than this are not worth a cache entry, and
+        # functions below it cheap_call_limit times in a row skip the lookup
+        self.memoize_threshold_ms = memoize_threshold_ms
+        self.cheap_call_limit = cheap_call_limit
+
+        # Upper bound on the shards of one cache, a power of two
+        if cache_shards < 1 or cache_shards & (cache_shards - 1):
+            raise ValueError("cache_shards must be a positive power of two")
+        self.cache_shards = cache_shards
 
         # Cache registry
-        self.caches: dict[str, SmartCache] = {}
+        self.caches: dict[str, SmartCache | ShardedSmartCache] = {}
         self.cache_configs: dict[str, dict[str, Any]] = {}
 
         # Performance tracking
         self.monitor = DynamicProgrammingMonitor()
 
-        # Thread safety
-        self._lock = threading.RLock()
+        # Names of functions seen with unhashable arguments, which are keyed
+        # on an argument digest without first trying the argument tuple
+        self._digest_keyed: set[str] = set()
+
+        # Consecutive below-threshold executions per function name
+        self._cheap_streaks: dict[str, int] = {}
+
+        # Per cache (total requests, cache hits, interval hit rate) as of the
+        # last optimize_cache_ttls tick
+        self._ttl_ticks: dict[str, tuple[int, int, float]] = {}
+
+        # Thread safety; no locked section calls back into another
+        self._lock = threading.Lock()
 
     def get_cache(
         self,
@@ -228,53 +540,112 @@ class SmartCachingMiddleware:
         size: int | None = None,
         ttl_seconds: float | None = None,
         policy: CachePolicy = CachePolicy.LRU,
-    ) -> SmartCache:
-        """Get or create a cache with specified configuration."""
+    ) -> SmartCache | ShardedSmartCache:
+        """Get or create a cache with specified configuration.
+
+        Caches large enough to give each shard _MIN_SHARD_SIZE entries are
+        split into up to cache_shards independently locked shards.
+        """
+        # Caches are never replaced once created, so a hit needs no lock
+        cache = self.caches.get(name)
+        if cache is not None:
+            return cache
+
         with self._lock:
-            if name not in self.caches:
+            cache = self.caches.get(name)
+            if cache is None:
                 cache_size = size or self.default_cache_size
                 cache_ttl = ttl_seconds or self.default_ttl_seconds
 
-                self.caches[name] = SmartCache(
-                    max_size=cache_size, policy=policy, ttl_seconds=cache_ttl
-                )
-
+                # Publish the configuration first; lock-free readers that
+                # find the cache expect its configuration to exist
                 self.cache_configs[name] = {
                     "size": cache_size,
                     "ttl_seconds": cache_ttl,
                     "policy": policy,
                 }
-
-            return self.caches[name]
+                shards = self.cache_shards
+                while shards > 1 and cache_size // shards < _MIN_SHARD_SIZE:
+                    shards //= 2
+                if shards > 1:
+                    cache = ShardedSmartCache(
+                        max_size=cache_size,
+                        policy=policy,
+                        ttl_seconds=cache_ttl,
+                        shards=shards,
+                    )
+                else:
+                    cache = SmartCache(
+                        max_size=cache_size, policy=policy, ttl_seconds=cache_ttl
+                    )
+                self.caches[name] = cache
+
+            return cache
 
     def cached_call(
         self,
         cache_name: str,
         func: Callable,
         *args,
-        cache_key: str | None = None,
+        cache_key: Hashable | None = None,
         **kwargs,
     ) -> Any:
-        """Execute function with caching."""
-        cache = self.get_cache(cache_name)
+        """Execute function with caching.
+
+        Results that took less than memoize_threshold_ms to compute are not
+        stored, and functions that keep coming in under it skip the lookup too
+        until an execution crosses the threshold again.
+        """
+        return self._call_with_cache(
+            self.get_cache(cache_name), cache_name, func, args, kwargs, cache_key
+        )
+
+    def _call_with_cache(
+        self,
+        cache: SmartCache | ShardedSmartCache,
+        cache_name: str,
+        func: Callable,
+        args: tuple,
+        kwargs: Mapping[str, Any],
+        cache_key: Hashable | None = None,
+    ) -> Any:
+        """Body of cached_call for callers that already hold the cache."""
+        threshold_ms = self.memoize_threshold_ms
+        func_name = func.__name__
+        known_cheap = (
+            threshold_ms > 0
+            and self._cheap_streaks.get(func_name, 0) >= self.cheap_call_limit
+        )
 
         # Generate cache key
-        if cache_key is None:
-            cache_key = self._generate_cache_key(func.__name__, args, kwargs)
+        if cache_key is None and not known_cheap:
+            cache_key = self._make_cache_key(func_name, args, kwargs)
 
         start_time = time.perf_counter()
 
         # Check cache
-        cached_result = cache.get(cache_key)
-        if cached_result is not cache.MISS:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            self.monitor.record_operation(cache_name, duration_ms, cache_hit=True)
-            return cached_result
+        if not known_cheap:
+            cached_result = cache.get(cache_key)
+            if cached_result is not cache.MISS:
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                self.monitor.record_operation(cache_name, duration_ms, cache_hit=True)
+                return cached_result
 
         # Execute function
         try:
+            call_start = time.perf_counter()
             result = func(*args, **kwargs)
-            cache.put(cache_key, result)
+            if threshold_ms <= 0:
+                cache.put(cache_key, result)
+            elif (time.perf_counter() - call_start) * 1000 >= threshold_ms:
+                self._cheap_streaks.pop(func_name, None)
+                if cache_key is None:
+                    cache_key = self._make_cache_key(func_name, args, kwargs)
+                cache.put(cache_key, result)
+            else:
+                self._cheap_streaks[func_name] = (
+                    self._cheap_streaks.get(func_name, 0) + 1
+                )
 
             duration_ms = (time.perf_counter() - start_time) * 1000
             self.monitor.record_operation(cache_name, duration_ms, cache_hit=False)
@@ -288,12 +659,42 @@ class SmartCachingMiddleware:
             )
             raise
 
-    def _generate_cache_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
-        """Generate cache key from function arguments."""
-        import hashlib
-
-        key_data = f"{func_name}:{args}:{sorted(kwargs.items())}"
-        return hashlib.md5(key_data.encode(), usedforsecurity=False).hexdigest()[:16]
+    def _make_cache_key(
+        self, func_name: str, args: tuple, kwargs: Mapping[str, Any]
+    ) -> Hashable:
+        """Key a call on its arguments directly when they are hashable.
+
+        Like functools' typed caches, the key includes the argument types,
+        since 1, True and 1.0 compare equal; keyword arguments are sorted so
+        their order does not matter.
+        """
+        if func_name not in self._digest_keyed:
+            if kwargs:
+                items = tuple(sorted(kwargs.items()))
+                types = (*map(type, args), *(type(value) for _, value in items))
+            else:
+                items = ()
+                types = tuple(map(type, args))
+            key = (func_name, args, items, types)
+            try:
+                hash(key)
+                return key
+            except TypeError:
+                self._digest_keyed.add(func_name)
+        return self._generate_cache_key(func_name, args, kwargs)
+
+    def _generate_cache_key(
+        self, func_name: str, args: tuple, kwargs: Mapping[str, Any]
+    ) -> int:
+        """Generate a 64-bit cache key from function arguments."""
+        key_data = (func_name, args, tuple(sorted(kwargs.items())) if kwargs else ())
+        try:
+            payload = pickle.dumps(key_data, protocol=5)
+        except Exception:
+            # Arguments that cannot be pickled are keyed on their repr
+            payload = repr(key_data).encode()
+        digest = hashlib.blake2b(payload, digest_size=8).digest()
+        return int.from_bytes(digest, "little")
 
     def invalidate_cache(self, cache_name: str) -> None:
         """Invalidate specific cache."""
@@ -309,6 +710,9 @@ class SmartCachingMiddleware:
 
     def get_cache_statistics(self) -> dict[str, Any]:
         """Get comprehensive cache statistics."""
+        # The monitor has its own lock, so summarise before taking ours
+        monitor_summary = self.monitor.get_performance_summary()
+
         with self._lock:
             stats = {}
 
@@ -324,8 +728,8 @@ class SmartCachingMiddleware:
                     * 100,
                 }
 
-            stats["monitor_summary"] = self.monitor.get_performance_summary()
-            return stats
+        stats["monitor_summary"] = _thaw_summary(monitor_summary)
+        return stats
 
     def optimize_cache_sizes(self) -> dict[str, int]:
         """Optimize cache sizes based on usage patterns."""
@@ -354,19 +758,92 @@ class SmartCachingMiddleware:
 
         return optimizations
 
+    def optimize_cache_ttls(
+        self,
+        min_ttl_seconds: float = 1.0,
+        max_ttl_seconds: float = 3600.0,
+        rate_tolerance: float = 0.01,
+    ) -> dict[str, float]:
+        """Retune cache TTLs from the hit rate observed since the last call.
+
+        A cache whose hit rate improved over the previous interval gets a 20%
+        longer TTL; one whose hit rate fell is probably serving stale entries,
+        and its TTL shrinks by 20%. A hit rate within rate_tolerance of the
+        previous one is steady and keeps its TTL. Caches without a TTL, and
+        caches that saw no requests since the last call, are left alone.
+
+        Returns:
+            New TTL of every cache that was retuned
+        """
+        if not self.adaptive_ttl:
+            return {}
+
+        adjustments = {}
+        metrics_by_operation = self.monitor.metrics
+
+        with self._lock:
+            for cache_name, cache in self.caches.items():
+                ttl = cache.ttl_seconds
+                metrics = metrics_by_operation.get(cache_name)
+                if not ttl or metrics is None:
+                    continue
+
+                requests = metrics.total_requests
+                hits = metrics.cache_hits
+                last = self._ttl_ticks.get(cache_name)
+                if last is None or requests < last[0]:
+                    # First tick, or the monitor was reset since the last one
+                    rate = hits / requests if requests else 0.0
+                    self._ttl_ticks[cache_name] = (requests, hits, rate)
+                    continue
+
+                last_requests, last_hits, last_rate = last
+                if requests == last_requests:
+                    continue
+                rate = (hits - last_hits) / (requests - last_requests)
+                self._ttl_ticks[cache_name] = (requests, hits, rate)
+
+                if rate > last_rate + rate_tolerance:
+                    new_ttl = min(max_ttl_seconds, ttl * 1.2)
+                elif rate < last_rate - rate_tolerance:
+                    new_ttl = max(min_ttl_seconds, ttl * 0.8)
+                else:
+                    continue
+                if new_ttl != ttl:
+                    cache.retune_ttl(new_ttl)
+                    self.cache_configs[cache_name]["ttl_seconds"] = new_ttl
+                    adjustments[cache_name] = new_ttl
+
+        return adjustments
+
 
 def performance_tracking(
     operation_name: str | None = None,
     monitor: DynamicProgrammingMonitor | None = None,
+    sample_bits: int = 0,
 ) -> Callable[[F], F]:
-    """Decorator for performance tracking."""
+    """Decorator for performance tracking.
+
+    With ``sample_bits`` > 0 only one call in ``2**sample_bits`` is timed and
+    recorded, counting for all calls of its sampling period; the others run
+    untimed. Counts, totals and error rates are then estimates.
+    """
+    if sample_bits < 0:
+        raise ValueError("sample_bits must not be negative")
 
     def decorator(func: F) -> F:
         name = operation_name or func.__name__
         global_monitor = monitor or _global_monitor
+        sample_mask = (1 << sample_bits) - 1
+        sample_count = sample_mask + 1
+        # next() on itertools.count is atomic, so threads share one counter
+        calls = itertools.count(1)
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            if sample_mask and next(calls) & sample_mask:
+                return func(*args, **kwargs)
+
             start_time = time.perf_counter()
             error_occurred = False
 
@@ -383,6 +860,7 @@ def performance_tracking(
                     duration_ms,
                     error=error_occurred,
                     pattern_type="dynamic_programming",
+                    count=sample_count,
                 )
 
         return wrapper
@@ -390,6 +868,79 @@ def performance_tracking(
     return decorator
 
 
+# Shared keyword arguments of calls that have none; never mutated
+_NO_KWARGS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _specialized_cached_wrapper(
+    func: Callable,
+    cache: SmartCache | ShardedSmartCache,
+    cache_name: str,
+    cache_middleware: SmartCachingMiddleware,
+) -> Callable | None:
+    """Generate a caching wrapper with the same parameters as ``func``.
+
+    Explicit parameters spare the wrapper its own *args/**kwargs packing, and
+    defaults are passed on so equivalent calls share a cache entry. Returns
+    None when the signature cannot be mirrored.
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+
+    namespace: dict[str, Any] = {
+        "_dp_call": cache_middleware._call_with_cache,
+        "_dp_cache": cache,
+        "_dp_cache_name": cache_name,
+        "_dp_func": func,
+        "_dp_no_kwargs": _NO_KWARGS,
+    }
+    params: list[str] = []
+    positional: list[str] = []
+    keyword: list[str] = []
+    previous_kind = None
+
+    for parameter in signature.parameters.values():
+        name = parameter.name
+        kind = parameter.kind
+        if kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD) or (
+            name.startswith("_dp_")
+        ):
+            return None
+
+        if previous_kind is parameter.POSITIONAL_ONLY and kind is not previous_kind:
+            params.append("/")
+        if kind is parameter.KEYWORD_ONLY and previous_kind is not kind:
+            params.append("*")
+        previous_kind = kind
+
+        if parameter.default is parameter.empty:
+            params.append(name)
+        else:
+            namespace[f"_dp_default_{name}"] = parameter.default
+            params.append(f"{name}=_dp_default_{name}")
+        if kind is parameter.KEYWORD_ONLY:
+            keyword.append(f"{name!r}: {name}")
+        else:
+            positional.append(f"{name}, ")
+
+    if previous_kind is inspect.Parameter.POSITIONAL_ONLY:
+        params.append("/")
+
+    args_source = f"({''.join(positional)})"
+    kwargs_source = f"{{{', '.join(keyword)}}}" if keyword else "_dp_no_kwargs"
+    source = (
+        f"def wrapper({', '.join(params)}):\n"
+        "    return _dp_call(\n"
+        f"        _dp_cache, _dp_cache_name, _dp_func, {args_source}, {kwargs_source}\n"
+        "    )\n"
+    )
+    # The source contains only parameter identifiers; values go via namespace
+    exec(source, namespace)
+    return namespace["wrapper"]
+
+
 def smart_cache(
     cache_name: str,
     size: int = 256,
@@ -402,13 +953,20 @@ def smart_cache(
     def decorator(func: F) -> F:
         cache_middleware = middleware or _global_cache_middleware
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return cache_middleware.cached_call(cache_name, func, *args, **kwargs)
+        # Create the cache with its configuration once and bind it into the
+        # wrapper, so calls skip the per-call get_cache lookup
+        cache = cache_middleware.get_cache(cache_name, size, ttl_seconds, policy)
 
-        # Ensure cache exists with proper configuration
-        cache_middleware.get_cache(cache_name, size, ttl_seconds, policy)
+        wrapper = _specialized_cached_wrapper(
+            func, cache, cache_name, cache_middleware
+        )
+        if wrapper is None:
+            call_with_cache = cache_middleware._call_with_cache
+
+            def wrapper(*args, **kwargs):
+                return call_with_cache(cache, cache_name, func, args, kwargs)
 
+        functools.update_wrapper(wrapper, func)
         return wrapper
 
     return decorator
@@ -446,13 +1004,22 @@ def get_global_cache_middleware() -> SmartCachingMiddleware:
     return _global_cache_middleware
 
 
+def _thaw_summary(summary: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy a shared performance summary into plain dicts the caller owns."""
+    return {
+        key: dict(value) if isinstance(value, Mapping) else value
+        for key, value in summary.items()
+    }
+
+
 def generate_performance_report() -> dict[str, Any]:
     """Generate comprehensive performance report."""
     return {
-        "monitoring_summary": _global_monitor.get_performance_summary(),
+        "monitoring_summary": _thaw_summary(_global_monitor.get_performance_summary()),
         "cache_statistics": _global_cache_middleware.get_cache_statistics(),
         "top_performers": _global_monitor.get_top_performers(),
         "optimization_recommendations": _global_cache_middleware.optimize_cache_sizes(),
+        "ttl_adjustments": _global_cache_middleware.optimize_cache_ttls(),
         "timestamp": time.time(),
     }
 
@@ -400,6 +400,11 @@ class SmartCache(Generic[K, V]):
             self._fifo_order.clear()
             self._lfu_insertion_counter = 0
 
+    def retune_ttl(self, ttl_seconds: float | None) -> None:
+        """Change the time-to-live; existing entries expire against the new value."""
+        with self._lock:
+            self.ttl_seconds = ttl_seconds
+
     def size(self) -> int:
         """Get current cache size."""
         return len(self._cache)
@@ -416,6 +421,72 @@ class SmartCache(Generic[K, V]):
             }
 
 
+class ShardedSmartCache:
+    """SmartCache split into independently locked shards by key hash.
+
+    Threads working on keys in different shards never wait for each other.
+    Eviction runs per shard, so the policy is applied to each shard's share
+    of the capacity rather than to the whole cache.
+    """
+
+    MISS = SmartCache.MISS
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        policy: CachePolicy = CachePolicy.LRU,
+        ttl_seconds: float | None = None,
+        shards: int = 16,
+    ):
+        """Create ``shards`` SmartCaches sharing max_size between them."""
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a positive power of two")
+
+        self.max_size = max_size
+        self.policy = policy
+        self.ttl_seconds = ttl_seconds
+        shard_size = max(1, -(-max_size // shards))
+        self._shards: tuple[SmartCache[Hashable, Any], ...] = tuple(
+            SmartCache(max_size=shard_size, policy=policy, ttl_seconds=ttl_seconds)
+            for _ in range(shards)
+        )
+        self._mask = shards - 1
+
+    def get(self, key: Hashable) -> Any:
+        """Get value from the key's shard."""
+        return self._shards[hash(key) & self._mask].get(key)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value in the key's shard."""
+        self._shards[hash(key) & self._mask].put(key, value)
+
+    def retune_ttl(self, ttl_seconds: float | None) -> None:
+        """Change the time-to-live of every shard."""
+        self.ttl_seconds = ttl_seconds
+        for shard in self._shards:
+            shard.retune_ttl(ttl_seconds)
+
+    def clear(self) -> None:
+        """Clear all shards."""
+        for shard in self._shards:
+            shard.clear()
+
+    def size(self) -> int:
+        """Get current cache size across all shards."""
+        return sum(shard.size() for shard in self._shards)
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "size": self.size(),
+            "max_size": self.max_size,
+            "policy": self.policy.value,
+            "ttl_seconds": self.ttl_seconds,
+            "shards": len(self._shards),
+            "hit_rate": 0.0,  # Would need to track separately
+        }
+
+
 class DynamicRegistry(Generic[T]):
     """Generic registry with dynamic loading and intelligent caching."""
 
@@ -564,6 +635,9 @@ class DecisionTreeNode(Generic[T]):
 class StrategyPattern(ABC, Generic[T]):
     """Abstract base for strategy pattern implementation."""
 
+    # Empty so slotted subclasses stay free of a per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, context: Any) -> T:
         """Execute the strategy with given context."""
@@ -595,6 +669,11 @@ class StrategyRegistry(Generic[T]):
         # Sort by priority (highest first)
         self._strategies.sort(key=lambda s: s.priority, reverse=True)
 
+    @property
+    def strategies(self) -> tuple[StrategyPattern[T], ...]:
+        """Registered strategies in selection order (highest priority first)."""
+        return tuple(self._strategies)
+
     def select_strategy(self, context: Any) -> StrategyPattern[T] | None:
         """Select the best strategy for the given context."""
         start_time = time.perf_counter()
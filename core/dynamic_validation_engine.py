@@ -528,6 +528,7 @@ class DynamicValidationEngine:
         # Performance tracking
         self.metrics = PerformanceMetrics("dynamic_validation_engine")
         self.validator_metrics: dict[str, PerformanceMetrics] = {}
+        self._memoize_stats_fn = getattr(self.validate_optimized, "cache_stats", None)
 
         # Register default validators
         self._register_default_validators()
@@ -785,9 +786,9 @@ class DynamicValidationEngine:
             "engine_metrics": self.metrics,
             "validator_metrics": dict(self.validator_metrics),
             "cache_stats": self.result_cache.stats(),
-            "memoization_stats": getattr(
-                self.validate_optimized, "cache_stats", lambda: {}
-            )(),
+            "memoization_stats": (
+                self._memoize_stats_fn() if self._memoize_stats_fn else {}
+            ),
             "dependency_analysis": self.analyze_dependency_impact(),
         }
 
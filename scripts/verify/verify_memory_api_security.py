@@ -103,13 +103,13 @@ def test_memory_routes_security():
 
     # Should have authentication dependencies
     # Check for at least one user-related dependency
-    has_read_auth = "get_read_only_user" in content or "get_current_user_optional_dependency" in content
-    assert has_read_auth, "Memory routes should import at least one user-related dependency"
-    assert "get_admin_user" in content
+    has_read_auth = "UserRole.READ_ONLY" in content
+    assert has_read_auth, "Memory routes should declare read-only access policies"
+    assert "AuthRateLimitMiddleware" in content
 
     # Should have rate limiting calls
     assert "check_rate_limit" in content
-    assert "add_rate_limit_headers" in content
+    assert ".apply(response)" in content
 
     print("✓ Memory routes security test passed")
 
@@ -67,5 +67,58 @@ async def test_get_current_user_raises_401_when_credentials_none(auth_module):
     assert exc_info.value.detail == "Authentication required"
 
 
+@pytest.mark.usefixtures("auth_module")
+@pytest.mark.parametrize(
+    ("role", "required", "allowed"),
+    [
+        ("admin", "admin", True),
+        ("read_only", "admin", False),
+        ("admin", "read_only", True),
+        ("read_only", "read_only", True),
+        ("guest", "read_only", False),
+    ],
+)
+def test_require_role(role, required, allowed):
+    """Role checks accept exactly the roles allowed for each endpoint."""
+    import api.auth
+
+    user = {"user_id": "u", "role": role}
+    if allowed:
+        assert api.auth.require_role(user, required) is user
+    else:
+        with pytest.raises(HTTPException) as exc_info:
+            api.auth.require_role(user, required)
+        assert exc_info.value.status_code == 403
+
+
+@pytest.mark.usefixtures("auth_module")
+def test_log_auth_event_formats_lazily(caplog, monkeypatch):
+    """Auth events are formatted by logging and access logs are opt-in."""
+    import logging
+
+    import api.auth
+
+    with caplog.at_level(logging.INFO, logger="api.auth"):
+        api.auth.log_auth_event("login", "alice", "via api key")
+        api.auth.log_auth_event("denied", "bob")
+    assert [r.getMessage() for r in caplog.records] == [
+        "Auth event: login - User: alice - Details: via api key",
+        "Auth event: denied - User: bob",
+    ]
+
+    caplog.clear()
+    monkeypatch.setattr(api.auth, "_AUTH_ACCESS_SAMPLING_RATE", 1.0)
+    with caplog.at_level(logging.DEBUG, logger="api.auth"):
+        monkeypatch.setattr(api.auth, "_LOG_ACCESS_EVENTS", False)
+        api.auth.log_access_event({"user_id": "carol", "role": "admin"})
+        assert not caplog.records
+
+        monkeypatch.setattr(api.auth, "_LOG_ACCESS_EVENTS", True)
+        api.auth.log_access_event({"user_id": "carol", "role": "admin"})
+    assert [r.getMessage() for r in caplog.records] == [
+        "Auth event: access - User: carol - Details: Role: admin"
+    ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
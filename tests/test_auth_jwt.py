@@ -69,6 +69,160 @@ def test_jwt_verification(auth_setup):
     assert "exp" in payload
     assert "iat" in payload
     assert payload["type"] == "access"
+    assert isinstance(payload["iat"], int)
+    assert payload["exp"] - payload["iat"] == 24 * 3600
+
+
+def test_jwt_verification_uses_payload_cache(auth_setup):
+    """Verified payloads are served from cache without re-decoding."""
+    module = auth_setup['module']
+    config = module.AuthConfig({"MEMORY_API_JWT_SECRET": "cache-secret"})
+    token = module.create_jwt_token("cached_user", config=config)
+
+    first = module.verify_jwt_token(token, config=config)
+    assert len(config.jwt_cache) == 1
+
+    with patch.object(module, "_decode_hs256", side_effect=AssertionError("decoded")):
+        second = module.verify_jwt_token(token, config=config)
+
+    assert second == first
+    # Callers receive copies, so mutating one does not poison the cache
+    second["role"] = "tampered"
+    assert module.verify_jwt_token(token, config=config)["role"] == first["role"]
+
+
+def test_jwt_cache_skips_invalid_tokens_and_can_be_disabled(auth_setup):
+    """Invalid tokens are never cached and a zero TTL disables caching."""
+    module = auth_setup['module']
+    config = module.AuthConfig({"MEMORY_API_JWT_SECRET": "cache-secret"})
+
+    with pytest.raises(module.AuthError):
+        module.verify_jwt_token("not-a-token", config=config)
+    assert len(config.jwt_cache) == 0
+
+    disabled = module.AuthConfig(
+        {"MEMORY_API_JWT_SECRET": "cache-secret", "MEMORY_API_JWT_CACHE_TTL": "0"}
+    )
+    token = module.create_jwt_token("uncached_user", config=disabled)
+    module.verify_jwt_token(token, config=disabled)
+    assert not disabled.jwt_cache.enabled
+    assert len(disabled.jwt_cache) == 0
+
+
+def test_jwt_verification_requires_claims(auth_setup):
+    """Tokens missing required claims are rejected."""
+    import jwt
+
+    module = auth_setup['module']
+    config = module.AuthConfig({"MEMORY_API_JWT_SECRET": "claims-secret"})
+    token = jwt.encode(
+        {"role": "admin", "exp": 4102444800, "iat": 0},
+        config.jwt_secret,
+        algorithm="HS256",
+    )
+
+    with pytest.raises(module.AuthError, match="Invalid token"):
+        module.verify_jwt_token(token, config=config)
+
+
+def test_hs256_tokens_interoperate_with_pyjwt(auth_setup):
+    """Tokens are standard HS256 JWTs in both directions."""
+    import jwt
+
+    module = auth_setup['module']
+    config = module.AuthConfig({
+        "MEMORY_API_JWT_SECRET": "interop-secret-with-enough-length!",
+        "MEMORY_API_JWT_CACHE_TTL": "0",
+    })
+
+    ours = module.create_jwt_token("ours", config=config)
+    decoded = jwt.decode(ours, config.jwt_secret, algorithms=["HS256"])
+    assert decoded["user_id"] == "ours"
+
+    theirs = jwt.encode(
+        {"user_id": "theirs", "exp": 4102444800, "iat": 0, "extra": [1, 2]},
+        config.jwt_secret,
+        algorithm="HS256",
+        headers={"kid": "k1"},
+    )
+    payload = module.verify_jwt_token(theirs, config=config)
+    assert payload["user_id"] == "theirs"
+    assert payload["extra"] == [1, 2]
+
+
+def test_hs256_rejects_forged_tokens(auth_setup):
+    """Tampered signatures, other algorithms and bad claims are rejected."""
+    import base64
+    import json
+
+    module = auth_setup['module']
+    config = module.AuthConfig({
+        "MEMORY_API_JWT_SECRET": "forgery-secret",
+        "MEMORY_API_JWT_CACHE_TTL": "0",
+    })
+    token = module.create_jwt_token("victim", module.UserRole.READ_ONLY, config)
+    header, payload, signature = token.split(".")
+
+    def segment(obj):
+        raw = json.dumps(obj).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    forged_payload = segment({"user_id": "victim", "role": "admin",
+                              "exp": 4102444800, "iat": 0})
+    candidates = [
+        f"{header}.{forged_payload}.{signature}",
+        f"{segment({'alg': 'none', 'typ': 'JWT'})}.{payload}.",
+        f"{header}.{payload}.{signature[:-2]}AA",
+        f"{header}.{payload}",
+        "",
+    ]
+    for candidate in candidates:
+        with pytest.raises(module.AuthError, match="Invalid token"):
+            module.verify_jwt_token(candidate, config=config)
+
+    expired = module._encode_hs256(
+        {"user_id": "victim", "exp": 1, "iat": 0}, config.jwt_secret_bytes
+    )
+    with pytest.raises(module.AuthError, match="Token has expired"):
+        module.verify_jwt_token(expired, config=config)
+
+
+def test_jwt_cache_entries_expire(auth_setup):
+    """Cached payloads are dropped once their expiry passes."""
+    module = auth_setup['module']
+    cache = module._JWTPayloadCache(ttl_seconds=5, max_entries=2)
+    key = cache.make_key("token")
+
+    cache.put(key, {"user_id": "u", "exp": 0})
+    assert cache.get(key) is None
+
+    with patch.object(module.time, "time", return_value=1000.0):
+        cache.put(key, {"user_id": "u", "exp": 2000})
+    with patch.object(module.time, "time", return_value=1006.0):
+        assert cache.get(key) is None
+
+    # A token expiring before the cache TTL is dropped at its own exp
+    with patch.object(module.time, "time", return_value=1000.0):
+        cache.put(key, {"user_id": "u", "exp": 1002})
+    with patch.object(module.time, "time", return_value=1001.0):
+        assert cache.get(key) == {"user_id": "u", "exp": 1002}
+    with patch.object(module.time, "time", return_value=1002.0):
+        assert cache.get(key) is None
+
+
+
+def test_jwt_json_codec_matches_stdlib(auth_setup):
+    """The JWT JSON codec emits the same compact segments as stdlib json."""
+    import json
+
+    module = auth_setup['module']
+    payload = {"user_id": "u", "role": "admin", "exp": 4102444800, "iat": 0}
+    stdlib_bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    assert module._json_dumps(payload) == stdlib_bytes
+    assert module._json_loads(stdlib_bytes) == payload
+    with pytest.raises(ValueError):
+        module._json_loads(b"{not json")
 
 
 if __name__ == "__main__":
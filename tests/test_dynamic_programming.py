@@ -5,12 +5,14 @@ testing for all dynamic programming patterns implemented in the PhenomenalLayout
 system.
 """
 
+import asyncio
 import os
 import tempfile
 import time
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 # Performance testing configuration
@@ -36,6 +38,7 @@ from core.dynamic_layout_engine import (
 )
 from core.dynamic_middleware import (
     DynamicProgrammingMonitor,
+    MiddlewareMetrics,
     SmartCachingMiddleware,
     performance_tracking,
     smart_cache,
@@ -44,6 +47,7 @@ from core.dynamic_programming import (
     CachePolicy,
     DynamicRegistry,
     PerformanceMetrics,
+    ShardedSmartCache,
     SmartCache,
     memoize,
 )
@@ -51,11 +55,12 @@ from core.dynamic_validation_engine import (
     DynamicValidationEngine,
     OptimizedFileValidator,
 )
-from dolphin_ocr.layout import FitAnalysis, StrategyType
+from dolphin_ocr.layout import FitAnalysis, LayoutStrategy, StrategyType
 from models.user_choice_models import (
     ChoiceConflict,
     ChoiceScope,
     ChoiceType,
+    ConflictResolution,
     TranslationContext,
     UserChoice,
 )
@@ -231,6 +236,389 @@ class TestDynamicLayoutEngine:
         assert StrategyType.TEXT_WRAP in distribution
         assert StrategyType.HYBRID in distribution
 
+    def test_strategy_table_is_indexed_by_key_int(self):
+        """Each 4-bit key indexes the builder the original rule order picks."""
+        import itertools
+
+        engine = DynamicLayoutEngine()
+        assert isinstance(engine.strategy_table, tuple)
+
+        for conditions in itertools.product([True, False], repeat=4):
+            can_fit, can_scale, can_wrap, sufficient_lines = conditions
+            if can_fit:
+                expected = StrategyType.NONE
+            elif can_scale:
+                expected = StrategyType.FONT_SCALE
+            elif can_wrap or not sufficient_lines:
+                expected = StrategyType.TEXT_WRAP
+            else:
+                expected = StrategyType.HYBRID
+            index = StrategyKey(*conditions).to_int()
+            builder = engine.strategy_table[index]
+            assert builder.strategy_type == expected
+            assert not hasattr(builder, "__dict__")
+            assert engine._builders[index] is builder._build_fn
+
+    def test_optimized_strategy_matches_table_builder(self):
+        """The inline key picks the same builder as an explicit StrategyKey."""
+        import itertools
+
+        engine = DynamicLayoutEngine()
+        for can_fit, can_scale, can_wrap, lines_needed in itertools.product(
+            [True, False], [True, False], [True, False], [2, 5]
+        ):
+            analysis = FitAnalysis(
+                length_ratio=1.5,
+                one_line_width=100.0,
+                max_lines=3,
+                lines_needed=lines_needed,
+                can_fit_without_changes=can_fit,
+                required_scale_for_single_line=0.8,
+                can_scale_to_single_line=can_scale,
+                can_wrap_within_height=can_wrap,
+            )
+            key = StrategyKey(can_fit, can_scale, can_wrap, lines_needed <= 3)
+            expected = engine.strategy_table[key.to_int()].build(analysis)
+            assert engine.determine_strategy_optimized(analysis) == expected
+
+    def test_strategy_cache_is_keyed_on_fit_parameters(self):
+        """Analyses differing only in unused fields share a cached strategy."""
+        engine = DynamicLayoutEngine()
+        base = {
+            "max_lines": 3,
+            "lines_needed": 5,
+            "can_fit_without_changes": False,
+            "required_scale_for_single_line": 0.4,
+            "can_scale_to_single_line": False,
+            "can_wrap_within_height": False,
+        }
+        first = engine.determine_strategy_optimized(
+            FitAnalysis(length_ratio=1.5, one_line_width=100.0, **base)
+        )
+        second = engine.determine_strategy_optimized(
+            FitAnalysis(length_ratio=2.5, one_line_width=300.0, **base)
+        )
+
+        assert second is first
+        stats = engine.get_performance_metrics()["cache_stats"]
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+        engine.clear_caches()
+        assert engine.get_performance_metrics()["cache_stats"]["currsize"] == 0
+
+    def test_layout_strategy_can_handle_matches_key(self):
+        """can_handle accepts exactly the analyses with the strategy's key."""
+        import itertools
+
+        from core.dynamic_layout_engine import DynamicLayoutStrategy, LayoutContext
+
+        engine = DynamicLayoutEngine()
+        key = StrategyKey(False, False, False, True)
+        strategy = DynamicLayoutStrategy(key, engine.strategy_table[key.to_int()])
+        assert strategy.key_int == key.to_int()
+
+        for conditions in itertools.product([True, False], repeat=3):
+            for lines_needed in (2, 5):
+                analysis = FitAnalysis(
+                    length_ratio=1.5,
+                    one_line_width=100.0,
+                    max_lines=3,
+                    lines_needed=lines_needed,
+                    can_fit_without_changes=conditions[0],
+                    required_scale_for_single_line=0.8,
+                    can_scale_to_single_line=conditions[1],
+                    can_wrap_within_height=conditions[2],
+                )
+                expected = StrategyKey(*conditions, lines_needed <= 3) == key
+                assert strategy.can_handle(LayoutContext(analysis)) == expected
+
+    @pytest.mark.parametrize("dispatched", [True, False], ids=["dispatched", "python"])
+    def test_batch_strategies_match_scalar_path(self, dispatched):
+        """Columnar batch selection agrees with determine_strategy_optimized."""
+        import itertools
+
+        import core.dynamic_layout_engine as layout_module
+
+        analyses = [
+            FitAnalysis(
+                length_ratio=1.0,
+                one_line_width=100.0,
+                max_lines=max_lines,
+                lines_needed=lines_needed,
+                can_fit_without_changes=can_fit,
+                required_scale_for_single_line=0.45,
+                can_scale_to_single_line=can_scale,
+                can_wrap_within_height=can_wrap,
+            )
+            for can_fit, can_scale, can_wrap in itertools.product(
+                [True, False], repeat=3
+            )
+            for max_lines in range(0, 4)
+            for lines_needed in range(0, 6)
+        ]
+        engine = DynamicLayoutEngine(font_scale_limits=(0.5, 1.3))
+
+        with patch.multiple(
+            layout_module,
+            NUMBA_AVAILABLE=dispatched and layout_module.NUMBA_AVAILABLE,
+            _build_strategy_rows=(
+                layout_module._build_strategy_rows
+                if dispatched
+                else getattr(
+                    layout_module._build_strategy_rows,
+                    "py_func",
+                    layout_module._build_strategy_rows,
+                )
+            ),
+        ):
+            types, scales, wrap_lines = engine.batch_determine_strategies(
+                layout_module.FitAnalysisBatch.from_analyses(analyses)
+            )
+
+        for row, analysis in enumerate(analyses):
+            expected = engine.determine_strategy_optimized(analysis)
+            assert layout_module.BATCH_STRATEGY_TYPES[types[row]] == expected.type
+            assert scales[row] == expected.font_scale
+            assert wrap_lines[row] == expected.wrap_lines
+
+    def test_pattern_coverage_and_benchmark_use_batches(self):
+        """Coverage counts table indices from a columnar batch."""
+        engine = DynamicLayoutEngine()
+        fits = FitAnalysis(
+            length_ratio=1.0,
+            one_line_width=100.0,
+            max_lines=2,
+            lines_needed=1,
+            can_fit_without_changes=True,
+            required_scale_for_single_line=1.0,
+            can_scale_to_single_line=True,
+            can_wrap_within_height=True,
+        )
+        hybrid = FitAnalysis(
+            length_ratio=2.0,
+            one_line_width=200.0,
+            max_lines=3,
+            lines_needed=2,
+            can_fit_without_changes=False,
+            required_scale_for_single_line=0.3,
+            can_scale_to_single_line=False,
+            can_wrap_within_height=False,
+        )
+
+        coverage = engine.analyze_pattern_coverage([hybrid, fits, hybrid])
+        assert coverage["pattern_distribution"] == {1: 2, 15: 1}
+        assert coverage["most_common_patterns"][0] == (1, 2)
+        assert coverage["unique_patterns_found"] == 2
+        assert len(coverage["unused_patterns"]) == 14
+        assert engine.analyze_pattern_coverage([])["unused_patterns"] == list(
+            range(16)
+        )
+
+        result = engine.benchmark_vs_original([fits, hybrid], iterations=3)
+        assert result["test_cases"] == 2
+        assert result["optimized_time_seconds"] >= 0
+
+    def test_builders_use_engine_scale_limits(self):
+        """Table builders bind the engine's font scale limits."""
+        engine = DynamicLayoutEngine(font_scale_limits=(0.75, 1.1))
+        analysis = FitAnalysis(
+            length_ratio=2.0,
+            one_line_width=200.0,
+            max_lines=1,
+            lines_needed=2,
+            can_fit_without_changes=False,
+            required_scale_for_single_line=0.5,
+            can_scale_to_single_line=True,
+            can_wrap_within_height=False,
+        )
+
+        strategy = engine.determine_strategy_optimized(analysis)
+        assert strategy.type == StrategyType.FONT_SCALE
+        assert strategy.font_scale == 0.75
+
+    def test_hybrid_fast_path_matches_general_formula(self):
+        """The sufficient-lines HYBRID shortcut agrees with the full clamp."""
+        from core.dynamic_layout_engine import _build_hybrid
+
+        for limits in [(0.6, 1.2), (0.8, 1.0), (0.5, 0.9), (1.1, 1.5)]:
+            for max_lines in range(0, 8):
+                for lines_needed in range(0, 10):
+                    analysis = FitAnalysis(
+                        length_ratio=1.0,
+                        one_line_width=100.0,
+                        max_lines=max_lines,
+                        lines_needed=lines_needed,
+                        can_fit_without_changes=False,
+                        required_scale_for_single_line=0.5,
+                        can_scale_to_single_line=False,
+                        can_wrap_within_height=False,
+                    )
+                    scale = max(
+                        limits[0], min(limits[1], max_lines / max(1, lines_needed))
+                    )
+                    lines = min(max(1, int(lines_needed * scale)), max_lines)
+
+                    strategy = _build_hybrid(analysis, *limits)
+                    assert strategy.type == StrategyType.HYBRID
+                    assert strategy.font_scale == scale
+                    assert strategy.wrap_lines == lines
+
+    def test_engine_config_is_read_only_and_shared(self):
+        """Layout contexts share the engine's read-only configuration."""
+        from core.dynamic_layout_engine import DynamicLayoutStrategy
+
+        engine = DynamicLayoutEngine(font_scale_limits=(0.7, 1.1))
+        assert engine.engine_config["font_scale_min"] == 0.7
+        with pytest.raises(TypeError):
+            engine.engine_config["font_scale_min"] = 0.5
+
+        seen = []
+
+        class Recording(DynamicLayoutStrategy):
+            def execute(self, context):
+                seen.append(context.engine_config)
+                return super().execute(context)
+
+        key = StrategyKey(False, False, False, True)
+        engine.strategy_registry.register(
+            Recording(key, engine.strategy_table[key.to_int()], priority=1000)
+        )
+        analysis = FitAnalysis(
+            length_ratio=2.0,
+            one_line_width=200.0,
+            max_lines=3,
+            lines_needed=2,
+            can_fit_without_changes=False,
+            required_scale_for_single_line=0.3,
+            can_scale_to_single_line=False,
+            can_wrap_within_height=False,
+        )
+        engine.determine_strategy_with_context(analysis, translated_text="Dasein")
+        assert seen == [engine.engine_config]
+        assert seen[0] is engine.engine_config
+
+    def test_strategy_distribution_is_precomputed(self):
+        """The table distribution is counted once and copied out."""
+        engine = DynamicLayoutEngine()
+        distribution = engine.get_strategy_distribution()
+        assert distribution == {
+            StrategyType.NONE: 8,
+            StrategyType.FONT_SCALE: 4,
+            StrategyType.TEXT_WRAP: 3,
+            StrategyType.HYBRID: 1,
+        }
+
+        distribution[StrategyType.NONE] = 0
+        with patch.object(
+            engine, "_compute_strategy_distribution", side_effect=AssertionError
+        ):
+            assert engine.get_strategy_distribution()[StrategyType.NONE] == 8
+
+    def test_layout_strategy_registry_cache_has_no_ttl(self):
+        """Registered layout strategies are cached without expiry."""
+        from core.dynamic_layout_engine import (
+            LAYOUT_STRATEGY_REGISTRY,
+            get_layout_strategy,
+            register_layout_strategy,
+        )
+
+        assert LAYOUT_STRATEGY_REGISTRY._cache.ttl_seconds is None
+
+        register_layout_strategy(
+            "test_wrap",
+            lambda lines: LayoutStrategy(
+                type=StrategyType.TEXT_WRAP, font_scale=1.0, wrap_lines=lines
+            ),
+        )
+        first = get_layout_strategy("test_wrap", 3)
+        assert get_layout_strategy("test_wrap", 3) is first
+
+    def test_fitting_text_skips_strategy_cache(self):
+        """Analyses that fit unchanged return the shared NONE strategy."""
+        from core.dynamic_layout_engine import _NONE_STRATEGY
+
+        engine = DynamicLayoutEngine()
+        for can_scale in (True, False):
+            analysis = FitAnalysis(
+                length_ratio=0.9,
+                one_line_width=90.0,
+                max_lines=1,
+                lines_needed=3,
+                can_fit_without_changes=True,
+                required_scale_for_single_line=0.7,
+                can_scale_to_single_line=can_scale,
+                can_wrap_within_height=False,
+            )
+            assert engine.determine_strategy_optimized(analysis) is _NONE_STRATEGY
+
+        assert engine._strategy_for_key.cache_info().misses == 0
+
+    def test_strategy_timing_is_opt_in(self):
+        """Per-call timing is only recorded when metrics are enabled."""
+        engine = DynamicLayoutEngine()
+        analysis = FitAnalysis(
+            length_ratio=1.0,
+            one_line_width=100.0,
+            max_lines=2,
+            lines_needed=1,
+            can_fit_without_changes=True,
+            required_scale_for_single_line=1.0,
+            can_scale_to_single_line=True,
+            can_wrap_within_height=True,
+        )
+
+        engine._metrics_enabled = False
+        engine.determine_strategy_optimized(analysis)
+        assert engine.metrics.total_calls == 0
+
+        engine._metrics_enabled = True
+        engine.determine_strategy_optimized(analysis)
+        engine.determine_strategy_optimized(analysis)
+        assert engine.metrics.total_calls == 2
+
+    def test_context_strategy_uses_key_index_until_registry_grows(self):
+        """Context selection skips the registry scan unless it was extended."""
+        from core.dynamic_layout_engine import DynamicLayoutStrategy
+
+        engine = DynamicLayoutEngine()
+        analysis = FitAnalysis(
+            length_ratio=1.5,
+            one_line_width=100.0,
+            max_lines=3,
+            lines_needed=2,
+            can_fit_without_changes=False,
+            required_scale_for_single_line=0.8,
+            can_scale_to_single_line=True,
+            can_wrap_within_height=True,
+        )
+
+        with patch.object(
+            engine.strategy_registry, "execute", side_effect=AssertionError
+        ):
+            strategy = engine.determine_strategy_with_context(analysis, "Sein")
+        assert strategy == engine.determine_strategy_optimized(analysis)
+
+        # A registered extension is consulted through the registry again
+        custom = LayoutStrategy(type=StrategyType.HYBRID, font_scale=0.9)
+
+        class AlwaysHybrid(DynamicLayoutStrategy):
+            def execute(self, _context):
+                return custom
+
+            def can_handle(self, _context):
+                return True
+
+        key = StrategyKey(False, True, True, True)
+        engine.strategy_registry.register(
+            AlwaysHybrid(key, engine.strategy_table[key.to_int()], priority=1000)
+        )
+        assert engine.determine_strategy_with_context(analysis, "Sein") is custom
+
+        # Without any context the registry is not consulted at all
+        assert engine.determine_strategy_with_context(
+            analysis
+        ) == engine.determine_strategy_optimized(analysis)
+
     def test_o1_strategy_lookup_performance(self):
         """Test O(1) strategy lookup performance with percentile-based assertion."""
         engine = DynamicLayoutEngine()
@@ -306,6 +694,8 @@ class TestDynamicLayoutEngine:
         # Test bit mask conversion
         assert key1.to_int() == key2.to_int()
         assert key1.to_int() != key3.to_int()
+        assert key1.to_tuple() == (True, False, True, False)
+        assert StrategyKey(*key3.to_tuple()) == key3
 
     def test_backward_compatibility(self):
         """Test backward compatibility wrapper."""
@@ -332,6 +722,10 @@ class TestDynamicLayoutEngine:
         strategy = optimized_engine.determine_layout_strategy(analysis)
         assert strategy.type == StrategyType.NONE
 
+        # The unchanged-layout result is a shared singleton
+        engine = DynamicLayoutEngine()
+        assert engine.determine_strategy_optimized(analysis) is strategy
+
 
 class TestDynamicLanguageEngine:
     """Test dynamic language detection engine."""
@@ -370,25 +764,25 @@ class TestDynamicLanguageEngine:
         # Clear caches before test to ensure clean state
         detector.clear_caches()
 
-        # Get initial cache metrics from the memoized wrapper
-        wrapper_metrics = detector.detect_language_optimized.metrics()
-        initial_hits = wrapper_metrics.cache_hits
-        initial_misses = wrapper_metrics.cache_misses
+        # Get initial cache metrics from the detector's result cache path
+        detector_metrics = detector.metrics
+        initial_hits = detector_metrics.cache_hits
+        initial_misses = detector_metrics.cache_misses
 
         # First detection - should be a cache miss
         result1 = detector.detect_language_optimized(test_text)
-        after_first_hits = wrapper_metrics.cache_hits
-        after_first_misses = wrapper_metrics.cache_misses
+        after_first_hits = detector_metrics.cache_hits
+        after_first_misses = detector_metrics.cache_misses
 
         # Second detection - should be a cache hit
         result2 = detector.detect_language_optimized(test_text)
-        after_second_hits = wrapper_metrics.cache_hits
-        after_second_misses = wrapper_metrics.cache_misses
+        after_second_hits = detector_metrics.cache_hits
+        after_second_misses = detector_metrics.cache_misses
 
         # Assert results are equal
         assert result1 == result2
 
-        # Assert cache behavior deterministically via wrapper metrics
+        # Assert cache behavior deterministically via detector metrics
         assert (
             after_first_misses == initial_misses + 1
         ), "First call should be cache miss"
@@ -398,6 +792,33 @@ class TestDynamicLanguageEngine:
             after_second_misses == initial_misses + 1
         ), "Second call should not increase misses"
 
+    def test_result_cache_skips_fingerprint_on_hit(self):
+        """Cached results are found by text hash without fingerprinting."""
+        from core.dynamic_language_engine import TextFingerprint
+
+        detector = DynamicLanguageDetector()
+        text = "Der deutsche Text ist hier zu finden."
+        expected = detector.detect_language_optimized(text)
+
+        with patch.object(
+            TextFingerprint, "create", side_effect=AssertionError("fingerprinted")
+        ):
+            assert detector.detect_language_optimized(text) == expected
+            assert detector.detect_languages_batch([text]) == [expected]
+
+    def test_detection_timing_can_be_sampled_or_disabled(self):
+        """Detection timing honours metrics_enabled and metrics_sample_rate."""
+        text = "Der deutsche Text ist hier zu finden."
+
+        disabled = DynamicLanguageDetector(metrics_enabled=False)
+        disabled.detect_language_optimized(text)
+        assert disabled.metrics.total_calls == 0
+
+        sampled = DynamicLanguageDetector(metrics_sample_rate=4)
+        for _ in range(9):
+            sampled.detect_language_optimized(text)
+        assert sampled.metrics.total_calls == 3
+
     def test_batch_detection_performance(self):
         """Test batch detection performance."""
         detector = DynamicLanguageDetector()
@@ -440,6 +861,12 @@ class TestDynamicLanguageEngine:
         # Should have high confidence for clear German text
         assert analysis["confidence"] > 0.5
 
+        # The best and runner-up match a full ranking of all scores
+        ranked = sorted(analysis["all_scores"].values(), reverse=True)
+        assert analysis["detected_language"] == "German"
+        assert analysis["confidence"] == ranked[0]
+        assert analysis["confidence_gap"] == ranked[0] - ranked[1]
+
     def test_configurable_min_length(self):
         """Test configurable minimum text length functionality."""
         from core.dynamic_language_engine import DEFAULT_MIN_TEXT_LENGTH
@@ -478,6 +905,211 @@ class TestDynamicLanguageEngine:
         assert detector_custom._is_text_valid_for_detection("Hey") is True
         assert detector_custom._is_text_valid_for_detection("Hi") is False
 
+    def test_text_fingerprint_char_histogram(self):
+        """The array-backed histogram matches a per-character count."""
+        from collections import Counter
+
+        from core.dynamic_language_engine import TextFingerprint
+
+        text = "  Die Straße über den Fluß  "
+        fingerprint = TextFingerprint.create(text)
+        normalized = text.lower().strip()
+
+        assert fingerprint.normalized_text == normalized
+        assert fingerprint.char_histogram == dict(Counter(normalized))
+        assert fingerprint.unique_chars == set(normalized)
+        assert TextFingerprint.create("").char_histogram == {}
+
+    def test_text_fingerprint_cache_key(self):
+        """Cache keys are stable for equal texts and separate different ones."""
+        from core.dynamic_language_engine import TextFingerprint
+
+        base = "Der Hund " * 20
+        key = TextFingerprint.create(base + "läuft").to_cache_key()
+
+        assert isinstance(key, int)
+        assert TextFingerprint.create(base + "läuft").to_cache_key() == key
+        # Texts that differ only after the first 100 characters
+        assert TextFingerprint.create(base + "lauft").to_cache_key() != key
+
+    def test_fused_char_counts_match_per_language_regex(self):
+        """One fused character scan agrees with each language's chars_regex."""
+        detector = DynamicLanguageDetector()
+        text = "Straße Über ÉTÉ café niño À la française ñ"
+
+        counts = detector._count_char_matches(text)
+        for language, pattern in detector.compiled_patterns.items():
+            expected = (
+                len(pattern.chars_regex.findall(text)) if pattern.chars_regex else 0
+            )
+            assert counts[detector.language_index[language]] == expected
+            assert (
+                pattern.compute_score(text, set(text.split())).char_matches
+                == expected
+            )
+
+    @pytest.mark.parametrize("dispatched", [True, False], ids=["dispatched", "python"])
+    def test_alphabet_match_kernel(self, dispatched):
+        """The character counting kernel agrees with the NumPy lookup."""
+        from core.dynamic_language_engine import _count_alphabet_matches
+
+        kernel = (
+            _count_alphabet_matches
+            if dispatched
+            else getattr(_count_alphabet_matches, "py_func", _count_alphabet_matches)
+        )
+        detector = DynamicLanguageDetector()
+        alphabet = detector._alphabet_codes
+        matrix = detector._char_language_matrix
+
+        text = "straße über été café niño à la française ñ"
+        code_points = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+        counts = kernel(code_points, alphabet, matrix)
+
+        expected = np.zeros(matrix.shape[1], dtype=np.int64)
+        for code_point in code_points:
+            row = np.searchsorted(alphabet, code_point)
+            if row < len(alphabet) and alphabet[row] == code_point:
+                expected += matrix[row]
+        assert counts.tolist() == expected.tolist()
+        assert kernel(code_points[:0], alphabet, matrix).tolist() == [0] * len(
+            expected
+        )
+
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_fingerprint_char_counts_reuse_encoded_text(self, use_numba):
+        """Counting from a fingerprint's arrays matches counting its text."""
+        from core import dynamic_language_engine
+        from core.dynamic_language_engine import TextFingerprint
+
+        detector = DynamicLanguageDetector()
+        fingerprint = TextFingerprint.create("  Straße über den Fluß, café niño  ")
+        expected = detector._count_char_matches(fingerprint.normalized_text)
+
+        with patch.object(
+            dynamic_language_engine,
+            "NUMBA_AVAILABLE",
+            use_numba and dynamic_language_engine.NUMBA_AVAILABLE,
+        ):
+            counts = detector._count_fingerprint_char_matches(fingerprint)
+        assert counts.tolist() == expected.tolist()
+
+    def test_compiled_pattern_rejects_non_positive_weights(self):
+        """Pattern weights are validated once, when the pattern is built."""
+        from core.dynamic_language_engine import CompiledPattern
+
+        with pytest.raises(ValueError, match="Pattern weights must be positive"):
+            CompiledPattern(
+                language="Test",
+                words_regex=None,
+                chars_regex=None,
+                word_weight=1.0,
+                char_weight=1.0,
+                word_list=(),
+                char_list=(),
+                word_pattern_weight=0.0,
+            )
+
+    def test_fused_word_counts_match_per_language_regex(self):
+        """One fused word scan agrees with each language's words_regex."""
+        detector = DynamicLanguageDetector()
+        text = "Der Hund, die Katze: the dog and el perro. La la ist UND"
+
+        counts = detector._count_word_matches(text)
+        for language, pattern in detector.compiled_patterns.items():
+            expected = (
+                len({word.lower() for word in pattern.words_regex.findall(text)})
+                if pattern.words_regex
+                else 0
+            )
+            assert counts[detector.language_index[language]] == expected
+
+        # Punctuation next to a word does not hide it
+        german = detector.language_index["German"]
+        assert detector._count_word_matches("hund, der.")[german] == 1
+
+    def test_vectorized_scores_match_compute_score(self):
+        """Array scoring gives the same LanguageScores as compute_score."""
+        from core.dynamic_language_engine import TextFingerprint
+
+        detector = DynamicLanguageDetector()
+        for text in (
+            "Der schnelle braune Fuchs springt über den faulen Hund.",
+            "El rápido zorro marrón salta sobre el perro perezoso.",
+            "the and of to",
+            "ß",
+        ):
+            fingerprint = TextFingerprint.create(text)
+            scores = detector._compute_all_scores(fingerprint)
+            for language, pattern in detector.compiled_patterns.items():
+                expected = pattern.compute_score(
+                    fingerprint.normalized_text, fingerprint.word_set
+                )
+                assert scores[language] == expected
+                assert pattern.compute_confidence(
+                    fingerprint.normalized_text, fingerprint.word_set
+                ) == expected.confidence
+
+    def test_score_and_fingerprint_have_no_instance_dict(self):
+        """LanguageScore and TextFingerprint are slotted."""
+        from core.dynamic_language_engine import LanguageScore, TextFingerprint
+
+        score = LanguageScore(language="German", confidence=1.5)
+        assert not hasattr(score, "__dict__")
+        assert score.total_score == 1.5
+        assert not hasattr(TextFingerprint.create("der hund"), "__dict__")
+
+    def test_optimized_detectors_share_default_dynamic_detector(self):
+        """Patterns are compiled once for all default OptimizedLanguageDetectors."""
+        from core.dynamic_language_engine import OptimizedLanguageDetector
+
+        first = OptimizedLanguageDetector(original_detector=object())
+        second = OptimizedLanguageDetector(original_detector=object())
+        assert first.dynamic_detector is second.dynamic_detector
+
+        own = DynamicLanguageDetector()
+        injected = OptimizedLanguageDetector(
+            original_detector=object(), dynamic_detector=own
+        )
+        assert injected.dynamic_detector is own
+
+    def test_best_language_from_scores(self):
+        """Argmax picks the first top language and applies the threshold."""
+        detector = DynamicLanguageDetector(confidence_threshold=0.5)
+        names = detector._language_names
+
+        combined = np.zeros(len(names))
+        assert detector._best_language_from_scores(combined) == ("Unknown", 0.0)
+
+        combined[1] = combined[2] = 0.8
+        assert detector._best_language_from_scores(combined) == (names[1], 0.8)
+
+        combined[:] = 0.3
+        assert detector._best_language_from_scores(combined) == ("Unknown", 0.3)
+
+    def test_batch_detection_matches_single_detection(self):
+        """Scoring a batch together agrees with scoring each text alone."""
+        from core.dynamic_language_engine import TextFingerprint
+
+        texts = [
+            "Der schnelle braune Fuchs springt über den faulen Hund.",
+            "El rápido zorro marrón salta sobre el perro perezoso.",
+            "Le renard brun rapide saute par-dessus le chien paresseux.",
+            "The quick brown fox jumps over the lazy dog.",
+            "",
+            "1234567890 !!!",
+        ]
+        detector = DynamicLanguageDetector()
+        expected = [
+            detector._best_language_from_scores(
+                detector._compute_score_vectors(TextFingerprint.create(text))
+                .confidence
+            )[0]
+            for text in texts
+        ]
+
+        assert DynamicLanguageDetector().detect_languages_batch(texts) == expected
+
 
 class TestDynamicValidationEngine:
     """Test dynamic validation pipeline engine."""
@@ -519,19 +1151,19 @@ class TestDynamicValidationEngine:
 
             # Use memoization wrapper metrics
             # for deterministic cache assertions
-            wrapper_metrics = engine.validate_optimized.metrics()
-            initial_hits = wrapper_metrics.cache_hits
-            initial_misses = wrapper_metrics.cache_misses
+            detector_metrics = engine.validate_optimized.metrics()
+            initial_hits = detector_metrics.cache_hits
+            initial_misses = detector_metrics.cache_misses
 
             # First validation - should be a cache miss
             results1 = engine.validate_optimized(file_path)
-            after_first_hits = wrapper_metrics.cache_hits
-            after_first_misses = wrapper_metrics.cache_misses
+            after_first_hits = detector_metrics.cache_hits
+            after_first_misses = detector_metrics.cache_misses
 
             # Second validation - should be a cache hit
             results2 = engine.validate_optimized(file_path)
-            after_second_hits = wrapper_metrics.cache_hits
-            after_second_misses = wrapper_metrics.cache_misses
+            after_second_hits = detector_metrics.cache_hits
+            after_second_misses = detector_metrics.cache_misses
 
             # Results should be structurally equal in length
             assert len(results1) == len(results2)
@@ -607,6 +1239,40 @@ class TestDynamicChoiceEngine:
 
         assert key1.to_hash() == key2.to_hash()
 
+    def test_conflict_key_equality_uses_rounded_fields(self):
+        """Keys that round to the same canonical tuple are interchangeable."""
+        from core.dynamic_choice_engine import ConflictKey, ConflictType
+
+        key1 = ConflictKey(
+            conflict_type=ConflictType.TRANSLATION_MISMATCH,
+            severity_range=(0.0, 1.0),
+            context_similarity=0.501,
+            confidence_gap=0.3,
+            temporal_distance_hours=12.0,
+        )
+        key2 = ConflictKey(
+            conflict_type=ConflictType.TRANSLATION_MISMATCH,
+            severity_range=(0.0, 1.0),
+            context_similarity=0.5,
+            confidence_gap=0.3,
+            temporal_distance_hours=12.04,
+        )
+
+        assert key1 == key2
+        assert {key1: "strategy"}[key2] == "strategy"
+        assert not hasattr(key1, "__dict__")
+
+        # Equal severity ranges are interned to one tuple
+        bounds = [0.0, 1.0]
+        key3 = ConflictKey(
+            conflict_type=ConflictType.SCOPE_CONFLICT,
+            severity_range=tuple(bounds),
+            context_similarity=0.2,
+            confidence_gap=0.1,
+            temporal_distance_hours=1.0,
+        )
+        assert key3.severity_range is key1.severity_range
+
     def test_resolution_strategy_application(self):
         """Test resolution strategy application."""
         engine = DynamicConflictResolutionEngine()
@@ -711,6 +1377,203 @@ class TestDynamicChoiceEngine:
         avg_time_per_conflict = (duration / len(conflicts)) * 1000
         assert avg_time_per_conflict < 50  # Less than 50ms per conflict
 
+    def test_vectorized_batch_matches_single_resolution(self):
+        """Vectorized batch resolution agrees with per-conflict resolution."""
+        from core.dynamic_choice_engine import (
+            ConflictKey,
+            ConflictType,
+            DynamicConflictStrategy,
+            ResolutionStrategy,
+        )
+
+        def make_engine():
+            engine = DynamicConflictResolutionEngine()
+            # Claims conflicts with dissimilar contexts and a large gap
+            engine.strategy_registry.register(
+                DynamicConflictStrategy(
+                    conflict_key=ConflictKey(
+                        conflict_type=ConflictType.CONFIDENCE_DISAGREEMENT,
+                        severity_range=(0.0, 1.0),
+                        context_similarity=0.0,
+                        confidence_gap=0.5,
+                        temporal_distance_hours=0.0,
+                    ),
+                    resolution_strategy=ResolutionStrategy(
+                        ConflictResolution.HIGHEST_CONFIDENCE,
+                        confidence_threshold=0.8,
+                    ),
+                    priority=100,
+                )
+            )
+            return engine
+
+        conflicts = []
+        for i in range(24):
+            context_a = TranslationContext(
+                sentence_context=f"Context {i}",
+                semantic_field="philosophy",
+                source_language="German",
+                target_language="English",
+            )
+            context_b = TranslationContext(
+                sentence_context=f"Context {i}",
+                semantic_field="philosophy" if i % 3 else "law",
+                source_language="German",
+                target_language="English" if i % 2 else "French",
+            )
+            choice_a = UserChoice(
+                choice_id=f"choice_a_{i}",
+                neologism_term=f"term_{i}",
+                choice_type=ChoiceType.TRANSLATE,
+                translation_result=f"translation_a_{i}",
+                context=context_a,
+                choice_scope=ChoiceScope.CONTEXTUAL,
+                confidence_level=0.9 if i % 4 else 0.3,
+                created_at=f"2023-01-01T{10 + i % 5:02d}:00:00",
+            )
+            choice_b = UserChoice(
+                choice_id=f"choice_b_{i}",
+                neologism_term=f"term_{i}",
+                choice_type=ChoiceType.TRANSLATE,
+                translation_result=f"translation_b_{i}",
+                context=context_b,
+                choice_scope=ChoiceScope.CONTEXTUAL,
+                confidence_level=0.4 + (i % 3) * 0.2,
+                created_at="2023-01-01T12:00:00",
+            )
+            conflicts.append(
+                ChoiceConflict(
+                    conflict_id=f"conflict_{i}",
+                    neologism_term=f"term_{i}",
+                    choice_a=choice_a,
+                    choice_b=choice_b,
+                )
+            )
+
+        single_engine = make_engine()
+        expected = {
+            c.conflict_id: single_engine.resolve_conflict_optimized(c)
+            for c in conflicts
+        }
+
+        # Binned strategy lookup agrees with a linear registry scan
+        from core.dynamic_choice_engine import ConflictContext
+
+        for conflict in conflicts:
+            context = ConflictContext(conflict=conflict)
+            linear = next(
+                (
+                    s
+                    for s in single_engine.strategy_registry.strategies
+                    if s.can_handle(context)
+                ),
+                None,
+            )
+            assert single_engine._select_strategy(context) is linear
+
+        batch_engine = make_engine()
+        assert batch_engine._resolve_conflicts_vectorized(conflicts) == expected
+        # Second pass is served from the resolution cache
+        assert batch_engine.resolve_conflicts_batch(conflicts) == expected
+
+        async_engine = make_engine()
+        assert asyncio.run(async_engine.resolve_conflicts_batch_async(conflicts)) == (
+            expected
+        )
+
+    def test_resolution_timing_is_sampled(self):
+        """Resolution timing is off by default and sampled when enabled."""
+        conflict = ChoiceConflict(
+            conflict_id="sampled",
+            neologism_term="Dasein",
+            choice_a=UserChoice(
+                choice_id="a",
+                neologism_term="Dasein",
+                choice_type=ChoiceType.TRANSLATE,
+            ),
+            choice_b=UserChoice(
+                choice_id="b",
+                neologism_term="Dasein",
+                choice_type=ChoiceType.TRANSLATE,
+            ),
+        )
+
+        engine = DynamicConflictResolutionEngine()
+        engine.resolve_conflict_optimized(conflict)
+        assert engine.metrics.total_calls == 0
+
+        engine._metrics_enabled = True
+        engine._resolve_count = 0
+        for _ in range(65):
+            engine.resolve_conflict_optimized(conflict)
+        assert engine.metrics.total_calls == 2
+
+    def test_conflict_context_caches_similarity_and_gap(self):
+        """Context similarity and confidence gap are computed once."""
+        from core.dynamic_choice_engine import ConflictContext
+
+        conflict = ChoiceConflict(
+            conflict_id="cached",
+            neologism_term="Dasein",
+            choice_a=UserChoice(
+                choice_id="a",
+                neologism_term="Dasein",
+                choice_type=ChoiceType.TRANSLATE,
+                confidence_level=0.9,
+            ),
+            choice_b=UserChoice(
+                choice_id="b",
+                neologism_term="Dasein",
+                choice_type=ChoiceType.TRANSLATE,
+                confidence_level=0.4,
+            ),
+        )
+        context = ConflictContext(conflict=conflict)
+
+        with patch.object(
+            TranslationContext, "calculate_similarity", return_value=0.5
+        ) as similarity:
+            engine = DynamicConflictResolutionEngine()
+            for strategy in engine.strategy_registry.strategies:
+                strategy.can_handle(context)
+            assert context.calculate_context_similarity() == 0.5
+
+        similarity.assert_called_once()
+        assert context.calculate_confidence_gap() == pytest.approx(0.5)
+
+        # Contexts and strategies are slotted
+        strategy = engine.strategy_registry.strategies[0]
+        assert not hasattr(context, "__dict__")
+        assert not hasattr(strategy, "__dict__")
+        assert not hasattr(strategy.resolution_strategy, "__dict__")
+
+    def test_default_conflict_resolver_is_shared(self):
+        """Default resolvers are reused per set of keyword arguments."""
+        from core.dynamic_choice_engine import get_conflict_resolver
+
+        get_conflict_resolver.clear_cache()
+        try:
+            resolver = get_conflict_resolver(cache_size=64)
+            assert get_conflict_resolver(cache_size=64) is resolver
+            assert get_conflict_resolver(cache_size=128) is not resolver
+
+            get_conflict_resolver.clear_cache()
+            assert get_conflict_resolver(cache_size=64) is not resolver
+        finally:
+            get_conflict_resolver.clear_cache()
+
+    def test_user_choice_manager_stub_reuses_noops(self, caplog):
+        """Stub methods are cached and only logged on their first call."""
+        from core.dynamic_choice_engine import _UserChoiceManagerStub
+
+        stub = _UserChoiceManagerStub("unused.db")
+        assert stub.get_choice is stub.get_choice
+
+        with caplog.at_level("DEBUG"):
+            assert stub.get_choice("term") is None
+            assert stub.get_choice("term") is None
+        assert sum("get_choice" in r.getMessage() for r in caplog.records) == 1
+
 
 class TestDynamicMiddleware:
     """Test performance monitoring and caching middleware."""
@@ -734,6 +1597,168 @@ class TestDynamicMiddleware:
         assert test_metrics["cache_hit_rate"] == pytest.approx(33.33, rel=1e-2)
         assert test_metrics["error_rate"] == pytest.approx(33.33, rel=1e-2)
 
+    def test_metrics_track_duration_extremes_without_sentinel(self):
+        """Min and max start at 0.0 and follow the first request onwards."""
+        metrics = MiddlewareMetrics()
+        assert (metrics.min_duration_ms, metrics.max_duration_ms) == (0.0, 0.0)
+
+        metrics.record_request(3.0)
+        assert (metrics.min_duration_ms, metrics.max_duration_ms) == (3.0, 3.0)
+        metrics.record_request(5.0)
+        metrics.record_request(2.0)
+        assert (metrics.min_duration_ms, metrics.max_duration_ms) == (2.0, 5.0)
+
+        merged = MiddlewareMetrics()
+        merged.merge(MiddlewareMetrics())
+        merged.merge(metrics)
+        assert (merged.min_duration_ms, merged.max_duration_ms) == (2.0, 5.0)
+        assert merged.total_requests == 3
+
+    def test_monitor_records_concurrently_per_operation(self):
+        """Concurrent recordings to separate operations are all counted."""
+        import threading
+
+        monitor = DynamicProgrammingMonitor()
+
+        def record(operation: str) -> None:
+            for _ in range(500):
+                monitor.record_operation(
+                    operation, 1.0, cache_hit=True, pattern_type="dp"
+                )
+
+        threads = [
+            threading.Thread(target=record, args=(f"op_{i % 4}",)) for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = monitor.get_performance_summary()
+        assert summary["total_operations"] == 4000
+        assert summary["pattern_usage"] == {"dp": 4000}
+        for i in range(4):
+            assert summary[f"op_{i}"]["total_requests"] == 1000
+
+        monitor.reset_metrics()
+        monitor.record_operation("op_0", 2.0)
+        assert monitor.get_performance_summary()["total_operations"] == 1
+
+    def test_monitor_merges_per_thread_shards(self):
+        """Threads recording lock-free into their own shards merge exactly."""
+        import threading
+
+        monitor = DynamicProgrammingMonitor(summary_ttl_seconds=0.0)
+        barrier = threading.Barrier(4)
+
+        def record(duration_ms: float) -> None:
+            barrier.wait()
+            for i in range(250):
+                monitor.record_operation(
+                    "shared", duration_ms, cache_hit=i % 2 == 0, pattern_type="dp"
+                )
+
+        threads = [
+            threading.Thread(target=record, args=(float(i + 1),)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        monitor.record_operation("shared", 0.5, error=True, pattern_type="lookup")
+
+        merged = monitor.metrics["shared"]
+        assert merged.total_requests == 1001
+        assert merged.cache_hits == 500
+        assert merged.error_count == 1
+        assert merged.min_duration_ms == 0.5
+        assert merged.max_duration_ms == 4.0
+        assert merged.total_duration_ms == pytest.approx(250 * 10 + 0.5)
+
+        # Finished threads were folded away; their counts remain
+        assert len(monitor._shards) == 1
+        summary = monitor.get_performance_summary()
+        assert summary["total_operations"] == 1001
+        assert summary["pattern_usage"] == {"dp": 1000, "lookup": 1}
+
+    def test_monitor_prunes_shards_of_finished_threads_without_reads(self):
+        """Thread churn with no metric reads keeps the shard list bounded."""
+        import threading
+
+        monitor = DynamicProgrammingMonitor(summary_ttl_seconds=0.0)
+
+        for _ in range(200):
+            thread = threading.Thread(
+                target=monitor.record_operation, args=("churn", 1.0)
+            )
+            thread.start()
+            thread.join()
+
+        # Each new shard folds away the finished threads' shards
+        assert len(monitor._shards) == 1
+        assert monitor.metrics["churn"].total_requests == 200
+
+    def test_performance_summary_is_cached_snapshot(self):
+        """Summaries are shared read-only snapshots until the TTL passes."""
+        monitor = DynamicProgrammingMonitor(summary_ttl_seconds=60.0)
+        monitor.record_operation("op", 1.0)
+
+        summary = monitor.get_performance_summary()
+        assert summary["total_operations"] == 1
+        with pytest.raises(TypeError):
+            summary["total_operations"] = 0
+        with pytest.raises(TypeError):
+            summary["op"]["total_requests"] = 0
+
+        monitor.record_operation("op", 1.0)
+        assert monitor.get_performance_summary() is summary
+
+        monitor.reset_metrics()
+        assert monitor.get_performance_summary()["total_operations"] == 0
+
+        uncached = DynamicProgrammingMonitor(summary_ttl_seconds=0.0)
+        uncached.record_operation("op", 1.0)
+        assert uncached.get_performance_summary()["total_operations"] == 1
+        uncached.record_operation("op", 1.0)
+        assert uncached.get_performance_summary()["total_operations"] == 2
+
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_top_performers_rank_by_improvement(self, use_numba):
+        """Vectorized ranking matches the per-operation estimate and order."""
+        from core import dynamic_middleware
+
+        monitor = DynamicProgrammingMonitor(summary_ttl_seconds=0.0)
+        for name, hits in (("a", 1), ("b", 3), ("c", 0), ("d", 3), ("e", 2)):
+            for _ in range(4):
+                monitor.record_operation(name, 2.0)
+            for _ in range(hits):
+                monitor.record_operation(name, 2.0, cache_hit=True)
+
+        def expected(metrics):
+            if metrics.cache_hits == 0:
+                return 0.0
+            saved = metrics.cache_hits * (
+                metrics.avg_duration_ms * monitor.cache_time_savings_factor
+            )
+            return (saved / metrics.total_duration_ms) * 100
+
+        with patch.object(
+            dynamic_middleware,
+            "NUMBA_AVAILABLE",
+            use_numba and dynamic_middleware.NUMBA_AVAILABLE,
+        ):
+            summary = monitor.get_performance_summary()
+            top = monitor.get_top_performers(limit=3)
+            everyone = monitor.get_top_performers(limit=10)
+            nobody = monitor.get_top_performers(limit=0)
+
+        for name, metrics in monitor.metrics.items():
+            assert summary[name]["performance_improvement"] == expected(metrics)
+        # Ties keep recording order, as a stable sort would
+        assert [p["operation"] for p in top] == ["b", "d", "e"]
+        assert [p["operation"] for p in everyone] == ["b", "d", "e", "a", "c"]
+        assert nobody == []
+
     def test_caching_middleware(self):
         """Test smart caching middleware."""
         middleware = SmartCachingMiddleware()
@@ -759,6 +1784,246 @@ class TestDynamicMiddleware:
         stats = middleware.get_cache_statistics()
         assert "test_cache" in stats
 
+        # The statistics own their copy of the shared monitor summary
+        stats["monitor_summary"]["test_cache"]["total_requests"] = -1
+        summary = middleware.monitor.get_performance_summary()
+        assert summary["test_cache"]["total_requests"] == 3
+
+    def test_cheap_results_are_not_memoized(self):
+        """Fast results skip the cache; repeat offenders skip the lookup too."""
+        middleware = SmartCachingMiddleware(
+            memoize_threshold_ms=5.0, cheap_call_limit=2
+        )
+        cache = middleware.get_cache("selective")
+        clock = [0.0]
+
+        def timed(seconds):
+            clock[0] += seconds
+            return seconds
+
+        with (
+            patch(
+                "core.dynamic_middleware.time.perf_counter",
+                side_effect=lambda: clock[0],
+            ),
+            patch.object(cache, "get", wraps=cache.get) as get,
+        ):
+            middleware.cached_call("selective", timed, 0.001)
+            middleware.cached_call("selective", timed, 0.001)
+            assert cache.size() == 0
+            assert get.call_count == 2
+
+            # Known cheap: no lookup, but the call is still timed
+            middleware.cached_call("selective", timed, 0.001)
+            assert get.call_count == 2
+            assert middleware._cheap_streaks["timed"] == 3
+
+            # A slow execution is memoized and clears the streak
+            middleware.cached_call("selective", timed, 0.010)
+            assert cache.size() == 1
+            assert "timed" not in middleware._cheap_streaks
+
+    def test_cache_keys_are_integer_digests(self):
+        """Cache keys are stable 64-bit ints, also for unpicklable arguments."""
+        import threading
+
+        middleware = SmartCachingMiddleware()
+
+        key = middleware._generate_cache_key("f", (1, "a"), {"b": 2, "a": 1})
+        assert isinstance(key, int)
+        assert 0 <= key < 2**64
+        assert key == middleware._generate_cache_key("f", (1, "a"), {"a": 1, "b": 2})
+        assert key != middleware._generate_cache_key("f", (1, "b"), {"a": 1, "b": 2})
+        assert key != middleware._generate_cache_key("g", (1, "a"), {"a": 1, "b": 2})
+
+        lock = threading.Lock()
+        assert middleware._generate_cache_key(
+            "f", (lock,), {}
+        ) == middleware._generate_cache_key("f", (lock,), {})
+
+    def test_hashable_calls_are_keyed_on_their_arguments(self):
+        """Hashable arguments skip the digest; unhashable ones still cache."""
+        middleware = SmartCachingMiddleware()
+
+        def total(values, scale=1):
+            return sum(values) * scale
+
+        with patch.object(
+            middleware, "_generate_cache_key", side_effect=AssertionError
+        ):
+            assert middleware.cached_call("keys", total, (1, 2), scale=2) == 6
+            assert middleware.cached_call("keys", total, (1, 2), scale=2) == 6
+        key = ("total", ((1, 2),), (("scale", 2),), (tuple, int))
+        assert middleware.get_cache("keys").get(key)
+
+        assert middleware.cached_call("keys", total, [1, 2]) == 3
+        assert middleware.cached_call("keys", total, [1, 2]) == 3
+        assert "total" in middleware._digest_keyed
+        stats = middleware.monitor.get_performance_summary()["keys"]
+        assert stats["cache_hit_rate"] == pytest.approx(50.0)
+
+    def test_cache_keys_distinguish_equal_values_of_other_types(self):
+        """1, True and 1.0 get separate entries; keyword order does not."""
+        middleware = SmartCachingMiddleware()
+
+        @smart_cache("typed_cache", middleware=middleware)
+        def type_name(x):
+            return type(x).__name__
+
+        assert [type_name(1), type_name(True), type_name(1.0)] == [
+            "int",
+            "bool",
+            "float",
+        ]
+
+        calls = []
+
+        def pair(a=0, b=0):
+            calls.append((a, b))
+            return a - b
+
+        assert middleware.cached_call("typed_cache", pair, a=1, b=2) == -1
+        assert middleware.cached_call("typed_cache", pair, b=2, a=1) == -1
+        assert calls == [(1, 2)]
+
+    def test_smart_cache_wrapper_mirrors_signature(self):
+        """Generated wrappers keep the signature and normalise defaults."""
+        import inspect
+
+        middleware = SmartCachingMiddleware()
+        calls = []
+
+        @smart_cache("signature_cache", middleware=middleware)
+        def scaled(value, /, factor=2, *, offset=0):
+            calls.append((value, factor, offset))
+            return value * factor + offset
+
+        @smart_cache("signature_cache", middleware=middleware)
+        def total(*values):
+            calls.append(values)
+            return sum(values)
+
+        assert inspect.signature(scaled) == inspect.signature(scaled.__wrapped__)
+        assert scaled(3) == 6
+        assert scaled(3, 2) == 6
+        assert scaled(3, factor=2, offset=0) == 6
+        assert scaled(3, offset=1) == 7
+        with pytest.raises(TypeError):
+            scaled(value=3)
+
+        assert total(1, 2) == 3
+        assert total(1, 2) == 3
+        assert calls == [(3, 2, 0), (3, 2, 1), (1, 2)]
+
+    def test_smart_cache_binds_its_cache(self):
+        """Decorated calls reuse the cache bound at decoration time."""
+        middleware = SmartCachingMiddleware()
+
+        @smart_cache("bound_cache", size=8, middleware=middleware)
+        def keyed(cache_key, *, scale=1):
+            return cache_key * scale
+
+        cache = middleware.caches["bound_cache"]
+        assert middleware.get_cache("bound_cache") is cache
+        assert middleware.cache_configs["bound_cache"]["size"] == 8
+
+        with patch.object(middleware, "get_cache", side_effect=AssertionError):
+            assert keyed(2) == 2
+            assert keyed(2, scale=3) == 6
+            assert keyed(2, scale=3) == 6
+        assert cache.size() == 2
+        assert middleware.monitor.metrics["bound_cache"].cache_hits == 1
+
+    def test_large_caches_are_sharded(self):
+        """Caches split into power-of-two shards while shards stay useful."""
+        middleware = SmartCachingMiddleware()
+        sharded = middleware.get_cache("large", size=256, ttl_seconds=30.0)
+        assert isinstance(sharded, ShardedSmartCache)
+        assert sharded.stats()["shards"] == 16
+        assert isinstance(middleware.get_cache("mid", size=64), ShardedSmartCache)
+        assert middleware.get_cache("mid").stats()["shards"] == 4
+        assert isinstance(middleware.get_cache("small", size=16), SmartCache)
+        unsharded = SmartCachingMiddleware(cache_shards=1).get_cache("x", size=256)
+        assert isinstance(unsharded, SmartCache)
+
+        for i in range(100):
+            sharded.put(i, i * i)
+        assert sharded.size() == 100
+        assert sharded.get(7) == 49
+        assert sharded.get(1000) is sharded.MISS is SmartCache.MISS
+
+        sharded.retune_ttl(5.0)
+        assert sharded.ttl_seconds == 5.0
+        assert all(shard.ttl_seconds == 5.0 for shard in sharded._shards)
+        sharded.clear()
+        assert sharded.size() == 0
+
+        with pytest.raises(ValueError, match="power of two"):
+            ShardedSmartCache(shards=3)
+        with pytest.raises(ValueError, match="power of two"):
+            SmartCachingMiddleware(cache_shards=12)
+
+    def test_cache_ttls_follow_interval_hit_rate(self):
+        """TTLs grow while the hit rate improves and shrink when it drops."""
+        middleware = SmartCachingMiddleware()
+        cache = middleware.get_cache("ttl", ttl_seconds=10.0)
+        middleware.get_cache("forever")
+
+        def tick(hits, misses):
+            for _ in range(hits):
+                middleware.monitor.record_operation("ttl", 1.0, cache_hit=True)
+            for _ in range(misses):
+                middleware.monitor.record_operation("ttl", 1.0)
+            middleware.monitor.record_operation("forever", 1.0)
+            return middleware.optimize_cache_ttls(max_ttl_seconds=13.0)
+
+        # The first tick only records a baseline
+        assert tick(1, 3) == {}
+        assert tick(3, 1) == {"ttl": pytest.approx(12.0)}
+        assert tick(4, 0) == {"ttl": pytest.approx(13.0)}
+        assert cache.ttl_seconds == pytest.approx(13.0)
+        assert middleware.cache_configs["ttl"]["ttl_seconds"] == cache.ttl_seconds
+
+        # A quiet interval changes nothing; a falling hit rate shrinks the TTL
+        assert middleware.optimize_cache_ttls() == {}
+        assert tick(0, 4) == {"ttl": pytest.approx(10.4)}
+        assert middleware.get_cache("forever").ttl_seconds is None
+
+        assert SmartCachingMiddleware(adaptive_ttl=False).optimize_cache_ttls() == {}
+
+    def test_cache_ttls_hold_at_a_steady_hit_rate(self):
+        """A steady hit rate keeps the TTL instead of wearing it down."""
+        middleware = SmartCachingMiddleware()
+        cache = middleware.get_cache("steady", ttl_seconds=300.0)
+
+        for _ in range(8):
+            for _ in range(9):
+                middleware.monitor.record_operation("steady", 1.0, cache_hit=True)
+            middleware.monitor.record_operation("steady", 1.0)
+            assert middleware.optimize_cache_ttls() == {}
+
+        assert cache.ttl_seconds == 300.0
+
+    def test_performance_tracking_samples_calls(self):
+        """Sampled tracking times one call per period and scales the counts."""
+        monitor = DynamicProgrammingMonitor(summary_ttl_seconds=0.0)
+
+        @performance_tracking("sampled", monitor=monitor, sample_bits=2)
+        def sampled(x):
+            return x + 1
+
+        with patch("core.dynamic_middleware.time.perf_counter") as perf_counter:
+            perf_counter.return_value = 0.0
+            assert [sampled(i) for i in range(10)] == list(range(1, 11))
+        assert perf_counter.call_count == 4
+
+        metrics = monitor.metrics["sampled"]
+        assert metrics.total_requests == 8
+        assert monitor.pattern_usage["dynamic_programming"] == 8
+
+        with pytest.raises(ValueError, match="sample_bits"):
+            performance_tracking(sample_bits=-1)
+
     def test_decorator_integration(self):
         """Test decorator integration."""
         call_count = 0
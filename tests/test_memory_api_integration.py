@@ -284,3 +284,37 @@ def test_rate_limiting_headers(reload_app_with_env, rate_limiting):
     else:
         assert "X-RateLimit-Limit" not in response.headers, "Rate limiting headers should be absent"
         assert "X-RateLimit-Remaining" not in response.headers, "Rate limit remaining should be absent"
+
+
+def test_every_memory_route_has_access_policy():
+    """AuthRateLimitMiddleware must know about every memory endpoint."""
+    from api.memory_routes import ROUTE_POLICIES, router
+
+    declared = {
+        (method, route.path)
+        for route in router.routes
+        for method in route.methods
+    }
+    assert declared == set(ROUTE_POLICIES)
+
+
+def test_rate_limit_exceeded_is_answered_by_middleware(reload_app_with_env):
+    """Denied requests get a 429 with rate limit headers before routing."""
+    client = reload_app_with_env({
+        "MEMORY_API_ENABLE_RATE_LIMITING": "true",
+        "MEMORY_API_ENABLE_AUTH": "true",
+        "MEMORY_API_JWT_SECRET": "test-secret-key",
+        "MEMORY_API_KEY": TEST_ADMIN_API_KEY,
+        "MEMORY_API_ADMIN_RATE_LIMIT": "1",
+    })
+    headers = {"X-API-Key": TEST_ADMIN_API_KEY}
+
+    resp = client.post("/api/v1/memory/monitoring/stop", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["X-RateLimit-Limit"] == "1"
+
+    resp = client.post("/api/v1/memory/monitoring/stop", headers=headers)
+    assert resp.status_code == 429
+    assert resp.json() == {"detail": "Rate limit exceeded"}
+    assert resp.headers["X-RateLimit-Remaining"] == "0"
+    assert "Retry-After" in resp.headers
@@ -137,9 +137,25 @@ def test_api_key_authentication(auth_module, mock_api_key):
     # Test invalid key
     assert verify_api_key("invalid-key") is False, "Invalid API key should fail"
 
+    # Non-string and non-ASCII inputs are rejected without raising
+    assert verify_api_key(None) is False, "Missing API key should fail"
+    assert verify_api_key("ключ") is False, "Non-ASCII mismatch should fail"
+
     print("✓ API key authentication test passed")
 
 
+def test_api_key_authentication_non_ascii():
+    """Non-ASCII API keys are compared as UTF-8 bytes."""
+    from api.auth import AuthConfig, verify_api_key
+
+    config = AuthConfig({"MEMORY_API_KEY": "clé-secrète"})
+    assert verify_api_key("clé-secrète", config=config) is True
+    assert verify_api_key("cle-secrete", config=config) is False
+    # The configured key is hashed once and reused for every comparison
+    assert len(config.api_key_digest) == 32
+    assert config.api_key_digest is config.api_key_digest
+
+
 def test_rate_limiting(auth_module):
     """Test rate limiting functionality."""
     print("Testing rate limiting...")
@@ -1,9 +1,18 @@
 """Tests for the rate limit decorator functionality."""
 
+import time
+
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import FastAPI, Request
 from api.rate_limit import (
+    RateLimiter,
+    RateLimitResult,
+    _BucketPool,
+    _consume_slot,
+    _remaining_str,
+    get_client_ip,
     rate_limit,
     shutdown_rate_limiter,
     get_rate_limiter,
@@ -73,6 +82,10 @@ def test_sync_function_decorator(test_client_sync, reset_rate_limiter):
     # The request after the limit should be rate-limited
     response = test_client_sync.get("/sync-endpoint")
     assert response.status_code == 429, "Rate limiting for sync function"
+    assert response.headers["X-RateLimit-Limit"] == str(read_limit)
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+    retry_after = int(response.headers["Retry-After"])
+    assert int(response.headers["X-RateLimit-Reset"]) >= int(time.time()) + retry_after - 1
 
 
 def test_async_function_decorator(test_client_async):
@@ -114,3 +127,160 @@ def test_shutdown_rate_limiter(reset_rate_limiter):
     assert final_limiter is not None, (
         "Rate limiter should work after multiple shutdowns"
     )
+
+
+def test_bucket_pool_evicts_idle_buckets_lazily(monkeypatch):
+    """Idle buckets are reclaimed when a new bucket is inserted."""
+    pool = _BucketPool(max_buckets=8)
+    pool.consume("a", 5, 1.0, 1.0)
+    pool.consume("b", 5, 1.0, 1.0)
+    assert list(pool.slots) == ["a", "b"]
+
+    later = time.monotonic() + _BucketPool.IDLE_EXPIRY_SECONDS + 1
+    monkeypatch.setattr("api.rate_limit.time.monotonic", lambda: later)
+    pool.consume("c", 5, 1.0, 1.0)
+    assert list(pool.slots) == ["c"]
+
+    # A returning client starts with a full bucket
+    available, wait = pool.state("a", 5, 1.0)
+    assert available == pytest.approx(5.0)
+    assert wait == 0.0
+
+
+def test_bucket_pool_is_bounded_lru():
+    """A full pool evicts its least recently used bucket."""
+    pool = _BucketPool(max_buckets=2)
+    pool.consume("a", 1, 0.5, 1.0)
+    pool.consume("b", 1, 0.5, 1.0)
+    pool.consume("a", 1, 0.5, 1.0)  # "a" becomes most recently used
+    pool.consume("c", 1, 0.5, 1.0)
+    assert list(pool.slots) == ["a", "c"]
+    assert len(pool._tokens) == 2
+
+    # "b" was evicted, so it starts over with a full bucket
+    allowed, _, _ = pool.consume("b", 1, 0.5, 1.0)
+    assert allowed is True
+    assert list(pool.slots) == ["c", "b"]
+
+
+def test_rate_limiter_grows_beyond_initial_capacity():
+    """Shard pools grow when every slot is in use."""
+    limiter = RateLimiter()
+    clients = RateLimiter.SHARD_COUNT * _BucketPool.INITIAL_CAPACITY * 2
+    for i in range(clients):
+        allowed, _ = limiter.is_allowed(f"client-{i}", 1, 0.5)
+        assert allowed is True
+    assert limiter.bucket_count() == clients
+
+    allowed, retry_after = limiter.is_allowed("client-0", 1, 0.5)
+    assert allowed is False
+    assert retry_after == pytest.approx(2.0, abs=0.1)
+
+
+def test_rate_limiter_shards_share_the_exact_bucket_cap():
+    """Shard capacities add up to max_buckets, remainder included."""
+    limiter = RateLimiter(max_buckets=RateLimiter.SHARD_COUNT * 3 + 5)
+    capacities = [shard.max_buckets for shard in limiter._shards]
+    assert sum(capacities) == RateLimiter.SHARD_COUNT * 3 + 5
+    assert set(capacities) == {3, 4}
+
+    with pytest.raises(ValueError, match="max_buckets"):
+        RateLimiter(max_buckets=RateLimiter.SHARD_COUNT - 1)
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [_consume_slot, getattr(_consume_slot, "py_func", _consume_slot)],
+    ids=["dispatched", "python"],
+)
+def test_consume_slot_kernel(kernel):
+    """The bucket kernel refills, caps and consumes in place."""
+    tokens = np.array([0.5, 3.0])
+    last_refill = np.array([100.0, 100.0])
+
+    # Half a second at 1 token/s refills slot 0 to exactly one token
+    allowed, retry_after = kernel(tokens, last_refill, 0, 100.5, 5.0, 1.0, 1.0)
+    assert allowed
+    assert retry_after == 0.0
+    assert tokens[0] == pytest.approx(0.0)
+    assert last_refill[0] == 100.5
+
+    allowed, retry_after = kernel(tokens, last_refill, 0, 100.5, 5.0, 1.0, 1.0)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+    # Refill is capped at the bucket capacity
+    kernel(tokens, last_refill, 1, 1000.0, 5.0, 1.0, 0.0)
+    assert tokens[1] == pytest.approx(5.0)
+
+
+def test_rate_limiter_is_consistent_under_concurrency():
+    """Concurrent consumers never overdraw a shared bucket."""
+    import threading
+
+    limiter = RateLimiter()
+    results = []
+    results_lock = threading.Lock()
+
+    def worker():
+        local = [limiter.is_allowed("shared", 200, 1e-9)[0] for _ in range(100)]
+        with results_lock:
+            results.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(results) == 200
+
+
+def test_get_client_ip_is_cached_on_request_state():
+    """The client address is resolved once per request."""
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/test",
+            "headers": [],
+            "client": ("203.0.113.7", 8000),
+        }
+    )
+    assert get_client_ip(request) == "203.0.113.7"
+    assert request.state._client_ip == "203.0.113.7"
+
+    request.state._client_ip = "198.51.100.1"
+    assert get_client_ip(request) == "198.51.100.1"
+
+
+def test_rate_limiter_acquire_reports_remaining_tokens():
+    """acquire() returns the bucket level left after consuming."""
+    limiter = RateLimiter()
+    allowed, retry_after, remaining = limiter.acquire("10.0.0.9", 5, 1e-9)
+    assert allowed is True
+    assert retry_after == 0.0
+    assert remaining == pytest.approx(4.0)
+
+
+def test_rate_limit_result_apply():
+    """Results write headers unless rate limiting was disabled."""
+    from fastapi import Response
+
+    response = Response()
+    RateLimitResult(limit="60", remaining="59", reset=1700000000).apply(response)
+    assert response.headers["X-RateLimit-Limit"] == "60"
+    assert response.headers["X-RateLimit-Remaining"] == "59"
+    assert response.headers["X-RateLimit-Reset"] == "1700000000"
+
+    response = Response()
+    RateLimitResult().apply(response)
+    assert "X-RateLimit-Limit" not in response.headers
+
+
+def test_remaining_header_strings_cover_bucket_levels():
+    """Remaining-token header values come from the prebuilt table."""
+    limit = RATE_LIMITS["read"]
+    assert _remaining_str("read", limit) == str(limit)
+    assert _remaining_str("read", limit - 0.5) == str(limit - 1)
+    assert _remaining_str("read", 0.2) == "0"
@@ -0,0 +1,27 @@
+"""Tests for static asset caching headers."""
+
+from fastapi.testclient import TestClient
+
+from app import create_app
+
+ASSET = "/static/philosophy_interface.css"
+
+
+def test_static_assets_are_revalidated():
+    client = TestClient(create_app())
+
+    response = client.get(ASSET)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, no-cache"
+
+    # Revalidation still works and keeps the caching policy
+    revalidated = client.get(ASSET, headers={"if-none-match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["cache-control"] == response.headers["cache-control"]
+
+
+def test_static_cache_control_is_configurable():
+    policy = "public, max-age=31536000, immutable"
+    client = TestClient(create_app({"STATIC_CACHE_CONTROL": policy}))
+
+    assert client.get(ASSET).headers["cache-control"] == policy